@@ -7,6 +7,22 @@
 #               but it cannot castle and there is no check or checkmate. Also, pawns cannot use en passant or pawn
 #               promotion, however they can still move two places forward on their first move and still capture
 #               diagonally.
+#
+#               The board can be stored three ways, chosen when the game is created: ChessVar() keeps a list of lists of
+#               ChessPiece objects, ChessVar(backend="bitboard") keeps one 64-bit int per piece type and color, and
+#               ChessVar(backend="compact") keeps a 64 byte board to use as little memory as possible per game.
+#
+#               Positions can be saved and loaded as text with to_fen() and ChessVar.from_fen(), using a FEN-like
+#               notation described in parse_fen.
+
+import array
+
+from bitboard import (NAME_COLOR, PIECE_NAMES, SQUARE_NAMES, SQUARE_INDEX, SQUARE_INDICES, KING_MOVES, KNIGHT_MOVES,
+                      ROOK_LINES, BISHOP_LINES, BETWEEN, PAWN_CAPTURES, PAWN_STEPS, PAWN_DOUBLE_STEPS, PAWN_FRONT,
+                      generate_moves, piece_targets, squares_of)
+from zobrist import PIECE_KEYS, UNMOVED_KEYS, BLACK_TO_MOVE_KEY, position_hash
+from attacks import AttackMap
+
 
 class ChessVar:
     """
@@ -24,32 +40,131 @@ class ChessVar:
     _turn:       represents which players turn it is
     _board:      represents the chess board. It is a list of 8 lists. Each list represents a row of the chess board and
                  each lists index represents a square on that row.
+    _undo_stack: one entry per move made with push_move, holding what pop_move needs to take that move back
+    _hash:       the 64-bit Zobrist hash of the position (see zobrist.py), updated a move at a time
+    _owned_rows: bit n is set if row n of _board belongs to this game alone. Rows are shared with games made by fork()
+                 until one of them writes to the row, which copies it first (see _writable_row). ChessPiece objects
+                 are never changed once they are on a board, so they can always be shared.
+    _attack_map: the AttackMap of the position (see attacks.py), or None. It is only built the first time one of the
+                 attack queries is used, and from then on updated by every move, so games that never ask pay nothing.
+
+    ChessVar(backend="bitboard") returns a BitboardChessVar instead, which behaves exactly the same but stores the board
+    as bitboards, and ChessVar(backend="compact") returns a CompactChessVar, which stores it in a bytearray. ChessVar()
+    and ChessVar(backend="list") use the list of lists board.
+
+    The games of every backend use __slots__, so none of them carries an attribute dictionary.
     """
-    def __init__(self):
+    __slots__ = ('_piece_dict', '_game_state', '_turn', '_undo_stack', '_board', '_owned_rows', '_attack_map', '_hash')
+
+    def __new__(cls, backend="list"):
+        if cls is ChessVar:
+            if backend not in BACKENDS:
+                raise ValueError(f'unknown backend {backend!r}, expected one of {sorted(BACKENDS)}')
+            cls = BACKENDS[backend]
+        return super().__new__(cls)
+
+    def __init__(self, backend="list"):
         self._piece_dict = {'K': 1, 'Q': 1, 'R': 2, 'B': 2, 'N': 2, 'P': 8, 'k': 1, 'q': 1, 'r': 2, 'b': 2, 'n': 2,
                             'p': 8}
         self._game_state = "UNFINISHED"
         self._turn = "WHITE"
-        self._board = [
-
-            [Rook("BLACK"), Knight("BLACK"), Bishop("BLACK"), Queen("BLACK"), King("BLACK"), Bishop("BLACK"),
-             Knight("BLACK"), Rook("BLACK")],
+        self._undo_stack = []
+        self._board = [[None if name is None else piece_for(name) for name in START_SQUARES[row * 8:row * 8 + 8]]
+                       for row in range(8)]
+        self._owned_rows = 0xFF
+        self._attack_map = None
+        self._hash = position_hash(*self._hash_inputs())
+
+    @classmethod
+    def from_fen(cls, fen, backend="list"):
+        """
+        Creates a game directly in the position described by fen, without replaying any moves.
+        EX: ChessVar.from_fen("RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w abcdefghABCDEFGH -") is a new game.
 
-            [Pawn("BLACK"), Pawn("BLACK"), Pawn("BLACK"), Pawn("BLACK"), Pawn("BLACK"), Pawn("BLACK"), Pawn("BLACK"),
-             Pawn("BLACK")],
+        :parameter fen: the position in the notation described in parse_fen
+        :parameter backend: the board backend to use, like ChessVar()
+        :return: the new ChessVar
+        """
+        return cls._from_position(*parse_fen(fen), backend=backend)
 
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
+    @classmethod
+    def _from_position(cls, squares, turn, unmoved, game_state, backend="list"):
+        """
+        Creates a game in the given position without going through __init__.
+
+        :parameter squares: a list of 64 piece names or None, in board order (a8 first)
+        :parameter turn: whose turn it is, "WHITE" or "BLACK"
+        :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+        :parameter game_state: "UNFINISHED", "WHITE_WON" or "BLACK_WON"
+        :parameter backend: the board backend to use
+        :return: the new ChessVar
+        """
+        game = cls.__new__(cls, backend)
+        game._set_position(list(squares), turn, unmoved, game_state)
+        return game
 
-            [Pawn("WHITE"), Pawn("WHITE"), Pawn("WHITE"), Pawn("WHITE"), Pawn("WHITE"), Pawn("WHITE"), Pawn("WHITE"),
-             Pawn("WHITE")],
+    def _set_position(self, squares, turn, unmoved, game_state):
+        """
+        Replaces the whole game state with the given position, see _from_position for the parameters. The piece
+        dictionary is counted from the board and the undo stack is emptied.
+        """
+        self._piece_dict = {name: 0 for name in 'KQRBNPkqrbnp'}
+        self._game_state = game_state
+        self._turn = turn
+        self._undo_stack = []
+        self._board = []
+        for row in range(8):
+            board_row = []
+            for column in range(8):
+                name = squares[row * 8 + column]
+                piece = None
+                if name is not None:
+                    piece = piece_for(name, name in 'Pp' and not unmoved >> (row * 8 + column) & 1)
+                    self._piece_dict[name] += 1
+                board_row.append(piece)
+            self._board.append(board_row)
+        self._owned_rows = 0xFF
+        self._attack_map = None
+        self._hash = position_hash(*self._hash_inputs())
+
+    def to_fen(self):
+        """
+        :return: the current position in the notation described in parse_fen
+        """
+        squares, occupied, unmoved = self.get_position()
+        return format_fen(squares, self._turn, unmoved, self._game_state)
 
-            [Rook("WHITE"), Knight("WHITE"), Bishop("WHITE"), Queen("WHITE"), King("WHITE"), Bishop("WHITE"),
-             Knight("WHITE"), Rook("WHITE")]
+    def fork(self):
+        """
+        Makes an independent copy of the game for trying out moves, much faster than copy.deepcopy. The board rows
+        and pieces are shared with this game until either game moves a piece in that row, so a fork costs about the
+        same no matter how the game has gone. The undo stack is copied too, so pop_move can take back moves made
+        before the fork. Lists returned by get_board() before the fork must not be changed afterwards.
+        EX: branch = game.fork(), then branch.make_move('a2', 'a4') leaves game as it was.
 
-        ]
+        :return: the new ChessVar, of the same backend
+        """
+        game = self.__class__.__new__(self.__class__)
+        game._piece_dict = dict(self._piece_dict)
+        game._game_state = self._game_state
+        game._turn = self._turn
+        game._undo_stack = list(self._undo_stack)
+        game._hash = self._hash
+        game._board = list(self._board)
+        game._owned_rows = 0
+        game._attack_map = None
+        self._owned_rows = 0
+        return game
+
+    def _writable_row(self, row):
+        """
+        :parameter row: the number of a row of _board
+        :return: that row as a list only this game uses, copying it first if it is shared with a fork
+        """
+        if not self._owned_rows >> row & 1:
+            self._board[row] = list(self._board[row])
+            self._owned_rows |= 1 << row
+        return self._board[row]
 
     def get_game_state(self):
         """
@@ -65,6 +180,11 @@ class ChessVar:
 
     def get_piece_dict(self):
         """
+        The list of lists and bitboard backends return the dictionary the game itself keeps up to date, so it changes
+        as moves are made and must not be changed by the caller. The compact backend has no such dictionary and builds
+        a new one on each call, which doesn't follow later moves. Use dict(game.get_piece_dict()) to keep the counts
+        of a position the same way on every backend.
+
         :return: the piece_dict dictionary
         """
         return self._piece_dict
@@ -75,6 +195,146 @@ class ChessVar:
         """
         return self._board
 
+    def get_piece_name(self, square):
+        """
+        :parameter square: the square to look at in algebraic notation as a string
+        :return: the name of the piece on the square (EX: 'N' or 'p'), or None if the square is empty
+        """
+        indices = algebra_indices(square)
+        piece = self._board[indices[0]][indices[1]]
+        return None if piece is None else piece.get_name()
+
+    def get_hash(self):
+        """
+        Two positions with the same pieces on the same squares, the same pawns still able to move two squares and the
+        same player to move always have the same hash.
+
+        :return: the 64-bit Zobrist hash of the current position
+        """
+        return self._hash
+
+    def legal_moves(self):
+        """
+        Lists every move make_move would currently accept, found with the precomputed tables in bitboard.py instead of
+        trying every pair of squares.
+
+        :return: a list of (start, end) tuples in algebraic notation, EX: [('a2', 'a3'), ('a2', 'a4'), ...]. The list is
+                 empty once the game is finished.
+        """
+        return [(SQUARE_NAMES[start], SQUARE_NAMES[end]) for start, end in self._legal_moves(None)]
+
+    def legal_moves_from(self, square):
+        """
+        Lists every move make_move would currently accept for the piece on the given square.
+
+        :parameter square: the square of the piece to move in algebraic notation as a string
+        :return: a list of (start, end) tuples in algebraic notation. Empty if the square is empty, holds the opponents
+                 piece, or the game is finished.
+        """
+        return [(SQUARE_NAMES[start], SQUARE_NAMES[end]) for start, end in self._legal_moves(square_index(square))]
+
+    def legal_moves_idx(self):
+        """
+        Same as legal_moves, but with the squares as indices from 0 to 63 (see square_index), for use with
+        make_move_idx and push_move_idx.
+
+        :return: a list of (start, end) tuples of square indices
+        """
+        return self._legal_moves(None)
+
+    def _legal_moves(self, only_from):
+        """
+        :parameter only_from: a square index to limit the moves to, or None for every move
+        :return: the legal moves as a list of (start, end) tuples of square indices
+        """
+        if self._game_state != "UNFINISHED":
+            return []
+        squares, occupied, unmoved = self.get_position()
+        other = "BLACK" if self._turn == "WHITE" else "WHITE"
+        return generate_moves(squares, occupied[self._turn], occupied[other], unmoved, only_from)
+
+    def _attacks(self):
+        """
+        :return: the AttackMap of the position, built now if no attack query has been made yet
+        """
+        if self._attack_map is None:
+            self._attack_map = AttackMap(self.get_position()[0])
+        return self._attack_map
+
+    def attackers_of(self, square, color=None):
+        """
+        Lists the pieces that could capture a piece standing on a square, following the same movement rules as
+        make_move. Pieces defending their own side are included when color is given as that side.
+
+        :parameter square: the square in algebraic notation as a string
+        :parameter color: the color of the attacking pieces, "WHITE" or "BLACK". Defaults to the opponent of the piece
+                          on the square, or the opponent of the player to move if the square is empty.
+        :return: a list of the squares of the attacking pieces in algebraic notation
+        """
+        index = square_index(square)
+        attacks = self._attacks()
+        if color is None:
+            name = attacks.squares[index]
+            owner = self._turn if name is None else NAME_COLOR[name]
+            color = "BLACK" if owner == "WHITE" else "WHITE"
+        return [SQUARE_NAMES[attacker] for attacker in squares_of(attacks.attackers_of(index, color))]
+
+    def attacked_squares(self, color):
+        """
+        :parameter color: "WHITE" or "BLACK"
+        :return: a list of every square, in algebraic notation, that a piece of that color could capture on
+        """
+        return [SQUARE_NAMES[square] for square in squares_of(self._attacks().attacked[color])]
+
+    def attacked_pieces(self, color):
+        """
+        :parameter color: "WHITE" or "BLACK"
+        :return: a list of the squares, in algebraic notation, of that colors pieces the other color could capture
+        """
+        return [SQUARE_NAMES[square] for square in squares_of(self._attacks().attacked_pieces(color))]
+
+    def extinction_threats(self, color):
+        """
+        Finds the piece types one capture away from running out, which would lose the game.
+
+        :parameter color: the color whose pieces are threatened, "WHITE" or "BLACK"
+        :return: a list of (piece name, square in algebraic notation) for each of that colors piece types with a
+                 single piece left that the other color can capture, EX: [('q', 'd1')]
+        """
+        threats = self._attacks().extinction_threats(color, self.get_piece_dict())
+        return [(name, SQUARE_NAMES[square]) for name, square in threats]
+
+    def get_position(self):
+        """
+        Converts the board into the form the tables in bitboard.py work with. Every backend returns the same form, but
+        may hand back its own list and dictionary rather than copies, so callers must not change them.
+
+        :return: (list of 64 piece names or None, dictionary of each colors occupied bitboard, bitboard of the squares
+                 holding pawns that haven't moved)
+        """
+        squares = []
+        occupied = {"WHITE": 0, "BLACK": 0}
+        unmoved = 0
+        for row in self._board:
+            for piece in row:
+                if piece is None:
+                    squares.append(None)
+                    continue
+                bit = 1 << len(squares)
+                name = piece.get_name()
+                squares.append(name)
+                occupied[piece.get_color()] |= bit
+                if name in 'Pp' and not piece.get_has_moved():
+                    unmoved |= bit
+        return squares, occupied, unmoved
+
+    def _hash_inputs(self):
+        """
+        :return: the (squares, turn, unmoved) arguments zobrist.position_hash needs to hash the current position
+        """
+        squares, occupied, unmoved = self.get_position()
+        return squares, self._turn, unmoved
+
     def del_piece(self, square):
         """
         Deletes a piece from the chess boards dictionary of pieces left on the board.
@@ -88,28 +348,43 @@ class ChessVar:
         piece_name = self._board[indices[0]][indices[1]].get_name()
         self._piece_dict[piece_name] = self._piece_dict[piece_name] - 1
 
-    def make_move(self, start, end):
+    def is_legal(self, start, end):
         """
-        First checks if a player has won the game. Then checks if there is a piece in the starting square. Then checks
-        if the starting and ending squares are the same. Then checks if the piece in the starting square is the
-        opponents color. Then checks if the move is illegal or if there are any obstructions. If any of these occur we
-        return False.
-
-        If we pass all of those tests, we then check the end square for a piece. If an opposing piece is occupying the
-        end square, that piece is captured. If a piece of the same color is occupying the end square, we return false.
-        When a piece is captured we decrement its count from the boards _piece_dict data member and replace it on the
-        board with the capturing piece. If doing so makes the specific pieces count 0, then the player whose turn it is
-        will have won and the boards _game_state will be changed to reflect that.
+        Checks if make_move would accept a move, without changing the game at all. Safe to call as often as needed,
+        EX: to show hints while the player hovers over a square.
 
         :parameter start: the square containing the piece we want to move in algebraic notation as a string
         :parameter end: the square we want to move the piece to in algebraic notation as a string
+        :return: True if the move is legal, False if not
+        """
+        if self._game_state != "UNFINISHED":
+            return False
+        return self.is_legal_idx(square_index(start), square_index(end))
+
+    def are_legal(self, moves):
+        """
+        Checks a batch of moves with is_legal, without changing the game.
+
+        :parameter moves: an iterable of (start, end) tuples in algebraic notation
+        :return: a list with True or False for each move, in the same order
+        """
+        is_legal = self.is_legal
+        return [is_legal(start, end) for start, end in moves]
+
+    def is_legal_idx(self, start_square, end_square):
+        """
+        Runs every check make_move does before moving anything. Nothing is changed, whatever the result.
+
+        :parameter start_square: the index from 0 to 63 of the square containing the piece we want to move
+        :parameter end_square: the index from 0 to 63 of the square we want to move the piece to
+        :return: True if the move is legal, False if not
         """
         # check game state
         if self._game_state != "UNFINISHED":
             return False
 
-        indices_end = algebra_indices(end)
-        indices_start = algebra_indices(start)
+        indices_start = SQUARE_INDICES[start_square]
+        indices_end = SQUARE_INDICES[end_square]
 
         # check if there is a piece in the start square
         start_piece = self._board[indices_start[0]][indices_start[1]]
@@ -117,7 +392,7 @@ class ChessVar:
             return False
 
         # checks if the starting square and ending square are the same
-        if start == end:
+        if start_square == end_square:
             return False
 
         # check if the piece is the right color
@@ -129,20 +404,88 @@ class ChessVar:
         if not start_piece.is_move_legal(list(self._board), indices_start, indices_end):
             return False
 
-        # check final location for a piece.
+        # check final location for a piece of the players own color
         end_piece = self._board[indices_end[0]][indices_end[1]]
-        if end_piece is None:  # if no piece, skip
-            pass
-        else:
-            if end_piece.get_color() == self._turn:  # if end square has a piece of the players own color
-                return False
-            else:  # if end square is opponents color, capture it
-                piece_name = end_piece.get_name()
-                self._piece_dict[piece_name] -= 1
+        if end_piece is not None and end_piece.get_color() == self._turn:
+            return False
+
+        return True
+
+    def make_move(self, start, end):
+        """
+        First checks if a player has won the game. Then checks if there is a piece in the starting square. Then checks
+        if the starting and ending squares are the same. Then checks if the piece in the starting square is the
+        opponents color. Then checks if the move is illegal or if there are any obstructions. If any of these occur we
+        return False.
+
+        If we pass all of those tests, we then check the end square for a piece. If an opposing piece is occupying the
+        end square, that piece is captured. If a piece of the same color is occupying the end square, we return false.
+        When a piece is captured we decrement its count from the boards _piece_dict data member and replace it on the
+        board with the capturing piece. If doing so makes the specific pieces count 0, then the player whose turn it is
+        will have won and the boards _game_state will be changed to reflect that.
+
+        Nothing is changed unless the move is made. The work is done by make_move_idx once the squares are converted.
+
+        :parameter start: the square containing the piece we want to move in algebraic notation as a string
+        :parameter end: the square we want to move the piece to in algebraic notation as a string
+        """
+        # check game state
+        if self._game_state != "UNFINISHED":
+            return False
+        return self.make_move_idx(square_index(start), square_index(end))
+
+    def make_move_idx(self, start_square, end_square):
+        """
+        Same as make_move, but with the squares given as indices from 0 to 63 (row * 8 + column, see square_index), so
+        no strings have to be read.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal
+        """
+        if not self.is_legal_idx(start_square, end_square):
+            return False
+        self._play_idx(start_square, end_square)
+
+        # check if anyone won
+        self._check_winner()
+
+        return True
+
+    def _play_idx(self, start_square, end_square):
+        """
+        Moves the piece and updates the counts, hash and turn, without checking that the move is legal or whether
+        anyone won. Used by make_move_idx once the move is checked, and by apply_moves for trusted moves.
+
+        :parameter start_square: the index of the square containing the piece to move
+        :parameter end_square: the index of the square to move it to
+        """
+        indices_start = SQUARE_INDICES[start_square]
+        indices_end = SQUARE_INDICES[end_square]
+        start_piece = self._board[indices_start[0]][indices_start[1]]
+        start_name = start_piece.get_name()
+
+        # a pawn can only move two squares on its first move, so it is marked as moved now that the move is accepted.
+        # The pawn is shared with every other game, so it is replaced by the shared moved pawn instead of being changed.
+        if start_name in 'Pp' and not start_piece.get_has_moved():
+            start_piece = piece_for(start_name, True)
+            self._hash ^= UNMOVED_KEYS[start_square]
+
+        # if end square is opponents color, capture it
+        end_piece = self._board[indices_end[0]][indices_end[1]]
+        if end_piece is not None:
+            piece_name = end_piece.get_name()
+            self._piece_dict[piece_name] -= 1
+            self._hash ^= PIECE_KEYS[piece_name][end_square]
+            if piece_name in 'Pp' and not end_piece.get_has_moved():
+                self._hash ^= UNMOVED_KEYS[end_square]
 
         # move piece
-        self._board[indices_end[0]][indices_end[1]] = start_piece
-        self._board[indices_start[0]][indices_start[1]] = None
+        self._writable_row(indices_end[0])[indices_end[1]] = start_piece
+        self._writable_row(indices_start[0])[indices_start[1]] = None
+        self._hash ^= PIECE_KEYS[start_name][start_square] ^ PIECE_KEYS[start_name][end_square] ^ BLACK_TO_MOVE_KEY
+        if self._attack_map is not None:
+            self._attack_map.move(start_square, end_square)
 
         # change whose turn it is
         if self._turn == "WHITE":
@@ -150,7 +493,41 @@ class ChessVar:
         else:
             self._turn = "WHITE"
 
-        # check if anyone won
+    def apply_moves(self, moves, validate=True):
+        """
+        Makes a whole sequence of moves in one call, stopping at the first illegal one. Faster than calling make_move
+        for each move when replaying long games.
+        EX: game.apply_moves([(52, 36), (12, 28)]) plays e2e4 and then e7e5.
+
+        With validate=False the moves are trusted to be a legal game from this position, like the moves of a recorded
+        game: nothing is checked, and the counts are only looked at for a winner after the last move. Counts only go
+        down, so the winner found then is the one the checked replay finds. Illegal moves leave the game in a state no
+        legal game can reach.
+
+        :parameter moves: an iterable of (start, end) tuples of square indices from 0 to 63
+        :parameter validate: False to skip checking each move
+        :return: None if every move was made, otherwise the position in moves of the first illegal move. The moves
+                 before it stay made.
+        """
+        if not validate:
+            if self._game_state != "UNFINISHED":
+                return 0
+            play_idx = self._play_idx
+            for start_square, end_square in moves:
+                play_idx(start_square, end_square)
+            self._check_winner()
+            return None
+        make_move_idx = self.make_move_idx
+        for number, (start_square, end_square) in enumerate(moves):
+            if not make_move_idx(start_square, end_square):
+                return number
+        return None
+
+    def _check_winner(self):
+        """
+        Sets _game_state if a piece type has run out. Only called by make_move_idx and apply_moves, after moves are
+        made.
+        """
         black_pieces = ['K', 'Q', 'R', 'B', 'N', 'P']
         white_pieces = ['k', 'q', 'r', 'b', 'n', 'p']
         for piece in black_pieces:
@@ -160,8 +537,61 @@ class ChessVar:
             if self._piece_dict[piece] == 0:
                 self._game_state = "BLACK_WON"
 
+    def push_move(self, start, end):
+        """
+        Makes the move exactly like make_move does, but also remembers it on the undo stack so pop_move can take it
+        back. Moves made with make_move are not remembered, so they shouldn't be mixed with push_move and pop_move.
+
+        :parameter start: the square containing the piece we want to move in algebraic notation as a string
+        :parameter end: the square we want to move the piece to in algebraic notation as a string
+        :return: True if the move was made, False if make_move rejected it (nothing is added to the undo stack)
+        """
+        return self.push_move_idx(square_index(start), square_index(end))
+
+    def push_move_idx(self, start_square, end_square):
+        """
+        Same as push_move, but with the squares given as indices from 0 to 63 like make_move_idx.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal (nothing is added to the undo stack)
+        """
+        start_row, start_column = SQUARE_INDICES[start_square]
+        end_row, end_column = SQUARE_INDICES[end_square]
+        start_piece = self._board[start_row][start_column]
+        end_piece = self._board[end_row][end_column]
+        turn = self._turn
+        game_state = self._game_state
+        key = self._hash
+
+        if not self.make_move_idx(start_square, end_square):
+            return False
+
+        self._undo_stack.append((start_row, start_column, end_row, end_column, start_piece, end_piece, turn,
+                                 game_state, key))
         return True
 
+    def pop_move(self):
+        """
+        Takes back the last move made with push_move, putting back the moved piece as it was, the captured piece, the
+        turn, the game state and the _piece_dict count. Raises IndexError if there is nothing to undo.
+
+        :return: the (start, end) squares of the move that was taken back, in algebraic notation
+        """
+        (start_row, start_column, end_row, end_column, start_piece, end_piece, turn, game_state,
+         key) = self._undo_stack.pop()
+        self._writable_row(start_row)[start_column] = start_piece
+        self._writable_row(end_row)[end_column] = end_piece
+        if end_piece is not None:
+            self._piece_dict[end_piece.get_name()] += 1
+        if self._attack_map is not None:
+            self._attack_map.unmove(start_row * 8 + start_column, end_row * 8 + end_column,
+                                    None if end_piece is None else end_piece.get_name())
+        self._turn = turn
+        self._game_state = game_state
+        self._hash = key
+        return SQUARE_NAMES[start_row * 8 + start_column], SQUARE_NAMES[end_row * 8 + end_column]
+
     def show_board(self):
         """
         Prints out the current state of the board
@@ -192,6 +622,610 @@ class ChessVar:
         print('      a   b   c   d   e   f   g   h')
 
 
+class BitboardChessVar(ChessVar):
+    """
+    A ChessVar that stores the board as bitboards instead of a list of lists of ChessPiece objects. Created with
+    ChessVar(backend="bitboard"). Every public method behaves exactly the same as it does for the list of lists board.
+
+    Squares are numbered 0 to 63 going left to right and top to bottom, so a8 is 0 and h1 is 63 (see bitboard.py).
+
+    _squares:    a list of 64 piece names (or None), used to look up which piece is on a square
+    _occupied:   one bitboard per color holding every square that color occupies
+    _unmoved:    a bitboard of the squares holding pawns that haven't moved yet
+    """
+    __slots__ = ('_squares', '_occupied', '_unmoved')
+
+    def __init__(self, backend="bitboard"):
+        self._set_position(list(START_SQUARES), "WHITE", STARTING_UNMOVED, "UNFINISHED")
+
+    def _set_position(self, squares, turn, unmoved, game_state):
+        """
+        Replaces the whole game state with the given position, see ChessVar._from_position for the parameters.
+        """
+        self._piece_dict = {name: 0 for name in 'KQRBNPkqrbnp'}
+        self._game_state = game_state
+        self._turn = turn
+        self._undo_stack = []
+        self._squares = squares
+        self._occupied = {"WHITE": 0, "BLACK": 0}
+        pawns = 0
+        for square, name in enumerate(squares):
+            if name is not None:
+                self._occupied[NAME_COLOR[name]] |= 1 << square
+                self._piece_dict[name] += 1
+                if name in 'Pp':
+                    pawns |= 1 << square
+        self._unmoved = unmoved & pawns
+        self._attack_map = None
+        self._hash = position_hash(*self._hash_inputs())
+
+    def fork(self):
+        """
+        Same as ChessVar.fork. Everything here is ints, strings and small containers of them, so copying the
+        containers is already cheaper than keeping track of what is shared.
+
+        :return: the new BitboardChessVar
+        """
+        game = self.__class__.__new__(self.__class__)
+        game._piece_dict = dict(self._piece_dict)
+        game._game_state = self._game_state
+        game._turn = self._turn
+        game._undo_stack = list(self._undo_stack)
+        game._hash = self._hash
+        game._squares = list(self._squares)
+        game._occupied = dict(self._occupied)
+        game._unmoved = self._unmoved
+        game._attack_map = None
+        return game
+
+    def get_board(self):
+        """
+        Builds the board the same way the list of lists backend stores it.
+
+        :return: a list of 8 lists holding a ChessPiece object or None for each square
+        """
+        board = []
+        for row in range(8):
+            board_row = []
+            for column in range(8):
+                name = self._squares[row * 8 + column]
+                if name is None:
+                    board_row.append(None)
+                    continue
+                board_row.append(piece_for(name, name in 'Pp' and not self._unmoved >> (row * 8 + column) & 1))
+            board.append(board_row)
+        return board
+
+    def get_piece_name(self, square):
+        """
+        :parameter square: the square to look at in algebraic notation as a string
+        :return: the name of the piece on the square (EX: 'N' or 'p'), or None if the square is empty
+        """
+        return self._squares[square_index(square)]
+
+    def get_position(self):
+        """
+        See ChessVar.get_position, the list and dictionary returned are the ones this game keeps up to date.
+
+        :return: (list of 64 piece names or None, dictionary of each colors occupied bitboard, bitboard of the squares
+                 holding pawns that haven't moved)
+        """
+        return self._squares, self._occupied, self._unmoved
+
+    def del_piece(self, square):
+        """
+        Deletes a piece from the chess boards dictionary of pieces left on the board.
+        NOTE: does not remove a piece from the board.
+
+        :parameter square: must be satisfied by the square in algebraic notation to delete the chess piece from.
+        """
+        piece_name = self._squares[square_index(square)]
+        self._piece_dict[piece_name] = self._piece_dict[piece_name] - 1
+
+    def is_legal_idx(self, start_square, end_square):
+        """
+        Follows the same steps as ChessVar.is_legal_idx, but checks the movement rules with the precomputed tables in
+        bitboard.py instead of calling is_move_legal on a ChessPiece object.
+
+        :parameter start_square: the index from 0 to 63 of the square containing the piece we want to move
+        :parameter end_square: the index from 0 to 63 of the square we want to move the piece to
+        :return: True if the move is legal, False if not
+        """
+        # check game state
+        if self._game_state != "UNFINISHED":
+            return False
+
+        # check if there is a piece in the start square
+        name = self._squares[start_square]
+        if name is None:
+            return False
+
+        # checks if the starting square and ending square are the same
+        if start_square == end_square:
+            return False
+
+        # check if the piece is the right color
+        turn = self._turn
+        if NAME_COLOR[name] != turn:
+            return False
+
+        # check if move is legal (also checks for obstructions excluding end location)
+        end_bit = 1 << end_square
+        occupied = self._occupied["WHITE"] | self._occupied["BLACK"]
+        kind = name.upper()
+        if kind == 'P':
+            if PAWN_CAPTURES[turn][start_square] & end_bit:
+                if not occupied & end_bit:
+                    return False
+            elif PAWN_STEPS[turn][start_square] & end_bit:
+                if occupied & end_bit:
+                    return False
+            elif PAWN_DOUBLE_STEPS[turn][start_square] & end_bit:
+                if not self._unmoved >> start_square & 1:
+                    return False
+                if occupied & (end_bit | PAWN_FRONT[turn][start_square]):
+                    return False
+            else:
+                return False
+        elif kind == 'N':
+            if not KNIGHT_MOVES[start_square] & end_bit:
+                return False
+        elif kind == 'K':
+            if not KING_MOVES[start_square] & end_bit:
+                return False
+        else:
+            if kind == 'R':
+                lines = ROOK_LINES[start_square]
+            elif kind == 'B':
+                lines = BISHOP_LINES[start_square]
+            else:
+                lines = ROOK_LINES[start_square] | BISHOP_LINES[start_square]
+            if not lines & end_bit or BETWEEN[start_square * 64 + end_square] & occupied:
+                return False
+
+        # check final location for a piece of the players own color
+        if self._occupied[turn] & end_bit:
+            return False
+
+        return True
+
+    def make_move(self, start, end):
+        """
+        Same as ChessVar.make_move. Squares spelled the usual way are looked up directly, anything else goes through
+        square_index so it is accepted or rejected exactly like the list of lists board does.
+
+        :parameter start: the square containing the piece we want to move in algebraic notation as a string
+        :parameter end: the square we want to move the piece to in algebraic notation as a string
+        """
+        if self._game_state != "UNFINISHED":
+            return False
+        start_square = SQUARE_INDEX.get(start)
+        end_square = SQUARE_INDEX.get(end)
+        if start_square is None or end_square is None:
+            return self.make_move_idx(square_index(start), square_index(end))
+        return self.make_move_idx(start_square, end_square)
+
+    def make_move_idx(self, start_square, end_square):
+        """
+        Follows the same steps as ChessVar.make_move_idx, with the checks done by is_legal_idx.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal
+        """
+        if not self.is_legal_idx(start_square, end_square):
+            return False
+        self._play_idx(start_square, end_square)
+
+        # check if anyone won, which can only have happened once a count is 0
+        if 0 in self._piece_dict.values():
+            self._check_winner()
+
+        return True
+
+    def _play_idx(self, start_square, end_square):
+        """
+        Same as ChessVar._play_idx.
+
+        :parameter start_square: the index of the square containing the piece to move
+        :parameter end_square: the index of the square to move it to
+        """
+        name = self._squares[start_square]
+        turn = self._turn
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+
+        # if end square is opponents color, capture it
+        captured = self._squares[end_square]
+        if captured is not None:
+            other = "BLACK" if turn == "WHITE" else "WHITE"
+            self._occupied[other] ^= end_bit
+            self._piece_dict[captured] -= 1
+            self._hash ^= PIECE_KEYS[captured][end_square]
+
+        # move piece
+        self._occupied[turn] ^= start_bit | end_bit
+        self._hash ^= PIECE_KEYS[name][start_square] ^ PIECE_KEYS[name][end_square] ^ BLACK_TO_MOVE_KEY
+        if self._unmoved & (start_bit | end_bit):
+            if self._unmoved & start_bit:
+                self._hash ^= UNMOVED_KEYS[start_square]
+            if self._unmoved & end_bit:
+                self._hash ^= UNMOVED_KEYS[end_square]
+            self._unmoved &= ~(start_bit | end_bit)
+        self._squares[end_square] = name
+        self._squares[start_square] = None
+        if self._attack_map is not None:
+            self._attack_map.move(start_square, end_square)
+
+        # change whose turn it is
+        self._turn = "BLACK" if turn == "WHITE" else "WHITE"
+
+    def _check_winner(self):
+        """
+        Same as ChessVar._check_winner. del_piece can lower a count without a capture, so every count is checked like
+        the list board does. make_move_idx only calls it once one of them has reached 0.
+        """
+        for piece in 'KQRBNP':
+            if self._piece_dict[piece] == 0:
+                self._game_state = "WHITE_WON"
+        for piece in 'kqrbnp':
+            if self._piece_dict[piece] == 0:
+                self._game_state = "BLACK_WON"
+
+    def push_move_idx(self, start_square, end_square):
+        """
+        Same as ChessVar.push_move_idx, remembering what pop_move needs to take the move back.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal (nothing is added to the undo stack)
+        """
+        name = self._squares[start_square]
+        captured = self._squares[end_square]
+        unmoved = self._unmoved
+        turn = self._turn
+        game_state = self._game_state
+        key = self._hash
+
+        if not self.make_move_idx(start_square, end_square):
+            return False
+
+        self._undo_stack.append((start_square, end_square, name, captured, unmoved, turn, game_state, key))
+        return True
+
+    def pop_move(self):
+        """
+        Takes back the last move made with push_move. Raises IndexError if there is nothing to undo.
+
+        :return: the (start, end) squares of the move that was taken back, in algebraic notation
+        """
+        start_square, end_square, name, captured, unmoved, turn, game_state, key = self._undo_stack.pop()
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+        self._squares[start_square] = name
+        self._squares[end_square] = captured
+        self._occupied[turn] ^= start_bit | end_bit
+        if captured is not None:
+            self._occupied["BLACK" if turn == "WHITE" else "WHITE"] ^= end_bit
+            self._piece_dict[captured] += 1
+        if self._attack_map is not None:
+            self._attack_map.unmove(start_square, end_square, captured)
+        self._unmoved = unmoved
+        self._turn = turn
+        self._game_state = game_state
+        self._hash = key
+        return SQUARE_NAMES[start_square], SQUARE_NAMES[end_square]
+
+    def show_board(self):
+        """
+        Prints out the current state of the board
+
+        Capital letters are black pieces and lowercase letters are white pieces.
+        R = Rook, N = Knight, B = Bishop, Q = Queen, K = King, P = Pawn.
+        """
+        print('      a   b   c   d   e   f   g   h')
+        print('    _________________________________')
+
+        for row in range(8):
+            rank = 8 - row
+            cells = ''.join('|   ' if name is None else f'| {name} ' for name in self._squares[row * 8:row * 8 + 8])
+            print(f'{rank}   {cells}|   {rank}')
+
+        print('    ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾')
+        print('      a   b   c   d   e   f   g   h')
+
+
+class CompactChessVar(ChessVar):
+    """
+    A ChessVar that keeps the whole position in a 64 byte board and a few ints, for holding many games in memory at
+    once. Created with ChessVar(backend="compact"). Every public method behaves exactly the same as it does for the
+    other backends, except that get_piece_dict builds a new dictionary on each call instead of returning the one the
+    game uses, so changing it doesn't change the game (use del_piece for that).
+
+    Squares are numbered 0 to 63 like the bitboard backend, so a8 is 0 and h1 is 63.
+
+    _board:   a bytearray with the code of the piece on each square (see CODE_NAMES), 0 if it is empty
+    _counts:  a signed byte array of how many pieces of each code are left, with code 1 at index 0
+    _white:   a bitboard of every square white occupies
+    _black:   a bitboard of every square black occupies
+    _unmoved: a bitboard of the squares holding pawns that haven't moved yet
+    """
+    __slots__ = ('_counts', '_white', '_black', '_unmoved')
+
+    def __init__(self, backend="compact"):
+        self._set_position(list(START_SQUARES), "WHITE", STARTING_UNMOVED, "UNFINISHED")
+
+    def _set_position(self, squares, turn, unmoved, game_state):
+        """
+        Replaces the whole game state with the given position, see ChessVar._from_position for the parameters.
+        """
+        self._game_state = game_state
+        self._turn = turn
+        self._undo_stack = []
+        self._board = bytearray(NAME_CODES[name] for name in squares)
+        self._counts = array.array('b', bytes(12))
+        self._white = 0
+        self._black = 0
+        pawns = 0
+        for square, code in enumerate(self._board):
+            if not code:
+                continue
+            self._counts[code - 1] += 1
+            if code < FIRST_BLACK_CODE:
+                self._white |= 1 << square
+            else:
+                self._black |= 1 << square
+            if code in PAWN_CODES:
+                pawns |= 1 << square
+        self._unmoved = unmoved & pawns
+        self._attack_map = None
+        self._hash = position_hash(*self._hash_inputs())
+
+    def fork(self):
+        """
+        Same as ChessVar.fork.
+
+        :return: the new CompactChessVar
+        """
+        game = self.__class__.__new__(self.__class__)
+        game._game_state = self._game_state
+        game._turn = self._turn
+        game._undo_stack = list(self._undo_stack)
+        game._hash = self._hash
+        game._board = bytearray(self._board)
+        game._counts = array.array('b', self._counts)
+        game._white = self._white
+        game._black = self._black
+        game._unmoved = self._unmoved
+        game._attack_map = None
+        return game
+
+    def get_piece_dict(self):
+        """
+        See ChessVar.get_piece_dict, this backend builds a new dictionary on each call.
+
+        :return: a new dictionary of how many pieces of each name are left, like the piece_dict of the other backends
+        """
+        return {name: self._counts[NAME_CODES[name] - 1] for name in PIECE_NAMES}
+
+    def get_board(self):
+        """
+        Builds the board the same way the list of lists backend stores it.
+
+        :return: a list of 8 lists holding a ChessPiece object or None for each square
+        """
+        board = []
+        for row in range(8):
+            board_row = []
+            for column in range(8):
+                square = row * 8 + column
+                name = CODE_NAMES[self._board[square]]
+                if name is None:
+                    board_row.append(None)
+                    continue
+                board_row.append(piece_for(name, name in 'Pp' and not self._unmoved >> square & 1))
+            board.append(board_row)
+        return board
+
+    def get_piece_name(self, square):
+        """
+        :parameter square: the square to look at in algebraic notation as a string
+        :return: the name of the piece on the square (EX: 'N' or 'p'), or None if the square is empty
+        """
+        return CODE_NAMES[self._board[square_index(square)]]
+
+    def get_position(self):
+        """
+        See ChessVar.get_position, the list and dictionary returned are built for each call.
+
+        :return: (list of 64 piece names or None, dictionary of each colors occupied bitboard, bitboard of the squares
+                 holding pawns that haven't moved)
+        """
+        squares = list(map(CODE_NAMES.__getitem__, self._board))
+        return squares, {"WHITE": self._white, "BLACK": self._black}, self._unmoved
+
+    def del_piece(self, square):
+        """
+        Deletes a piece from the count of pieces left on the board.
+        NOTE: does not remove a piece from the board.
+
+        :parameter square: must be satisfied by the square in algebraic notation to delete the chess piece from.
+        """
+        self._counts[self._board[square_index(square)] - 1] -= 1
+
+    def is_legal_idx(self, start_square, end_square):
+        """
+        Follows the same steps as ChessVar.is_legal_idx, with the movement rules checked by bitboard.piece_targets.
+
+        :parameter start_square: the index from 0 to 63 of the square containing the piece we want to move
+        :parameter end_square: the index from 0 to 63 of the square we want to move the piece to
+        :return: True if the move is legal, False if not
+        """
+        # check game state
+        if self._game_state != "UNFINISHED":
+            return False
+
+        # check if there is a piece in the start square
+        code = self._board[start_square]
+        if not code:
+            return False
+
+        # checks if the starting square and ending square are the same
+        if start_square == end_square:
+            return False
+
+        # check if the piece is the right color
+        is_white = code < FIRST_BLACK_CODE
+        if is_white != (self._turn == "WHITE"):
+            return False
+
+        # check if move is legal (also checks for obstructions excluding end location), and that the final location
+        # doesn't hold a piece of the players own color
+        own = self._white if is_white else self._black
+        targets = piece_targets(CODE_NAMES[code], start_square, self._white | self._black, self._unmoved)
+        return bool(targets & ~own & 1 << end_square)
+
+    def make_move_idx(self, start_square, end_square):
+        """
+        Follows the same steps as ChessVar.make_move_idx, with the checks done by is_legal_idx.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal
+        """
+        if not self.is_legal_idx(start_square, end_square):
+            return False
+        self._play_idx(start_square, end_square)
+
+        # check if anyone won
+        self._check_winner()
+
+        return True
+
+    def _play_idx(self, start_square, end_square):
+        """
+        Same as ChessVar._play_idx.
+
+        :parameter start_square: the index of the square containing the piece to move
+        :parameter end_square: the index of the square to move it to
+        """
+        board = self._board
+        code = board[start_square]
+        name = CODE_NAMES[code]
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+
+        # if end square is opponents color, capture it
+        captured = board[end_square]
+        if captured:
+            if code < FIRST_BLACK_CODE:
+                self._black ^= end_bit
+            else:
+                self._white ^= end_bit
+            self._counts[captured - 1] -= 1
+            self._hash ^= PIECE_KEYS[CODE_NAMES[captured]][end_square]
+
+        # move piece
+        if code < FIRST_BLACK_CODE:
+            self._white ^= start_bit | end_bit
+        else:
+            self._black ^= start_bit | end_bit
+        self._hash ^= PIECE_KEYS[name][start_square] ^ PIECE_KEYS[name][end_square] ^ BLACK_TO_MOVE_KEY
+        if self._unmoved & (start_bit | end_bit):
+            if self._unmoved & start_bit:
+                self._hash ^= UNMOVED_KEYS[start_square]
+            if self._unmoved & end_bit:
+                self._hash ^= UNMOVED_KEYS[end_square]
+            self._unmoved &= ~(start_bit | end_bit)
+        board[end_square] = code
+        board[start_square] = 0
+        if self._attack_map is not None:
+            self._attack_map.move(start_square, end_square)
+
+        # change whose turn it is
+        self._turn = "BLACK" if self._turn == "WHITE" else "WHITE"
+
+    def _check_winner(self):
+        """
+        Same as ChessVar._check_winner, only checking each color once one of the counts has reached 0.
+        """
+        counts = self._counts
+        if 0 in counts:
+            if 0 in counts[FIRST_BLACK_CODE - 1:]:
+                self._game_state = "WHITE_WON"
+            if 0 in counts[:FIRST_BLACK_CODE - 1]:
+                self._game_state = "BLACK_WON"
+
+    def push_move_idx(self, start_square, end_square):
+        """
+        Same as ChessVar.push_move_idx, remembering what pop_move needs to take the move back.
+
+        :parameter start_square: the index of the square containing the piece we want to move
+        :parameter end_square: the index of the square we want to move the piece to
+        :return: True if the move was made, False if it is illegal (nothing is added to the undo stack)
+        """
+        code = self._board[start_square]
+        captured = self._board[end_square]
+        unmoved = self._unmoved
+        turn = self._turn
+        game_state = self._game_state
+        key = self._hash
+
+        if not self.make_move_idx(start_square, end_square):
+            return False
+
+        self._undo_stack.append((start_square, end_square, code, captured, unmoved, turn, game_state, key))
+        return True
+
+    def pop_move(self):
+        """
+        Takes back the last move made with push_move. Raises IndexError if there is nothing to undo.
+
+        :return: the (start, end) squares of the move that was taken back, in algebraic notation
+        """
+        start_square, end_square, code, captured, unmoved, turn, game_state, key = self._undo_stack.pop()
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+        self._board[start_square] = code
+        self._board[end_square] = captured
+        if code < FIRST_BLACK_CODE:
+            self._white ^= start_bit | end_bit
+        else:
+            self._black ^= start_bit | end_bit
+        if captured:
+            if code < FIRST_BLACK_CODE:
+                self._black ^= end_bit
+            else:
+                self._white ^= end_bit
+            self._counts[captured - 1] += 1
+        if self._attack_map is not None:
+            self._attack_map.unmove(start_square, end_square, CODE_NAMES[captured])
+        self._unmoved = unmoved
+        self._turn = turn
+        self._game_state = game_state
+        self._hash = key
+        return SQUARE_NAMES[start_square], SQUARE_NAMES[end_square]
+
+    def show_board(self):
+        """
+        Prints out the current state of the board
+
+        Capital letters are black pieces and lowercase letters are white pieces.
+        R = Rook, N = Knight, B = Bishop, Q = Queen, K = King, P = Pawn.
+        """
+        print('      a   b   c   d   e   f   g   h')
+        print('    _________________________________')
+
+        for row in range(8):
+            rank = 8 - row
+            names = [CODE_NAMES[code] for code in self._board[row * 8:row * 8 + 8]]
+            cells = ''.join('|   ' if name is None else f'| {name} ' for name in names)
+            print(f'{rank}   {cells}|   {rank}')
+
+        print('    ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾')
+        print('      a   b   c   d   e   f   g   h')
+
+
 class ChessPiece:
     """
     This class will act as a parent class for each different chess piece. Each child class will have a different "name"
@@ -201,10 +1235,15 @@ class ChessPiece:
     The point of having this parent class is to not have to write each get method for the child classes. Also, because
     each piece has different allowed moves, the is_move_legal method will work differently for each class but will
     always return True or False. This allows us to use polymorphism when checking if a pieces attempted move is legal.
+
+    The games share one piece object per name and moved status (see piece_for) instead of creating their own, so a
+    piece on a board must never be changed.
     """
+    __slots__ = ('_name', '_has_moved', '_color')
+
     def __init__(self, color):
         self._name = None  # will be overriden by child
-        self._has_moved = False  # Once a piece has moved, changes to True
+        self._has_moved = False  # True for the shared pieces that stand for moved pieces, see piece_for
         self._color = color  # must be "WHITE" or "BLACK"
 
     def get_has_moved(self):
@@ -215,9 +1254,12 @@ class ChessPiece:
 
     def set_has_moved(self):
         """
-        Sets the objects has_moved status to true. Currently only being used for rooks.
+        Deprecated, kept for code written before the boards shared their pieces. A board now records a moved piece by
+        holding the shared moved piece of the same name (see piece_for), so this does nothing to the shared pieces,
+        since changing one would change that piece on every board. It only marks pieces created directly.
         """
-        self._has_moved = True
+        if _PIECES.get((self._name, self._has_moved)) is not self:
+            self._has_moved = True
 
     def get_color(self):
         """
@@ -239,6 +1281,8 @@ class King(ChessPiece):
     MOVES: Can move one square in any direction including diagonally.
         Note: Cannot be obstructed.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "K" if color == "BLACK" else "k"
@@ -269,6 +1313,8 @@ class Queen(ChessPiece):
 
     MOVES: Straight up and down, left to right, or diagonally. As far as desired.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "Q" if color == "BLACK" else "q"
@@ -373,6 +1419,8 @@ class Rook(ChessPiece):
 
     MOVES: Straight up and down or left to right. As far as desired.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "R" if color == "BLACK" else "r"
@@ -433,6 +1481,8 @@ class Bishop(ChessPiece):
 
     MOVES: Only diagonally. As far as desired.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "B" if color == "BLACK" else "b"
@@ -507,6 +1557,8 @@ class Knight(ChessPiece):
     MOVES: "Like a capital L". Two squares in one direction, one to the other. EX: Two down and one left.
         NOTE: Cannot be obstructed.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "N" if color == "BLACK" else "n"
@@ -546,6 +1598,8 @@ class Pawn(ChessPiece):
         NOTE: On first move, can move two or one squares forward.
         NOTE: Only captures diagonally. Cannot capture if the square in front is occupied.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         super().__init__(color)
         self._name = "P" if color == "BLACK" else "p"
@@ -564,7 +1618,8 @@ class Pawn(ChessPiece):
         :parameter board: the board we are testing as a list of lists
         :parameter start: the square the piece starts in, in list notation
         :parameter end: the square we are attempting to move the piece to in list notation
-        :return: True if move is legal, False if not. Does not check the final piece.
+        :return: True if move is legal, False if not. Does not check the final piece. The pawn is not changed, make_move
+                 marks it as moved once the move is made.
         """
         start_indices = start
         end_indices = end
@@ -598,8 +1653,6 @@ class Pawn(ChessPiece):
         elif board[end_indices[0]][end_indices[1]] is not None:  # if trying to capture vertically
             return False
 
-        if not self._has_moved:
-            self._has_moved = True
         return True
 
 
@@ -622,3 +1675,133 @@ def algebra_indices(square):
     new_square[0], new_square[1] = new_square[1], new_square[0]
 
     return new_square
+
+
+def square_index(square):
+    """
+    Converts the given square in algebraic notation into its index from 0 to 63 (row * 8 + column, so "a8" is 0 and
+    "h1" is 63). Squares that aren't on the board are converted the same way algebra_indices and list indexing would
+    treat them, so both backends accept and reject exactly the same input.
+
+    :parameter square: should be a string in algebraic notation.
+    :return: the index of the square from 0 to 63
+    """
+    index = SQUARE_INDEX.get(square)
+    if index is None:
+        row, column = algebra_indices(square)
+        index = range(8)[row] * 8 + range(8)[column]  # raises or wraps around exactly like the list of lists board
+    return index
+
+
+PIECE_CLASSES = {'K': King, 'Q': Queen, 'R': Rook, 'B': Bishop, 'N': Knight, 'P': Pawn}
+BACKENDS = {"list": ChessVar, "bitboard": BitboardChessVar, "compact": CompactChessVar}
+
+STARTING_UNMOVED = 0xFF << 48 | 0xFF << 8  # every pawn on its starting square
+START_FEN = "RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w abcdefghABCDEFGH -"
+START_SQUARES = tuple('RNBQKBNR') + ('P',) * 8 + (None,) * 32 + ('p',) * 8 + tuple('rnbqkbnr')
+
+# the piece codes of the compact board, also used by records.py and batch.py: 0 is an empty square, 1 to 6 are the
+# white k q r b n p and 7 to 12 the black K Q R B N P
+CODE_NAMES = (None,) + tuple('kqrbnpKQRBNP')
+NAME_CODES = {name: code for code, name in enumerate(CODE_NAMES)}
+FIRST_BLACK_CODE = NAME_CODES['K']
+PAWN_CODES = (NAME_CODES['p'], NAME_CODES['P'])
+
+# translate a string with one character per square ('.' for empty) into the piece codes and back
+CODE_TABLE = bytes.maketrans(b'.kqrbnpKQRBNP', bytes(range(13)))
+NAME_TABLE = bytes.maketrans(bytes(range(13)), b'.kqrbnpKQRBNP')
+
+
+def _make_piece(name, has_moved):
+    piece = PIECE_CLASSES[name.upper()](NAME_COLOR[name])
+    piece._has_moved = has_moved
+    return piece
+
+
+_PIECES = {(name, has_moved): _make_piece(name, has_moved) for name in PIECE_NAMES for has_moved in (False, True)}
+
+
+def piece_for(name, has_moved=False):
+    """
+    Every board holds these shared pieces instead of its own objects, so they must never be changed.
+
+    :parameter name: the name of the piece, EX: 'N' or 'p'
+    :parameter has_moved: what get_has_moved should return
+    :return: the shared ChessPiece
+    """
+    return _PIECES[name, has_moved]
+
+_FEN_EXPAND = str.maketrans({str(count): '.' * count for count in range(1, 9)})
+_FEN_TURNS = {'w': "WHITE", 'b': "BLACK"}
+_FEN_STATES = {'-': "UNFINISHED", 'w': "WHITE_WON", 'b': "BLACK_WON"}
+
+
+def parse_fen(fen):
+    """
+    Reads a position written in this variant's FEN-like notation. It has four fields separated by spaces:
+
+        board:       the rows from rank 8 down to rank 1 separated by '/', using the piece names from show_board
+                     (capital letters are black) and a digit for each run of empty squares
+        turn:        'w' or 'b'
+        pawns:       the files of the pawns that haven't moved yet, lowercase for white pawns on rank 2 and capitals
+                     for black pawns on rank 7, or '-' if there are none
+        game state:  '-' while unfinished, 'w' if white won or 'b' if black won. Can be left off, in which case it is
+                     worked out from which piece types are gone.
+
+    :parameter fen: the text to read
+    :return: (list of 64 piece names or None, turn, unmoved pawn bitboard, game state)
+    """
+    fields = fen.split()
+    if len(fields) not in (3, 4):
+        raise ValueError(f'expected 3 or 4 fields in {fen!r}')
+    rows = fields[0].split('/')
+    board = fields[0].translate(_FEN_EXPAND).replace('/', '')
+    if len(rows) != 8 or len(board) != 64 or any(len(row.translate(_FEN_EXPAND)) != 8 for row in rows):
+        raise ValueError(f'the board in {fen!r} is not 8 rows of 8 squares')
+    squares = [None if name == '.' else name for name in board]
+    if not set(board) <= set('.KQRBNPkqrbnp'):
+        raise ValueError(f'unknown piece name in {fen!r}')
+    if fields[1] not in _FEN_TURNS:
+        raise ValueError(f'the turn in {fen!r} must be w or b')
+
+    unmoved = 0
+    for file in fields[2] if fields[2] != '-' else '':
+        square = SQUARE_INDEX.get(file.lower() + ('2' if file.islower() else '7'))
+        if square is None or squares[square] != ('p' if file.islower() else 'P'):
+            raise ValueError(f'{file!r} in {fen!r} does not name an unmoved pawn')
+        unmoved |= 1 << square
+
+    if len(fields) == 4:
+        if fields[3] not in _FEN_STATES:
+            raise ValueError(f'the game state in {fen!r} must be -, w or b')
+        game_state = _FEN_STATES[fields[3]]
+    else:
+        game_state = "UNFINISHED"
+        if any(name not in board for name in 'KQRBNP'):
+            game_state = "WHITE_WON"
+        if any(name not in board for name in 'kqrbnp'):
+            game_state = "BLACK_WON"
+    return squares, _FEN_TURNS[fields[1]], unmoved, game_state
+
+
+def format_fen(squares, turn, unmoved, game_state):
+    """
+    Writes a position in the notation described in parse_fen.
+
+    :parameter squares: a list of 64 piece names or None, in board order (a8 first)
+    :parameter turn: whose turn it is, "WHITE" or "BLACK"
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :parameter game_state: "UNFINISHED", "WHITE_WON" or "BLACK_WON"
+    :return: the text
+    """
+    board = ''.join(name or '.' for name in squares)
+    rows = []
+    for row in range(8):
+        text = board[row * 8:row * 8 + 8]
+        for count in range(8, 0, -1):
+            text = text.replace('.' * count, str(count))
+        rows.append(text)
+    pawns = ''.join(chr(97 + file) for file in range(8) if unmoved >> (48 + file) & 1)
+    pawns += ''.join(chr(65 + file) for file in range(8) if unmoved >> (8 + file) & 1)
+    state = {"UNFINISHED": '-', "WHITE_WON": 'w', "BLACK_WON": 'b'}[game_state]
+    return f'{"/".join(rows)} {"w" if turn == "WHITE" else "b"} {pawns or "-"} {state}'
@@ -0,0 +1,284 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Analyzes files of positions in bulk: the best move, score and principal variation from search.py, and
+#               the extinction threats (piece types down to their last piece that can be captured) of both sides. Every
+#               line of the file is one position in the FEN-like notation of ChessVar.parse_fen. Empty lines and lines
+#               starting with '#' are skipped.
+#
+#               The positions are read lazily and searched across a pool of worker processes, each search stopping at a
+#               time, node and depth limit. Only a few searches per worker are in flight at once, and the results are
+#               handed back in the order of the file as soon as they are ready, like validate.py does.
+#
+#               A position that appears more than once is searched once, and results can be kept in a cache file so a
+#               later run over an overlapping set of positions only searches the new ones. The cache is keyed by the
+#               position and the search settings, so a run with different limits doesn't reuse results searched with
+#               others. Each worker clears its search tables before every position, so a result doesn't depend on
+#               which positions came before it.
+#
+#               Run from the project folder with:
+#                   python analyze.py POSITIONS.txt [--time S] [--nodes N] [--depth D] [--workers W] [--cache FILE]
+#                                     [--tablebase FILE] [--out FILE]
+#               Use - instead of a file name to read from standard input.
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+from ChessVar import ChessVar
+from search import Searcher
+from tablebase import Tablebase
+
+CACHE_VERSION = 1  # raise this when a change to the search makes results in old cache files wrong
+
+AnalysisSettings = collections.namedtuple('AnalysisSettings', ['max_depth', 'time_limit', 'node_limit', 'tablebase'])
+AnalysisSettings.__doc__ = """
+How each position is searched.
+
+max_depth:  the deepest iteration to search
+time_limit: seconds each search may take, or None for no limit
+node_limit: positions each search may visit, or None for no limit
+tablebase:  the path of a tablebase file to probe, or None
+"""
+
+Analysis = collections.namedtuple('Analysis', ['line', 'position', 'best_move', 'pv', 'score', 'depth', 'nodes',
+                                               'threats', 'source', 'error'])
+Analysis.__doc__ = """
+The result for one position of the file.
+
+line:      the line number of the position in the file, counting from 1
+position:  the position as written by ChessVar.to_fen, or the text of the line if it couldn't be read
+best_move: the best move like 'e2e4', or None if there is no legal move
+pv:        the moves both sides are expected to play, starting with best_move
+score:     the score for the player to move, see search.SearchResult
+depth:     the deepest iteration that finished
+nodes:     the number of positions the search visited
+threats:   a dictionary with each colors list of [piece name, square] it could lose its last piece of a type on
+source:    "search" if it was searched in this run, "duplicate" if an earlier line had the same position, or "cache"
+           if it came from the cache file
+error:     why the line couldn't be read or searched, or None. Every other field but line and position is None then.
+"""
+
+# the search and settings of a worker process, made by _init_worker
+_searcher = None
+_settings = None
+
+
+def settings_key(settings):
+    """
+    :return: the text the cache file stores with each result, so only results searched the same way are reused. The
+             tablebase is named by its path, size and modification time, so rebuilding it makes the old results stale.
+    """
+    tablebase = None
+    if settings.tablebase is not None:
+        status = os.stat(settings.tablebase)
+        tablebase = f'{os.path.abspath(settings.tablebase)}:{status.st_size}:{status.st_mtime_ns}'
+    return (f'v{CACHE_VERSION} depth={settings.max_depth} time={settings.time_limit} nodes={settings.node_limit} '
+            f'tablebase={tablebase}')
+
+
+class AnalysisCache:
+    """
+    Results of earlier runs, in a JSON lines file with one {"settings", "position", "result"} object per line. Only
+    the lines searched with the settings of this run are loaded, and every new result is appended and flushed right
+    away, so a run that is stopped part way keeps what it found. Close it (or use it as a context manager) when done.
+    """
+    def __init__(self, path, settings):
+        """
+        :parameter path: the cache file, created if it doesn't exist
+        :parameter settings: the AnalysisSettings of this run
+        """
+        self.path = path
+        self.settings = settings_key(settings)
+        self._results = {}
+        ends_with_newline = True
+        if os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    ends_with_newline = line.endswith('\n')
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # the last line of a run that was killed while writing it
+                    if entry.get('settings') == self.settings:
+                        self._results[entry['position']] = entry['result']
+        self._file = open(path, 'a')
+        if not ends_with_newline:
+            self._file.write('\n')
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, position):
+        """
+        :parameter position: a position written by ChessVar.to_fen
+        :return: the cached result dictionary of the position, or None
+        """
+        return self._results.get(position)
+
+    def put(self, position, result):
+        """
+        Stores the result of a position and writes it to the file.
+        """
+        self._results[position] = result
+        self._file.write(json.dumps({'settings': self.settings, 'position': position, 'result': result}) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _init_worker(settings):
+    global _searcher, _settings
+    tablebase = None if settings.tablebase is None else Tablebase(settings.tablebase)
+    _searcher = Searcher(tablebase=tablebase)
+    _settings = settings
+
+
+def analyze_position(position):
+    """
+    Searches one position inside a worker process.
+
+    :parameter position: the position in the notation of ChessVar.parse_fen
+    :return: a dictionary of the best_move, pv, score, depth, nodes and threats fields of an Analysis
+    """
+    game = ChessVar.from_fen(position, backend="bitboard")
+    _searcher.clear()
+    result = _searcher.search(game, _settings.max_depth, _settings.time_limit, _settings.node_limit)
+    return {
+        'best_move': None if result.best_move is None else ''.join(result.best_move),
+        'pv': [start + end for start, end in result.pv],
+        'score': result.score,
+        'depth': result.depth,
+        'nodes': result.nodes,
+        'threats': {color: [list(threat) for threat in game.extinction_threats(color)] for color in ("WHITE", "BLACK")},
+    }
+
+
+def read_positions(lines):
+    """
+    :parameter lines: an iterable of the lines of a position file
+    :return: a generator of (line number, text) for every line holding a position
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield number, line
+
+
+def analyze_lines(lines, settings, workers=None, cache=None):
+    """
+    Analyzes every position in lines across a pool of worker processes. lines is read lazily and at most two searches
+    per worker are waiting at any time.
+
+    :parameter lines: an iterable of the lines of a position file, EX: an open file
+    :parameter settings: the AnalysisSettings to search with
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :parameter cache: an AnalysisCache to take results from and add new ones to, or None
+    :return: a generator of Analyses in the order of the positions in lines
+    """
+    workers = workers or os.cpu_count() or 1
+    found = {}    # position -> result of every position searched in this run
+    running = {}  # position -> Future of every search that hasn't been collected yet
+    pending = collections.deque()
+
+    def collect(number, position, source, result):
+        if source is None:  # the line couldn't be read and result is why
+            return Analysis(number, position, None, None, None, None, None, None, None, result)
+        if isinstance(result, concurrent.futures.Future):
+            future = result
+            try:
+                result = future.result()
+            except Exception as error:  # the search failed, or its worker process died
+                if running.get(position) is future:
+                    del running[position]
+                return Analysis(number, position, None, None, None, None, None, None, None,
+                                f'search failed: {error!r}')
+            if running.get(position) is future:  # the first line with this position stores what was found
+                del running[position]
+                found[position] = result
+                if cache is not None:
+                    cache.put(position, result)
+        return Analysis(number, position, source=source, error=None, **result)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(settings,)) as executor:
+        for number, text in read_positions(lines):
+            try:
+                position = ChessVar.from_fen(text).to_fen()
+            except ValueError as error:
+                pending.append((number, text, None, str(error)))
+            else:
+                if position in found:
+                    pending.append((number, position, "duplicate", found[position]))
+                elif position in running:
+                    pending.append((number, position, "duplicate", running[position]))
+                elif cache is not None and cache.get(position) is not None:
+                    pending.append((number, position, "cache", cache.get(position)))
+                else:
+                    try:
+                        running[position] = executor.submit(analyze_position, position)
+                    except concurrent.futures.BrokenExecutor as error:  # a worker process died earlier
+                        pending.append((number, position, None, f'search failed: {error!r}'))
+                    else:
+                        pending.append((number, position, "search", running[position]))
+
+            # hand back everything that is ready at the front, and wait for the front once enough searches are waiting
+            while pending:
+                number, position, source, result = pending[0]
+                if isinstance(result, concurrent.futures.Future) and not result.done() and len(running) < workers * 2:
+                    break
+                pending.popleft()
+                yield collect(number, position, source, result)
+
+        while pending:
+            yield collect(*pending.popleft())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="search files of positions for their best moves and threats")
+    parser.add_argument('positions', help='file with one position per line, or - for standard input')
+    parser.add_argument('--time', type=float, default=1.0, help='seconds to search each position, 0 for no limit')
+    parser.add_argument('--nodes', type=int, default=None, help='positions each search may visit (default: no limit)')
+    parser.add_argument('--depth', type=int, default=64, help='deepest iteration to search')
+    parser.add_argument('--tablebase', default=None, help='a tablebase file made by tablebase.py to probe')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of CPUs)')
+    parser.add_argument('--cache', default=None, help='file to keep results in between runs')
+    parser.add_argument('--out', default=None, help='file to write one JSON result per line to (default: stdout)')
+    args = parser.parse_args()
+
+    settings = AnalysisSettings(args.depth, args.time or None, args.nodes, args.tablebase)
+    cache = None if args.cache is None else AnalysisCache(args.cache, settings)
+    source = sys.stdin if args.positions == '-' else open(args.positions)
+    out = open(args.out, 'w') if args.out else sys.stdout
+    begin = time.perf_counter()
+    sources = collections.Counter()
+    try:
+        for analysis in analyze_lines(source, settings, args.workers, cache):
+            out.write(json.dumps(analysis._asdict()) + '\n')
+            sources[analysis.source or "error"] += 1
+    finally:
+        if args.out:
+            out.close()
+        if source is not sys.stdin:
+            source.close()
+        if cache is not None:
+            cache.close()
+    seconds = time.perf_counter() - begin
+    total = sum(sources.values())
+    print(f'{total} positions in {seconds:.2f}s: {sources["search"]} searched, {sources["duplicate"]} duplicates, '
+          f'{sources["cache"]} from the cache, {sources["error"]} unreadable or failed', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
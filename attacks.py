@@ -0,0 +1,177 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Attack maps for ChessVar, kept up to date a move at a time. A piece attacks a square if it could capture
+#               an enemy piece standing there, following this variant's movement rules exactly as the move tables in
+#               bitboard.py do: pawns attack the two squares diagonally forward, knights and kings always reach the same
+#               squares, rooks stop at the first piece in each direction, and bishops and queens stop at the first
+#               piece going right but never going left (the left diagonals aren't checked for obstructions). A piece
+#               also attacks the squares of its own pieces it could reach, so the maps show which pieces are defended.
+#
+#               After a move only a few attack sets can change: the pieces on the two squares that changed, and any
+#               rook, bishop or queen whose line reached one of those squares, which are exactly the pieces already
+#               listed as attacking them. Only those are worked out again.
+
+from bitboard import (NAME_COLOR, PIECE_NAMES, KING_MOVES, KNIGHT_MOVES, PAWN_CAPTURES, rook_targets, bishop_targets,
+                      queen_targets, squares_of)
+
+
+def attack_set(name, square, occupied):
+    """
+    :parameter name: the name of the piece, EX: 'N' or 'p'
+    :parameter square: the square the piece is on
+    :parameter occupied: the bitboard of every occupied square
+    :return: the bitboard of squares the piece attacks
+    """
+    kind = name.upper()
+    if kind == 'N':
+        return KNIGHT_MOVES[square]
+    if kind == 'K':
+        return KING_MOVES[square]
+    if kind == 'P':
+        return PAWN_CAPTURES[NAME_COLOR[name]][square]
+    if kind == 'R':
+        return rook_targets(square, occupied)
+    if kind == 'B':
+        return bishop_targets(square, occupied)
+    return queen_targets(square, occupied)
+
+
+class AttackMap:
+    """
+    The attacks of every piece on a board, by square and by color.
+
+    squares:   a list of 64 piece names or None
+    occupied:  the bitboard of every occupied square
+    pieces:    the bitboard of the squares holding each piece name
+    attacks:   for each square, the bitboard of squares the piece on it attacks (0 if it is empty)
+    attackers: for each color, a list with the bitboard of that colors pieces attacking each square
+    attacked:  for each color, the bitboard of every square that color attacks
+    """
+    def __init__(self, squares):
+        """
+        :parameter squares: a list of 64 piece names or None, it is copied
+        """
+        self.squares = list(squares)
+        self.occupied = 0
+        self.pieces = {name: 0 for name in PIECE_NAMES}
+        self.attacks = [0] * 64
+        self.attackers = {"WHITE": [0] * 64, "BLACK": [0] * 64}
+        self.attacked = {"WHITE": 0, "BLACK": 0}
+        for square, name in enumerate(self.squares):
+            if name is not None:
+                self.occupied |= 1 << square
+                self.pieces[name] |= 1 << square
+        for square, name in enumerate(self.squares):
+            if name is not None:
+                self._set_attacks(square, None)
+
+    def _set_attacks(self, square, old_name):
+        """
+        Works out the attacks of the piece now on square again and updates the maps by the difference.
+
+        :parameter square: the square to work out
+        :parameter old_name: the name of the piece the current attacks of the square belong to, or None
+        """
+        name = self.squares[square]
+        new = 0 if name is None else attack_set(name, square, self.occupied)
+        old = self.attacks[square]
+        if old_name is not None and (name is None or NAME_COLOR[old_name] != NAME_COLOR[name]):
+            self._change_attackers(NAME_COLOR[old_name], square, old)
+            old = 0
+        if name is not None:
+            self._change_attackers(NAME_COLOR[name], square, old ^ new)
+        self.attacks[square] = new
+
+    def _change_attackers(self, color, square, targets):
+        """
+        Flips square in the attackers of every target square for one color.
+        """
+        bit = 1 << square
+        attackers = self.attackers[color]
+        attacked = self.attacked[color]
+        while targets:
+            low_bit = targets & -targets
+            targets ^= low_bit
+            target = low_bit.bit_length() - 1
+            attackers[target] ^= bit
+            if attackers[target]:
+                attacked |= low_bit
+            else:
+                attacked &= ~low_bit
+        self.attacked[color] = attacked
+
+    def change(self, first, first_name, second, second_name):
+        """
+        Puts new pieces (or nothing) on two squares and updates every attack that changes because of it.
+
+        :parameter first: a square index
+        :parameter first_name: the name of the piece now on first, or None if it is now empty
+        :parameter second: another square index
+        :parameter second_name: the name of the piece now on second, or None
+        """
+        squares = self.squares
+        affected = (self.attackers["WHITE"][first] | self.attackers["BLACK"][first] | self.attackers["WHITE"][second] |
+                    self.attackers["BLACK"][second])
+        old_names = {first: squares[first], second: squares[second]}
+        for square, name in ((first, first_name), (second, second_name)):
+            bit = 1 << square
+            old = squares[square]
+            if old is not None:
+                self.pieces[old] ^= bit
+                self.occupied ^= bit
+            if name is not None:
+                self.pieces[name] |= bit
+                self.occupied |= bit
+            squares[square] = name
+
+        for square in (first, second):
+            self._set_attacks(square, old_names[square])
+        # knights, kings and pawns attack the same squares wherever the other pieces are
+        pieces = self.pieces
+        sliders = pieces['R'] | pieces['B'] | pieces['Q'] | pieces['r'] | pieces['b'] | pieces['q']
+        affected &= sliders & ~(1 << first | 1 << second)
+        for square in squares_of(affected):
+            self._set_attacks(square, squares[square])
+
+    def move(self, start, end):
+        """
+        Updates the maps for a piece moving from start to end, capturing whatever was on end.
+        """
+        self.change(start, None, end, self.squares[start])
+
+    def unmove(self, start, end, captured):
+        """
+        Updates the maps for taking back a move from start to end that captured captured (or None).
+        """
+        self.change(start, self.squares[end], end, captured)
+
+    def attackers_of(self, square, color):
+        """
+        :return: the bitboard of colors pieces attacking square
+        """
+        return self.attackers[color][square]
+
+    def attacked_pieces(self, color):
+        """
+        :return: the bitboard of colors pieces attacked by the other color
+        """
+        own = 0
+        for name in PIECE_NAMES:
+            if NAME_COLOR[name] == color:
+                own |= self.pieces[name]
+        return own & self.attacked["BLACK" if color == "WHITE" else "WHITE"]
+
+    def extinction_threats(self, color, counts):
+        """
+        :parameter color: the color whose pieces are threatened
+        :parameter counts: how many pieces of each name are left, like ChessVar.get_piece_dict
+        :return: a list of (name, square index) for each of colors piece types with a single piece left that the
+                 other color attacks, so one capture would end the game
+        """
+        enemy_attacks = self.attacked["BLACK" if color == "WHITE" else "WHITE"]
+        threats = []
+        for name in PIECE_NAMES:
+            if NAME_COLOR[name] == color and counts[name] == 1 and self.pieces[name] & enemy_attacks:
+                threats.append((name, (self.pieces[name] & enemy_attacks).bit_length() - 1))
+        return threats
@@ -0,0 +1,136 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Exports any number of ChessVar games into NumPy arrays so large batches of positions can be scored at
+#               once, and vectorized helpers that compute features across the whole batch without a Python loop per
+#               position. Needs NumPy (pip install numpy), which the rest of the project doesn't.
+#
+#               Each position is stored as 64 int8 piece codes (ChessVar.CODE_NAMES) in board order (a8 is 0, h1 is 63).
+#               Code 0 is an empty square, codes 1 to 6 are the white k, q, r, b, n, p and 7 to 12 the black K, Q, R, B,
+#               N, P.
+#               Wherever a color axis appears, index 0 is white and index 1 is black.
+
+import collections
+
+import numpy as np
+
+from ChessVar import CODE_NAMES, NAME_CODES, CODE_TABLE
+from bitboard import KNIGHT_MOVES, PAWN_CAPTURES, squares_of
+
+TYPE_NAMES = 'KQRBNP'
+
+PositionBatch = collections.namedtuple('PositionBatch', ['codes', 'turn', 'counts', 'unmoved'])
+PositionBatch.__doc__ = """
+A batch of N positions.
+
+codes:   (N, 64) int8 piece codes
+turn:    (N,) int8, 0 if it is white's turn and 1 if it is black's
+counts:  (N, 12) int8 copies of each games _piece_dict, in the order of the codes 1 to 12
+unmoved: (N,) uint64 bitboards of the squares holding pawns that haven't moved yet
+"""
+
+
+def _attack_matrix(tables):
+    """
+    :parameter tables: a list of 64 bitboards, the squares attacked from each square
+    :return: a (64, 64) float32 matrix where [from, to] is 1 if a piece on from attacks to
+    """
+    matrix = np.zeros((64, 64), dtype=np.float32)
+    for start, attacks in enumerate(tables):
+        matrix[start, squares_of(attacks)] = 1
+    return matrix
+
+
+# multiplying a (N, 64) matrix of where the pieces are by one of these gives how many pieces attack each square
+KNIGHT_ATTACKS = _attack_matrix(KNIGHT_MOVES)
+PAWN_ATTACKS = np.stack([_attack_matrix(PAWN_CAPTURES["WHITE"]), _attack_matrix(PAWN_CAPTURES["BLACK"])])
+
+
+def encode_games(games):
+    """
+    Exports the current position of every game into one batch.
+
+    :parameter games: an iterable of ChessVar objects, of any backend
+    :return: a PositionBatch
+    """
+    boards = bytearray()
+    turns = []
+    counts = []
+    unmoved = []
+    for game in games:
+        squares, occupied, pawns = game.get_position()
+        boards += ''.join(name or '.' for name in squares).encode().translate(CODE_TABLE)
+        turns.append(game.get_turn() == "BLACK")
+        piece_dict = game.get_piece_dict()
+        counts.append([piece_dict[name] for name in CODE_NAMES[1:]])
+        unmoved.append(pawns)
+    return PositionBatch(np.frombuffer(bytes(boards), dtype=np.int8).reshape(-1, 64),
+                         np.array(turns, dtype=np.int8),
+                         np.array(counts, dtype=np.int8).reshape(-1, 12),
+                         np.array(unmoved, dtype=np.uint64))
+
+
+def to_planes(codes):
+    """
+    :parameter codes: (N, 64) piece codes
+    :return: (N, 12, 8, 8) uint8 planes, plane n is 1 wherever the piece with code n + 1 is
+    """
+    return (codes[:, None, :] == np.arange(1, 13, dtype=np.int8)[None, :, None]).astype(np.uint8).reshape(-1, 12, 8, 8)
+
+
+def material_by_type(codes):
+    """
+    Counts the pieces on the board, which is the same as each games _piece_dict unless del_piece was used.
+
+    :parameter codes: (N, 64) piece codes
+    :return: (N, 2, 6) int16 counts indexed by color and then type in TYPE_NAMES order
+    """
+    return to_planes(codes).reshape(-1, 12, 64).sum(axis=2, dtype=np.int16).reshape(-1, 2, 6)
+
+
+def rarest_type(counts):
+    """
+    Finds each sides rarest remaining type among rooks, bishops, knights and pawns. Kings and queens are left out
+    because there is only ever one of them, so they would always be the rarest.
+
+    :parameter counts: (N, 12) counts in the order of the codes 1 to 12, or (N, 2, 6) counts from material_by_type
+    :return: ((N, 2) count of the rarest type, (N, 2) index of that type in TYPE_NAMES)
+    """
+    counts = np.asarray(counts).reshape(-1, 2, 6)[:, :, 2:]
+    return counts.min(axis=2), counts.argmin(axis=2) + 2
+
+
+def pawn_attacks(codes):
+    """
+    :parameter codes: (N, 64) piece codes
+    :return: (N, 2, 64) uint8 counts of how many pawns of each color attack each square
+    """
+    white = (codes == NAME_CODES['p']).astype(np.float32) @ PAWN_ATTACKS[0]
+    black = (codes == NAME_CODES['P']).astype(np.float32) @ PAWN_ATTACKS[1]
+    return np.stack([white, black], axis=1).astype(np.uint8)
+
+
+def knight_attacks(codes):
+    """
+    Uses this variant's knight moves, so besides the usual "L" jumps a knight also attacks every square where neither
+    the row nor the column difference is 1 or 2.
+
+    :parameter codes: (N, 64) piece codes
+    :return: (N, 2, 64) uint8 counts of how many knights of each color attack each square
+    """
+    white = (codes == NAME_CODES['n']).astype(np.float32) @ KNIGHT_ATTACKS
+    black = (codes == NAME_CODES['N']).astype(np.float32) @ KNIGHT_ATTACKS
+    return np.stack([white, black], axis=1).astype(np.uint8)
+
+
+def features(batch):
+    """
+    Computes every feature for a batch at once.
+
+    :parameter batch: a PositionBatch
+    :return: a dictionary of arrays: material (N, 2, 6), rarest_count (N, 2), rarest_type (N, 2), pawn_attacks and
+             knight_attacks (N, 2, 64) bool
+    """
+    rarest_count, rarest_index = rarest_type(batch.counts)
+    return {'material': material_by_type(batch.codes), 'rarest_count': rarest_count, 'rarest_type': rarest_index,
+            'pawn_attacks': pawn_attacks(batch.codes) > 0, 'knight_attacks': knight_attacks(batch.codes) > 0}
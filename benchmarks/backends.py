@@ -0,0 +1,102 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Compares how many make_move calls per second the list of lists board and the bitboard board can handle.
+#               A stream of random move attempts (both legal and illegal) is recorded once and then replayed on a fresh
+#               game for each backend, so both backends do exactly the same work. The results of every call are
+#               compared as well, so the benchmark doubles as a check that the backends agree.
+#
+#               Run from the project folder with:  python -m benchmarks.backends [--games N] [--seed S]
+
+import argparse
+import random
+import time
+
+from ChessVar import ChessVar
+from bitboard import SQUARE_NAMES
+
+
+def record_attempts(games, seed, attempts_per_ply=64, max_plies=200):
+    """
+    Plays random games and records every make_move attempt made along the way.
+
+    :parameter games: how many games to record
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :parameter attempts_per_ply: how many random destinations to try for each move before giving up on the game
+    :parameter max_plies: the longest a recorded game is allowed to go
+    :return: a list with one list of (start, end) attempts per game
+    """
+    rng = random.Random(seed)
+    recorded = []
+    for _ in range(games):
+        game = ChessVar(backend="bitboard")
+        attempts = []
+        for _ in range(max_plies):
+            if game.get_game_state() != "UNFINISHED":
+                break
+            own_squares = [SQUARE_NAMES[row * 8 + column]
+                           for row, board_row in enumerate(game.get_board())
+                           for column, piece in enumerate(board_row)
+                           if piece is not None and piece.get_color() == game.get_turn()]
+            for _ in range(attempts_per_ply):
+                start, end = rng.choice(own_squares), rng.choice(SQUARE_NAMES)
+                attempts.append((start, end))
+                if game.make_move(start, end):
+                    break
+            else:
+                break
+        recorded.append(attempts)
+    return recorded
+
+
+def replay(backend, recorded):
+    """
+    Replays every recorded attempt on fresh games of the given backend.
+
+    :parameter backend: the backend name passed to ChessVar()
+    :parameter recorded: the attempts returned by record_attempts
+    :return: (seconds taken, number of accepted moves, list of every make_move result)
+    """
+    results = []
+    accepted = 0
+    begin = time.perf_counter()
+    for attempts in recorded:
+        game = ChessVar(backend=backend)
+        make_move = game.make_move
+        for start, end in attempts:
+            result = make_move(start, end)
+            results.append(result)
+            accepted += result
+    return time.perf_counter() - begin, accepted, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="make_move throughput of each board backend")
+    parser.add_argument('--games', type=int, default=200, help='number of random games to replay')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to record the games')
+    parser.add_argument('--repeat', type=int, default=5, help='best of this many replays is reported')
+    args = parser.parse_args()
+
+    recorded = record_attempts(args.games, args.seed)
+    calls = sum(len(attempts) for attempts in recorded)
+    print(f'{args.games} games, {calls} make_move calls per replay')
+
+    rates = {}
+    expected = None
+    for backend in ("list", "bitboard"):
+        best = None
+        for _ in range(args.repeat):
+            seconds, accepted, results = replay(backend, recorded)
+            best = seconds if best is None else min(best, seconds)
+        if expected is None:
+            expected = results
+        elif results != expected:
+            raise SystemExit(f'{backend} backend disagrees with the list backend')
+        rates[backend] = accepted / best
+        print(f'{backend:>9}: {calls / best:12,.0f} calls/s  {accepted / best:12,.0f} moves/s')
+
+    print(f'  speedup: {rates["bitboard"] / rates["list"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Compares ChessVar.fork with copy.deepcopy for branching off a game to try out moves. Positions are taken
+#               from random games at several points, and each branch plays a few moves so the cost of copying shared
+#               rows on the first write is counted too. Every branch is checked to have left its parent unchanged.
+#
+#               Run from the project folder with:  python -m benchmarks.fork [--positions N] [--seed S]
+
+import argparse
+import copy
+import random
+import time
+
+from ChessVar import ChessVar
+
+
+def record_positions(backend, count, seed, max_plies=40):
+    """
+    :parameter backend: the backend name passed to ChessVar()
+    :parameter count: how many positions to collect
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :parameter max_plies: positions are taken at most this many plies into a game
+    :return: a list of unfinished ChessVar games
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = ChessVar(backend=backend)
+        for _ in range(rng.randrange(max_plies)):
+            moves = game.legal_moves_idx()
+            if not moves:
+                break
+            game.push_move_idx(*rng.choice(moves))
+        if game.get_game_state() == "UNFINISHED":
+            positions.append(game)
+    return positions
+
+
+def branch(positions, copier, plies, rng):
+    """
+    Branches off every position and plays a few random moves on the branch.
+
+    :parameter positions: the games to branch from
+    :parameter copier: a function that copies a game
+    :parameter plies: how many moves to play on each branch
+    :parameter rng: the random.Random to pick moves with
+    :return: (seconds spent copying, seconds spent in total)
+    """
+    copying = 0.0
+    begin = time.perf_counter()
+    for game in positions:
+        started = time.perf_counter()
+        child = copier(game)
+        copying += time.perf_counter() - started
+        for _ in range(plies):
+            moves = child.legal_moves_idx()
+            if not moves:
+                break
+            child.make_move_idx(*rng.choice(moves))
+    return copying, time.perf_counter() - begin
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cost of ChessVar.fork against copy.deepcopy")
+    parser.add_argument('--positions', type=int, default=500, help='number of positions to branch from')
+    parser.add_argument('--plies', type=int, default=4, help='moves played on each branch')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to pick the positions and moves')
+    args = parser.parse_args()
+
+    for backend in ("list", "bitboard"):
+        positions = record_positions(backend, args.positions, args.seed)
+        before = [(game.to_fen(), game.get_hash(), len(game._undo_stack)) for game in positions]
+        results = {}
+        for label, copier in (("deepcopy", copy.deepcopy), ("fork", lambda game: game.fork())):
+            results[label] = branch(positions, copier, args.plies, random.Random(args.seed))
+            after = [(game.to_fen(), game.get_hash(), len(game._undo_stack)) for game in positions]
+            if after != before:
+                raise SystemExit(f'{label} on the {backend} backend changed the parent game')
+        for label, (copying, total) in results.items():
+            print(f'{backend:>9} {label:>8}: {copying / args.positions * 1e6:8.1f} us per copy, '
+                  f'{total / args.positions * 1e6:8.1f} us per branch with {args.plies} moves')
+        print(f'{backend:>9}  speedup: {results["deepcopy"][0] / results["fork"][0]:.1f}x per copy, '
+              f'{results["deepcopy"][1] / results["fork"][1]:.1f}x per branch')
+
+
+if __name__ == '__main__':
+    main()
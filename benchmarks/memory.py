@@ -0,0 +1,82 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Measures how much memory each live game takes with each backend, the number that matters for a server
+#               holding tens of thousands of games at once. Random games are recorded once and then replayed into a
+#               fresh set of games for each backend, with tracemalloc counting every byte allocated for them (the board,
+#               the pieces, the counts and the game object itself). Shared objects like the move tables and the
+#               flyweight pieces are made before counting starts, so they aren't charged to the games.
+#
+#               Run from the project folder with:  python -m benchmarks.memory [--games N] [--plies N] [--seed S]
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from ChessVar import ChessVar, BACKENDS
+
+
+def record_games(count, plies, seed):
+    """
+    :parameter count: how many games to record
+    :parameter plies: the most moves to play in each game
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :return: a list with the list of (start, end) square index moves of each game
+    """
+    rng = random.Random(seed)
+    recorded = []
+    for _ in range(count):
+        game = ChessVar(backend="bitboard")
+        moves = []
+        for _ in range(plies):
+            legal = game.legal_moves_idx()
+            if not legal:
+                break
+            move = rng.choice(legal)
+            game.make_move_idx(*move)
+            moves.append(move)
+        recorded.append(moves)
+    return recorded
+
+
+def bytes_per_game(backend, recorded):
+    """
+    Replays every recorded game into its own live game and measures the memory they hold once every one is made.
+
+    :parameter backend: the backend name passed to ChessVar()
+    :parameter recorded: the move lists made by record_games
+    :return: the average number of bytes each live game holds
+    """
+    games = [None] * len(recorded)
+    ChessVar(backend=backend).apply_moves(recorded[0])  # anything made on first use is made before counting starts
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for number, moves in enumerate(recorded):
+            game = ChessVar(backend=backend)
+            game.apply_moves(moves)
+            games[number] = game
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return held / len(recorded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="memory held by each live ChessVar game, for every backend")
+    parser.add_argument('--games', type=int, default=2000, help='number of live games to hold')
+    parser.add_argument('--plies', type=int, default=10, help='the most moves played in each game')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to pick the moves')
+    args = parser.parse_args()
+
+    recorded = record_games(args.games, args.plies, args.seed)
+    sizes = {backend: bytes_per_game(backend, recorded) for backend in BACKENDS}
+    for backend, size in sizes.items():
+        print(f'{backend:>9}: {size:8.0f} bytes per live game  ({size / sizes["list"]:.0%} of the list backend)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Compares how fast recorded games can be replayed by calling make_move with algebraic strings for every
+#               move against handing the whole game to apply_moves as square indices, checked and trusted
+#               (validate=False). Random games are recorded once and replayed on fresh games of each backend, and the
+#               final position of every replay is compared so the benchmark doubles as a check that every path agrees.
+#
+#               Run from the project folder with:  python -m benchmarks.replay [--games N] [--seed S]
+
+import argparse
+import random
+import time
+
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_NAMES
+
+
+def record_games(games, seed, max_plies=300):
+    """
+    Plays random games made only of legal moves.
+
+    :parameter games: how many games to record
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :parameter max_plies: the longest a recorded game is allowed to go
+    :return: a list with one list of (start, end) square index moves per game
+    """
+    rng = random.Random(seed)
+    recorded = []
+    for _ in range(games):
+        game = ChessVar(backend="bitboard")
+        moves = []
+        while len(moves) < max_plies:
+            legal = game.legal_moves_idx()
+            if not legal:
+                break
+            move = rng.choice(legal)
+            game.make_move_idx(*move)
+            moves.append(move)
+        recorded.append(moves)
+    return recorded
+
+
+def replay_strings(backend, recorded):
+    """
+    :parameter backend: the backend name passed to ChessVar()
+    :parameter recorded: the games returned by record_games, converted to algebraic notation
+    :return: (seconds taken, list of the final position and game state of each game)
+    """
+    finals = []
+    begin = time.perf_counter()
+    for moves in recorded:
+        game = ChessVar(backend=backend)
+        make_move = game.make_move
+        for start, end in moves:
+            if not make_move(start, end):
+                break
+        finals.append(game)
+    return time.perf_counter() - begin, [(game.to_fen(), game.get_game_state()) for game in finals]
+
+
+def replay_indices(backend, recorded, validate=True):
+    """
+    :parameter backend: the backend name passed to ChessVar()
+    :parameter recorded: the games returned by record_games
+    :parameter validate: passed on to apply_moves
+    :return: (seconds taken, list of the final position and game state of each game)
+    """
+    finals = []
+    begin = time.perf_counter()
+    for moves in recorded:
+        game = ChessVar(backend=backend)
+        game.apply_moves(moves, validate)
+        finals.append(game)
+    return time.perf_counter() - begin, [(game.to_fen(), game.get_game_state()) for game in finals]
+
+
+def replay_trusted(backend, recorded):
+    """
+    Same as replay_indices with validate=False.
+    """
+    return replay_indices(backend, recorded, validate=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="replay throughput of make_move against apply_moves")
+    parser.add_argument('--games', type=int, default=200, help='number of random games to replay')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to record the games')
+    parser.add_argument('--repeat', type=int, default=5, help='best of this many replays is reported')
+    args = parser.parse_args()
+
+    recorded = record_games(args.games, args.seed)
+    as_strings = [[(SQUARE_NAMES[start], SQUARE_NAMES[end]) for start, end in moves] for moves in recorded]
+    plies = sum(len(moves) for moves in recorded)
+    print(f'{args.games} games, {plies} moves per replay')
+
+    expected = None
+    for backend in sorted(BACKENDS):
+        rates = {}
+        for label, replay, games in (("make_move", replay_strings, as_strings),
+                                     ("apply_moves", replay_indices, recorded),
+                                     ("trusted", replay_trusted, recorded)):
+            best = None
+            for _ in range(args.repeat):
+                seconds, finals = replay(backend, games)
+                best = seconds if best is None else min(best, seconds)
+            if expected is None:
+                expected = finals
+            elif finals != expected:
+                raise SystemExit(f'{label} on the {backend} backend ended in a different position')
+            rates[label] = plies / best
+            print(f'{backend:>9} {label:>11}: {plies / best:12,.0f} moves/s')
+        print(f'{backend:>9}     speedup: {rates["apply_moves"] / rates["make_move"]:.2f}x checked, '
+              f'{rates["trusted"] / rates["make_move"]:.2f}x trusted')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,419 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A suite of micro-benchmarks for the core of the game, to catch a change that makes it slower. It times
+#               the is_move_legal method of every piece (short and long moves, on open and blocked paths),
+#               algebra_indices, creating a ChessVar, replaying whole games with make_move, checking for a winner and
+#               drawing the board with show_board, for every backend where it applies.
+#
+#               Each benchmark is timed as a number of samples, each one long enough for the clock to be accurate,
+#               taken in rounds of one sample of every benchmark so a moment of load on the machine doesn't land on
+#               a single benchmark. Saving a run writes every sample to a JSON baseline file. Later runs are compared
+#               against it, and a benchmark counts as a regression only when both of these hold:
+#                   - its median time grew by more than the threshold (10% by default)
+#                   - a Mann-Whitney U test says the new samples are slower than the baseline ones with a p-value under
+#                     alpha (0.01 by default), so a single noisy sample isn't enough
+#               With very few samples the test can't reach a p-value under alpha however slow the new samples are
+#               (5 on each side are needed for 0.01), so --save refuses to record fewer, and a benchmark whose
+#               baseline has too few samples anyway is judged on the threshold alone, with a warning.
+#               The run exits with status 1 if any benchmark regressed, so it can gate a change.
+#
+#               Timings depend on the machine, so make the baseline on the same machine the comparisons run on.
+#
+#               Run from the project folder with:
+#                   python -m benchmarks.suite --save           to record a baseline
+#                   python -m benchmarks.suite                  to compare against it
+#                   python -m benchmarks.suite --filter pieces  to run only the benchmarks whose name contains pieces
+
+import argparse
+import collections
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import random
+import time
+
+from ChessVar import ChessVar, BACKENDS, algebra_indices
+from bitboard import SQUARE_NAMES
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+Case = collections.namedtuple('Case', ['name', 'setup'])
+Case.__doc__ = """
+A benchmark: setup() prepares everything it needs and returns the function to time, which takes no arguments.
+"""
+
+Comparison = collections.namedtuple('Comparison', ['name', 'baseline', 'current', 'change', 'p_value', 'verdict'])
+Comparison.__doc__ = """
+How one benchmark did against the baseline.
+
+baseline: the median seconds per call in the baseline, or None if the baseline doesn't have this benchmark
+current:  the median seconds per call now
+change:   current / baseline - 1, so 0.25 is 25% slower
+p_value:  the chance of samples this much slower if nothing changed, from a one sided Mann-Whitney U test
+verdict:  "regression", "improvement", "same" or "new"
+"""
+
+# a mostly empty board, and the same board with a piece in the way of every long move
+_OPEN_FEN = "7K/8/8/8/8/8/1p3p2/r1b1q1nk w bf -"
+_BLOCKED_FEN = "7K/8/8/8/P7/2R1NB2/1p3p2/r1b1q1nk w bf -"
+
+# (name, position, start, end, what is_move_legal must return)
+_PIECE_MOVES = [
+    ('rook short open', _OPEN_FEN, 'a1', 'a2', True),
+    ('rook long open', _OPEN_FEN, 'a1', 'a8', True),
+    ('rook long blocked', _BLOCKED_FEN, 'a1', 'a8', False),
+    ('bishop short open', _OPEN_FEN, 'c1', 'd2', True),
+    ('bishop long open', _OPEN_FEN, 'c1', 'h6', True),
+    ('bishop long blocked', _BLOCKED_FEN, 'c1', 'h6', False),
+    ('queen short open', _OPEN_FEN, 'e1', 'e2', True),
+    ('queen long open', _OPEN_FEN, 'e1', 'e8', True),
+    ('queen long blocked', _BLOCKED_FEN, 'e1', 'e8', False),
+    ('queen diagonal blocked', _OPEN_FEN, 'e1', 'h4', False),
+    ('knight', _OPEN_FEN, 'g1', 'f3', True),
+    ('king', _OPEN_FEN, 'h8', 'g7', True),
+    ('pawn single step', _OPEN_FEN, 'b2', 'b3', True),
+    ('pawn double step open', _OPEN_FEN, 'f2', 'f4', True),
+    ('pawn double step blocked', _BLOCKED_FEN, 'f2', 'f4', False),
+    ('pawn capture', _BLOCKED_FEN, 'b2', 'c3', True),
+]
+
+_MIDDLE_GAME_MOVES = ['e2e4', 'b8c6', 'b1c3', 'e7e5', 'g1f3', 'g8f6', 'd2d3', 'd7d6']
+
+
+class _Discard:
+    """
+    A stand in for sys.stdout that throws away everything written, so show_board is timed without the terminal.
+    """
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _piece_case(name, fen, start, end, expected):
+    """
+    :return: a Case timing is_move_legal for the piece on start moving to end
+    """
+    def setup():
+        board = ChessVar.from_fen(fen).get_board()
+        start_indices = algebra_indices(start)
+        end_indices = algebra_indices(end)
+        piece = board[start_indices[0]][start_indices[1]]
+        if piece.is_move_legal(list(board), start_indices, end_indices) != expected:
+            raise AssertionError(f'{name}: {start}{end} is not {"legal" if expected else "illegal"} as expected')
+        is_move_legal = piece.is_move_legal
+        return lambda: is_move_legal(board, start_indices, end_indices)
+    return Case(f'pieces/{name.replace(" ", "_")}', setup)
+
+
+def record_games(count, seed, max_plies=200):
+    """
+    :parameter count: how many games to record
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :parameter max_plies: the longest a recorded game is allowed to go
+    :return: a list with one list of (start, end) moves in algebraic notation per game
+    """
+    rng = random.Random(seed)
+    recorded = []
+    for _ in range(count):
+        game = ChessVar(backend="bitboard")
+        moves = []
+        for _ in range(max_plies):
+            legal = game.legal_moves()
+            if not legal:
+                break
+            move = rng.choice(legal)
+            game.make_move(*move)
+            moves.append(move)
+        recorded.append(moves)
+    return recorded
+
+
+def _middle_game(backend):
+    game = ChessVar(backend=backend)
+    for move in _MIDDLE_GAME_MOVES:
+        if not game.make_move(move[:2], move[2:]):
+            raise AssertionError(f'{move} should be legal')
+    return game
+
+
+def _replay_case(backend, games):
+    def setup():
+        def replay():
+            for moves in games:
+                game = ChessVar(backend=backend)
+                make_move = game.make_move
+                for start, end in moves:
+                    make_move(start, end)
+        return replay
+    return Case(f'replay/{backend}', setup)
+
+
+def _show_board_case(backend):
+    def setup():
+        show_board = _middle_game(backend).show_board
+
+        def render():
+            with contextlib.redirect_stdout(_Discard()):
+                show_board()
+        return render
+    return Case(f'show_board/{backend}', setup)
+
+
+def build_cases(seed=2023):
+    """
+    :parameter seed: the seed the replayed games are recorded with
+    :return: a list of every Case in the suite
+    """
+    cases = [_piece_case(*piece_move) for piece_move in _PIECE_MOVES]
+    cases.append(Case('algebra_indices', lambda: lambda: [algebra_indices(square) for square in SQUARE_NAMES]))
+    games = record_games(20, seed)
+    for backend in BACKENDS:
+        cases.append(Case(f'construct/{backend}', lambda backend=backend: lambda: ChessVar(backend=backend)))
+        cases.append(_replay_case(backend, games))
+        cases.append(Case(f'check_winner/{backend}', lambda backend=backend: _middle_game(backend)._check_winner))
+        cases.append(_show_board_case(backend))
+    return cases
+
+
+def calibrate(function, min_time):
+    """
+    :parameter function: the function to time, called with no arguments
+    :parameter min_time: the shortest a sample may take, in seconds
+    :return: how many calls a sample needs to take at least min_time seconds, doubling from 1
+    """
+    number = 1
+    while _time_calls(function, number) < min_time:
+        number *= 2
+    return number
+
+
+def _time_calls(function, number):
+    """
+    :return: the seconds number calls of function take, with the garbage collector off like timeit does
+    """
+    perf_counter = time.perf_counter
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        begin = perf_counter()
+        for _ in range(number):
+            function()
+        return perf_counter() - begin
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def run(cases, samples=30, min_time=0.002, progress=None):
+    """
+    Times every Case as several samples. The samples are taken in rounds, one of every Case per round, so if the
+    machine slows down for a moment it costs every benchmark a sample instead of costing one benchmark all of them.
+
+    :parameter cases: the Cases to run
+    :parameter samples: how many samples to take of each
+    :parameter min_time: the shortest a sample may take, in seconds
+    :parameter progress: a function called with the number of each round before it runs, or None
+    :return: a dictionary mapping each name to {"number": calls per sample, "samples": seconds per call}
+    """
+    functions = [case.setup() for case in cases]
+    numbers = [calibrate(function, min_time) for function in functions]
+    timings = [[] for _ in cases]
+    for round_number in range(samples):
+        if progress is not None:
+            progress(round_number)
+        for function, number, case_timings in zip(functions, numbers, timings):
+            case_timings.append(_time_calls(function, number) / number)
+    return {case.name: {"number": number, "samples": case_timings}
+            for case, number, case_timings in zip(cases, numbers, timings)}
+
+
+def save_baseline(path, results):
+    """
+    Writes results from run to a JSON baseline file, along with what they were measured on.
+    """
+    document = {
+        "created": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "benchmarks": results,
+    }
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=1)
+
+
+def load_baseline(path):
+    """
+    :return: the JSON document written by save_baseline
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def mann_whitney_p(baseline, current):
+    """
+    One sided Mann-Whitney U test, with the normal approximation corrected for ties.
+
+    :parameter baseline: the baseline samples
+    :parameter current: the new samples
+    :return: the p-value for the new samples tending to be larger (slower) than the baseline ones
+    """
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    total = len(combined)
+    current_rank_sum = 0.0
+    ties = 0.0
+    position = 0
+    while position < total:
+        end = position
+        while end + 1 < total and combined[end + 1][0] == combined[position][0]:
+            end += 1
+        rank = (position + end) / 2 + 1  # tied values share the average of their ranks
+        current_rank_sum += rank * sum(group for value, group in combined[position:end + 1])
+        count = end - position + 1
+        ties += count ** 3 - count
+        position = end + 1
+
+    first, second = len(baseline), len(current)
+    u = current_rank_sum - second * (second + 1) / 2
+    mean = first * second / 2
+    variance = first * second / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def smallest_p(first, second):
+    """
+    :parameter first: the number of baseline samples
+    :parameter second: the number of new samples
+    :return: the smallest p-value mann_whitney_p can give for these sample sizes, when every new sample is slower than
+             every baseline one
+    """
+    return mann_whitney_p(range(first), range(first, first + second))
+
+
+def min_samples(alpha):
+    """
+    :return: the fewest samples on each side for which mann_whitney_p can get under alpha
+    """
+    samples = 2
+    while smallest_p(samples, samples) >= alpha:
+        samples += 1
+    return samples
+
+
+def compare(baseline, results, threshold=0.10, alpha=0.01):
+    """
+    :parameter baseline: the "benchmarks" dictionary of a baseline document
+    :parameter results: the results of run
+    :parameter threshold: how much slower the median has to get to count as a regression, 0.10 is 10%
+    :parameter alpha: the largest p-value that counts as a real change. Benchmarks with too few samples for the test
+                      to get under it are judged on the threshold alone.
+    :return: a list of Comparisons, in the order of results
+    """
+    comparisons = []
+    for name, result in results.items():
+        current = median(result["samples"])
+        if name not in baseline:
+            comparisons.append(Comparison(name, None, current, None, None, "new"))
+            continue
+        before = baseline[name]["samples"]
+        change = current / median(before) - 1
+        slower = mann_whitney_p(before, result["samples"])
+        faster = mann_whitney_p(result["samples"], before)
+        decisive = alpha if smallest_p(len(before), len(result["samples"])) < alpha else 1.0
+        if change > threshold and slower < decisive:
+            verdict = "regression"
+        elif change < -threshold and faster < decisive:
+            verdict = "improvement"
+        else:
+            verdict = "same"
+        comparisons.append(Comparison(name, median(before), current, change, min(slower, faster), verdict))
+    return comparisons
+
+
+def _format_seconds(seconds):
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:8.2f} ms'
+    return f'{seconds * 1e6:8.2f} us'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="micro-benchmarks compared against a stored baseline")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON file (default: %(default)s)')
+    parser.add_argument('--save', action='store_true', help='write this run as the new baseline instead of comparing')
+    parser.add_argument('--filter', default='', help='only run the benchmarks whose name contains this')
+    parser.add_argument('--samples', type=int, default=30, help='samples taken of each benchmark')
+    parser.add_argument('--min-time', type=float, default=0.002, help='shortest a sample may take, in seconds')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='how much slower the median has to get to count as a regression (default: 0.10)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='largest p-value that counts as a real change')
+    parser.add_argument('--list', action='store_true', help='list the benchmark names and stop')
+    args = parser.parse_args()
+
+    cases = [case for case in build_cases() if args.filter in case.name]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return
+    if not cases:
+        raise SystemExit(f'no benchmark name contains {args.filter!r}')
+    needed = min_samples(args.alpha)
+    if args.save and args.samples < needed:
+        raise SystemExit(f'--samples must be at least {needed} for a comparison to reach --alpha {args.alpha}')
+    if args.samples < 2:
+        raise SystemExit('--samples must be at least 2')
+
+    width = max(len(case.name) for case in cases)
+    results = run(cases, args.samples, args.min_time)
+
+    if args.save:
+        if args.filter and os.path.exists(args.baseline):
+            # keep the benchmarks this run skipped
+            merged = load_baseline(args.baseline)["benchmarks"]
+            merged.update(results)
+            results = merged
+        save_baseline(args.baseline, results)
+        for name, result in results.items():
+            print(f'{name:<{width}}  {_format_seconds(median(result["samples"]))}')
+        print(f'saved {len(results)} benchmarks to {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        for name, result in results.items():
+            print(f'{name:<{width}}  {_format_seconds(median(result["samples"]))}')
+        print(f'no baseline at {args.baseline}, run with --save to record one')
+        return
+
+    baseline = load_baseline(args.baseline)["benchmarks"]
+    for name, result in results.items():
+        if name in baseline and smallest_p(len(baseline[name]["samples"]), len(result["samples"])) >= args.alpha:
+            print(f'warning: {name} has too few samples for alpha {args.alpha}, so only the threshold is used for it')
+    comparisons = compare(baseline, results, args.threshold, args.alpha)
+    for comparison in comparisons:
+        if comparison.baseline is None:
+            print(f'{comparison.name:<{width}}  {"":>11}  {_format_seconds(comparison.current)}  new')
+            continue
+        print(f'{comparison.name:<{width}}  {_format_seconds(comparison.baseline)}  '
+              f'{_format_seconds(comparison.current)}  {comparison.change:+7.1%}  p={comparison.p_value:.3f}  '
+              f'{comparison.verdict}')
+    regressions = [comparison.name for comparison in comparisons if comparison.verdict == "regression"]
+    if regressions:
+        raise SystemExit(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+    print('no regressions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Precomputed 64-bit move tables used by the bitboard backend of ChessVar. Every square is numbered the
+#               same way the list of lists board is laid out: square = row * 8 + column, so a8 is 0, h8 is 7, a1 is 56
+#               and h1 is 63. A bitboard is a python int where bit n is set when square n is occupied.
+#
+#               The tables reproduce the rules exactly as the ChessPiece.is_move_legal methods implement them, so
+#               both backends always agree on which moves are legal.
+
+WHITE_NAMES = 'kqrbnp'
+BLACK_NAMES = 'KQRBNP'
+PIECE_NAMES = 'KQRBNPkqrbnp'
+
+# maps a piece name to its color ("BLACK" for capital letters, "WHITE" for lowercase)
+NAME_COLOR = {name: "BLACK" for name in BLACK_NAMES}
+NAME_COLOR.update({name: "WHITE" for name in WHITE_NAMES})
+
+# square names in board order and the reverse lookup. EX: SQUARE_NAMES[0] is 'a8' and SQUARE_INDEX['a8'] is 0
+SQUARE_NAMES = [chr(97 + column) + str(8 - row) for row in range(8) for column in range(8)]
+SQUARE_INDEX = {name: square for square, name in enumerate(SQUARE_NAMES)}
+SQUARE_INDICES = [(square // 8, square % 8) for square in range(64)]  # (row, column) on the list of lists board
+
+
+def _on_board(row, column):
+    """
+    :return: True if the row and column are both between 0 and 7
+    """
+    return 0 <= row < 8 and 0 <= column < 8
+
+
+def _mask_from_deltas(square, deltas):
+    """
+    Builds a bitboard of every square reachable from square by one of the (delta_y, delta_x) steps.
+
+    :parameter square: the starting square as an index from 0 to 63
+    :parameter deltas: an iterable of (delta_y, delta_x) tuples
+    :return: the bitboard of all the on-board destination squares
+    """
+    row, column = divmod(square, 8)
+    mask = 0
+    for delta_y, delta_x in deltas:
+        if _on_board(row + delta_y, column + delta_x):
+            mask |= 1 << ((row + delta_y) * 8 + column + delta_x)
+    return mask
+
+
+def _knight_deltas():
+    """
+    Knight.is_move_legal only rejects a move when one of the deltas is 1 or 2 and the other one isn't its "L" partner,
+    so on top of the usual eight jumps a knight may also land on any square where neither delta is 1 or 2.
+
+    :return: a list of every (delta_y, delta_x) the knight is allowed to make
+    """
+    deltas = []
+    for delta_y in range(-7, 8):
+        for delta_x in range(-7, 8):
+            if delta_y == 0 and delta_x == 0:
+                continue
+            if abs(delta_x) == 1 and abs(delta_y) != 2:
+                continue
+            if abs(delta_x) == 2 and abs(delta_y) != 1:
+                continue
+            if abs(delta_y) == 1 and abs(delta_x) != 2:
+                continue
+            if abs(delta_y) == 2 and abs(delta_x) != 1:
+                continue
+            deltas.append((delta_y, delta_x))
+    return deltas
+
+
+def _between(start, end):
+    """
+    Builds the bitboard of the squares a sliding piece must find empty when moving from start to end.
+
+    Matches Rook, Bishop and Queen.is_move_legal: straight lines check every square in between, diagonals going to the
+    right check every square in between, and diagonals going to the left are never checked for obstructions.
+
+    :parameter start: the starting square as an index from 0 to 63
+    :parameter end: the ending square as an index from 0 to 63
+    :return: the bitboard of squares in between, or 0 if the squares aren't on a shared line
+    """
+    start_row, start_column = divmod(start, 8)
+    end_row, end_column = divmod(end, 8)
+    delta_x = end_column - start_column
+    delta_y = end_row - start_row
+
+    if start == end:
+        return 0
+    if delta_x != 0 and delta_y != 0 and abs(delta_x) != abs(delta_y):
+        return 0
+    if delta_x < 0 and delta_y != 0:  # diagonal going left, the pieces don't check these squares
+        return 0
+
+    step_y = (delta_y > 0) - (delta_y < 0)
+    step_x = (delta_x > 0) - (delta_x < 0)
+    mask = 0
+    row, column = start_row + step_y, start_column + step_x
+    while (row, column) != (end_row, end_column):
+        mask |= 1 << (row * 8 + column)
+        row, column = row + step_y, column + step_x
+    return mask
+
+
+KING_MOVES = [_mask_from_deltas(square, [(y, x) for y in (-1, 0, 1) for x in (-1, 0, 1) if y or x])
+              for square in range(64)]
+
+KNIGHT_MOVES = [_mask_from_deltas(square, _knight_deltas()) for square in range(64)]
+
+# every square on the same row or column / the same diagonal, not including the square itself
+ROOK_LINES = [_mask_from_deltas(square, [(y, 0) for y in range(-7, 8) if y] + [(0, x) for x in range(-7, 8) if x])
+              for square in range(64)]
+BISHOP_LINES = [_mask_from_deltas(square, [(d * sy, d * sx) for d in range(1, 8) for sy in (-1, 1) for sx in (-1, 1)])
+                for square in range(64)]
+
+# BETWEEN[start * 64 + end] is the bitboard of squares that must be empty for a slider to go from start to end
+BETWEEN = [_between(start, end) for start in range(64) for end in range(64)]
+
+# pawn tables are indexed by color. White pawns move up the board (towards row 0), black pawns move down.
+PAWN_DIRECTION = {"WHITE": -1, "BLACK": 1}
+
+# one square diagonally forward, the only moves that need a piece in the end square
+PAWN_CAPTURES = {color: [_mask_from_deltas(square, [(step, -1), (step, 1)]) for square in range(64)]
+                 for color, step in PAWN_DIRECTION.items()}
+
+# moves that need an empty end square: sideways by one or two, or forward by one while shifting zero or two columns
+PAWN_STEPS = {color: [_mask_from_deltas(square, [(0, -2), (0, -1), (0, 1), (0, 2), (step, -2), (step, 0), (step, 2)])
+                      for square in range(64)]
+              for color, step in PAWN_DIRECTION.items()}
+
+# two rows forward while shifting up to two columns, only allowed on the pawns first move with an empty front square
+PAWN_DOUBLE_STEPS = {color: [_mask_from_deltas(square, [(2 * step, x) for x in range(-2, 3)]) for square in range(64)]
+                     for color, step in PAWN_DIRECTION.items()}
+PAWN_FRONT = {color: [_mask_from_deltas(square, [(step, 0)]) for square in range(64)]
+              for color, step in PAWN_DIRECTION.items()}
+
+
+# ray tables, RAYS[direction][square] is every square from square to the edge of the board in that direction. The
+# directions are given as (delta_y, delta_x). Going up the board (delta_y of -1) lowers the square index.
+NORTH, SOUTH, EAST, WEST = (-1, 0), (1, 0), (0, 1), (0, -1)
+NORTH_EAST, SOUTH_EAST, NORTH_WEST, SOUTH_WEST = (-1, 1), (1, 1), (-1, -1), (1, -1)
+RAYS = {direction: [_mask_from_deltas(square, [(d * direction[0], d * direction[1]) for d in range(1, 8)])
+                    for square in range(64)]
+        for direction in (NORTH, SOUTH, EAST, WEST, NORTH_EAST, SOUTH_EAST, NORTH_WEST, SOUTH_WEST)}
+
+# directions where the square index goes up / down as the piece slides, used to find the first blocker on a ray
+INCREASING_RAYS = [RAYS[direction] for direction in (SOUTH, EAST, SOUTH_EAST)]
+DECREASING_RAYS = [RAYS[direction] for direction in (NORTH, WEST, NORTH_EAST)]
+
+# the diagonals going left never check for obstructions, so every square on them can be reached
+ROOK_INCREASING_RAYS = [RAYS[SOUTH], RAYS[EAST]]
+ROOK_DECREASING_RAYS = [RAYS[NORTH], RAYS[WEST]]
+BISHOP_INCREASING_RAYS = [RAYS[SOUTH_EAST]]
+BISHOP_DECREASING_RAYS = [RAYS[NORTH_EAST]]
+UNBLOCKED_DIAGONALS = [RAYS[NORTH_WEST][square] | RAYS[SOUTH_WEST][square] for square in range(64)]
+
+
+def _slide(square, occupied, increasing, decreasing):
+    """
+    :parameter square: the square the slider is on
+    :parameter occupied: the bitboard of every occupied square
+    :parameter increasing: ray tables that go towards higher square indices
+    :parameter decreasing: ray tables that go towards lower square indices
+    :return: the bitboard of squares reached along the rays, stopping on (and including) the first occupied square
+    """
+    targets = 0
+    for rays in increasing:
+        ray = rays[square]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        targets |= ray
+    for rays in decreasing:
+        ray = rays[square]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        targets |= ray
+    return targets
+
+
+def rook_targets(square, occupied):
+    """
+    :return: the bitboard of squares a rook on square can move to (including squares holding any piece)
+    """
+    return _slide(square, occupied, ROOK_INCREASING_RAYS, ROOK_DECREASING_RAYS)
+
+
+def bishop_targets(square, occupied):
+    """
+    :return: the bitboard of squares a bishop on square can move to (including squares holding any piece)
+    """
+    return _slide(square, occupied, BISHOP_INCREASING_RAYS, BISHOP_DECREASING_RAYS) | UNBLOCKED_DIAGONALS[square]
+
+
+def queen_targets(square, occupied):
+    """
+    :return: the bitboard of squares a queen on square can move to (including squares holding any piece)
+    """
+    return _slide(square, occupied, INCREASING_RAYS, DECREASING_RAYS) | UNBLOCKED_DIAGONALS[square]
+
+
+def pawn_targets(color, square, occupied, unmoved):
+    """
+    :parameter color: the color of the pawn, "WHITE" or "BLACK"
+    :parameter square: the square the pawn is on
+    :parameter occupied: the bitboard of every occupied square
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :return: the bitboard of squares the pawn can move to (including diagonal squares holding its own pieces)
+    """
+    targets = (PAWN_CAPTURES[color][square] & occupied) | (PAWN_STEPS[color][square] & ~occupied)
+    if unmoved >> square & 1 and not PAWN_FRONT[color][square] & occupied:
+        targets |= PAWN_DOUBLE_STEPS[color][square] & ~occupied
+    return targets
+
+
+def piece_targets(name, square, occupied, unmoved):
+    """
+    Finds every square the piece called name could move to following its movement rules. Just like
+    ChessPiece.is_move_legal, this does not look at the color of the piece in the end square.
+
+    :parameter name: the name of the piece, EX: 'N' or 'p'
+    :parameter square: the square the piece is on
+    :parameter occupied: the bitboard of every occupied square
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :return: the bitboard of reachable squares
+    """
+    kind = name.upper()
+    if kind == 'N':
+        return KNIGHT_MOVES[square]
+    if kind == 'K':
+        return KING_MOVES[square]
+    if kind == 'P':
+        return pawn_targets(NAME_COLOR[name], square, occupied, unmoved)
+    if kind == 'R':
+        return rook_targets(square, occupied)
+    if kind == 'B':
+        return bishop_targets(square, occupied)
+    return queen_targets(square, occupied)
+
+
+def squares_of(bitboard):
+    """
+    :return: a list of the indices of every set bit in the bitboard, lowest first
+    """
+    squares = []
+    while bitboard:
+        low_bit = bitboard & -bitboard
+        squares.append(low_bit.bit_length() - 1)
+        bitboard ^= low_bit
+    return squares
+
+
+def generate_moves(squares, own, enemy, unmoved, only_from=None):
+    """
+    Lists every legal move for the side that owns the pieces in own.
+
+    :parameter squares: a list of 64 piece names (or None)
+    :parameter own: the bitboard of squares holding the moving sides pieces
+    :parameter enemy: the bitboard of squares holding the other sides pieces
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :parameter only_from: if given, only moves starting on this square are listed
+    :return: a list of (start, end) square index tuples
+    """
+    occupied = own | enemy
+    movers = own if only_from is None else own & 1 << only_from
+    moves = []
+    for start in squares_of(movers):
+        for end in squares_of(piece_targets(squares[start], start, occupied, unmoved) & ~own):
+            moves.append((start, end))
+    return moves
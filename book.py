@@ -0,0 +1,217 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  An opening book built from recorded games. The first plies of every game are replayed, and for each
+#               position reached the book counts how often each move was played from it and how the games went for the
+#               player who played it. Positions are keyed by their Zobrist hash, so a position reached by different
+#               move orders shares one entry.
+#
+#               The book is written as a sorted key file (see keyfile.py) with one record per position and move, the
+#               most played move first. It is memory-mapped when opened, so nothing is loaded up front, a lookup is a
+#               binary search touching a few pages, and every worker process opening the same book shares its pages.
+#
+#               Run from the project folder with:
+#                   python book.py build BOOK GAMES [GAMES ...] [--plies N] [--min-games N]
+#                   python book.py probe BOOK [--moves e2e4 ...]
+#               GAMES can be selfplay.py JSON lines or records.py archives.
+
+import argparse
+import collections
+import json
+import random
+import struct
+
+from ChessVar import ChessVar
+from bitboard import SQUARE_INDEX, SQUARE_NAMES
+from keyfile import KeyFile, write_keyfile
+from records import MAGIC as ARCHIVE_MAGIC, decode_position, read_games
+
+MAGIC = b'CVBOOK01'
+_VALUE_FORMAT = 'HIII'  # start * 64 + end, games, wins, losses
+_HEADER = struct.Struct('<QH')  # games read, plies
+
+BookMove = collections.namedtuple('BookMove', ['move', 'games', 'wins', 'draws', 'losses'])
+BookMove.__doc__ = """
+A move the book knows for a position.
+
+move:   the (start, end) move in algebraic notation
+games:  how many games played it from this position
+wins:   how many of them the player who played it went on to win
+draws:  how many of them nobody won
+losses: how many of them the player who played it went on to lose
+"""
+
+
+def read_game_moves(path):
+    """
+    Reads the games of a file of either kind.
+
+    :parameter path: a selfplay.py JSON lines file or a records.py archive
+    :return: a generator of (start position or None, list of (start, end) square index moves, final game state)
+    """
+    with open(path, 'rb') as file:
+        is_archive = file.read(len(ARCHIVE_MAGIC)) == ARCHIVE_MAGIC
+    if is_archive:
+        for record in read_games(path):
+            moves = [(SQUARE_INDEX[start], SQUARE_INDEX[end]) for start, end in record.moves]
+            yield record.start, moves, record.game_state
+        return
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                result = json.loads(line)
+                moves = [(SQUARE_INDEX[move[:2]], SQUARE_INDEX[move[-2:]]) for move in result['moves']]
+                yield None, moves, result['winner']
+
+
+def count_moves(games, plies=16):
+    """
+    Replays the opening of every game and counts the moves played from each position.
+
+    :parameter games: an iterable of (start position or None, moves, final game state), see read_game_moves
+    :parameter plies: how many plies of each game to count
+    :return: (number of games read, dictionary mapping (hash, start * 64 + end) to [games, wins, losses])
+    """
+    counts = {}
+    read = 0
+    for start, moves, game_state in games:
+        read += 1
+        if start is None:
+            game = ChessVar(backend="bitboard")
+        else:
+            game = ChessVar._from_position(*decode_position(start), backend="bitboard")
+        for move in moves[:plies]:
+            key = game.get_hash()
+            turn = game.get_turn()
+            if not game.make_move_idx(*move):
+                break
+            entry = counts.get((key, move[0] * 64 + move[1]))
+            if entry is None:
+                entry = counts[key, move[0] * 64 + move[1]] = [0, 0, 0]
+            entry[0] += 1
+            if game_state == turn + "_WON":
+                entry[1] += 1
+            elif game_state != "UNFINISHED":
+                entry[2] += 1
+    return read, counts
+
+
+def build_book(path, sources, plies=16, min_games=1):
+    """
+    Builds a book from files of recorded games.
+
+    :parameter path: the book file to write
+    :parameter sources: a list of selfplay.py JSON lines files or records.py archives
+    :parameter plies: how many plies of each game to put in the book
+    :parameter min_games: moves played in fewer games than this are left out
+    :return: (number of games read, number of records written)
+    """
+    read = 0
+    counts = {}
+    for source in sources:
+        source_read, source_counts = count_moves(read_game_moves(source), plies)
+        read += source_read
+        for move_key, entry in source_counts.items():
+            total = counts.get(move_key)
+            if total is None:
+                counts[move_key] = entry
+            else:
+                for number in range(3):
+                    total[number] += entry[number]
+
+    # write_keyfile keeps the order of records with the same key, so sorting by games first puts the most played move
+    # of each position first
+    items = sorted(((key, (code, games, wins, losses))
+                    for (key, code), (games, wins, losses) in counts.items() if games >= min_games),
+                   key=lambda item: -item[1][1])
+    return read, write_keyfile(path, MAGIC, _VALUE_FORMAT, items, _HEADER.pack(read, plies))
+
+
+class OpeningBook:
+    """
+    A book file opened for lookups. Opening it only maps the file, so it is cheap to open one in every worker process.
+
+    games: how many games the book was built from
+    plies: how many plies of each game it holds
+    """
+    def __init__(self, path):
+        self._file = KeyFile(path, MAGIC, _VALUE_FORMAT)
+        self.games, self.plies = _HEADER.unpack(self._file.header)
+
+    def __len__(self):
+        return len(self._file)
+
+    def moves_for_key(self, key):
+        """
+        :parameter key: the Zobrist hash of a position, from ChessVar.get_hash
+        :return: a list of BookMoves for the position, the most played first, empty if it isn't in the book
+        """
+        book_moves = []
+        for code, games, wins, losses in self._file.get_all(key):
+            book_moves.append(BookMove((SQUARE_NAMES[code >> 6], SQUARE_NAMES[code & 63]), games, wins,
+                                       games - wins - losses, losses))
+        return book_moves
+
+    def moves(self, game):
+        """
+        :parameter game: a ChessVar of any backend
+        :return: a list of BookMoves for its current position, the most played first, empty if it isn't in the book
+        """
+        return self.moves_for_key(game.get_hash())
+
+    def choose(self, game, rng=random):
+        """
+        Picks a book move at random, weighted by how often each was played.
+
+        :parameter game: a ChessVar of any backend
+        :parameter rng: the random.Random to pick with
+        :return: the (start, end) move in algebraic notation, or None if the position isn't in the book
+        """
+        book_moves = self.moves(game)
+        if not book_moves:
+            return None
+        return rng.choices(book_moves, [book_move.games for book_move in book_moves])[0].move
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="build and probe opening books")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build a book from recorded games')
+    build.add_argument('path', help='book file to write')
+    build.add_argument('sources', nargs='+', help='selfplay.py JSON lines files or records.py archives')
+    build.add_argument('--plies', type=int, default=16, help='plies of each game to put in the book')
+    build.add_argument('--min-games', type=int, default=1, help='leave out moves played in fewer games')
+    probe = commands.add_parser('probe', help='list the book moves of a position')
+    probe.add_argument('path', help='book file to read')
+    probe.add_argument('--moves', nargs='*', default=[], help='moves to play from the start first, EX: e2e4')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        read, written = build_book(args.path, args.sources, args.plies, args.min_games)
+        print(f'{read} games, {written} book moves')
+        return
+
+    game = ChessVar(backend="bitboard")
+    for move in args.moves:
+        if not game.make_move(move[:2], move[-2:]):
+            raise SystemExit(f'illegal move: {move}')
+    with OpeningBook(args.path) as book:
+        book_moves = book.moves(game)
+    if not book_moves:
+        print('not in the book')
+    for book_move in book_moves:
+        print(f'{"".join(book_move.move)}  {book_move.games} games  +{book_move.wins} ={book_move.draws} '
+              f'-{book_move.losses}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Lets pytest import the modules of the project folder from the tests folder.
+#
+#               Run from the project folder with:  python -m pytest -q
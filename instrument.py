@@ -0,0 +1,293 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Opt-in counters and timings for finding out where ChessVar spends its time. Nothing is measured until
+#               enable() is called, and until then the ChessVar code runs untouched, so leaving this module imported
+#               costs nothing. enable() swaps the measured methods for wrappers that count each call and add up the time
+#               it took, and disable() puts the original methods back.
+#
+#               Three kinds of numbers are kept:
+#                   methods:  calls and seconds of each ChessVar method, each ChessPiece.is_move_legal and the square
+#                             conversion functions, labelled with the class that defines the method. A methods time
+#                             includes the time of everything it calls, so make_move includes make_move_idx, which
+#                             includes is_legal_idx.
+#                   pieces:   calls and seconds of is_legal_idx for each type of piece being moved, on any backend
+#                   rejects:  how often is_legal_idx turned a move down, by reason (see REJECT_REASONS)
+#
+#               The numbers belong to the process that collected them, so each worker of a pool keeps its own. Use
+#               snapshot() to read them, to_json() or to_prometheus() to export them, or serve_metrics() to let
+#               Prometheus scrape them from a long running worker:
+#                   import instrument
+#                   instrument.enable()
+#                   instrument.serve_metrics(9100)     # http://localhost:9100/metrics, or /metrics.json
+
+import collections
+import http.server
+import json
+import threading
+import time
+
+import ChessVar as chess_module
+from bitboard import NAME_COLOR, SQUARE_INDICES, PAWN_CAPTURES, PAWN_STEPS, PAWN_DOUBLE_STEPS, piece_targets
+
+# why is_legal_idx turned a move down
+REJECT_REASONS = ('game_over', 'empty_start', 'same_square', 'wrong_turn', 'illegal_pattern', 'blocked_path',
+                  'own_piece')
+
+PIECE_TYPES = {'K': 'King', 'Q': 'Queen', 'R': 'Rook', 'B': 'Bishop', 'N': 'Knight', 'P': 'Pawn'}
+
+_GAME_METHODS = ('make_move', 'make_move_idx', 'is_legal', 'is_legal_idx', 'are_legal', 'apply_moves', 'push_move',
+                 'push_move_idx', 'pop_move', 'legal_moves', 'legal_moves_idx', 'legal_moves_from', 'fork',
+                 '_check_winner')
+_MODULE_FUNCTIONS = ('algebra_indices', 'square_index')
+
+_calls = collections.Counter()
+_seconds = collections.Counter()
+_piece_calls = collections.Counter()
+_piece_seconds = collections.Counter()
+_rejects = collections.Counter()
+_originals = []  # (owner, attribute name, original value) for everything enable() replaced
+_lock = threading.Lock()
+
+
+def _timed(label, function):
+    """
+    :return: a wrapper around function that counts its calls and time under label
+    """
+    perf_counter = time.perf_counter
+
+    def wrapper(*args, **kwargs):
+        begin = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _seconds[label] += perf_counter() - begin
+            _calls[label] += 1
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = getattr(function, '__name__', label)
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _piece_name(game, square):
+    """
+    :return: the name of the piece on the square of any backend, or None
+    """
+    squares = getattr(game, '_squares', None)
+    if squares is not None:
+        return squares[square]
+    if isinstance(game._board, bytearray):
+        return chess_module.CODE_NAMES[game._board[square]]
+    row, column = SQUARE_INDICES[square]
+    piece = game._board[row][column]
+    return None if piece is None else piece.get_name()
+
+
+def reject_reason(game, start_square, end_square):
+    """
+    Works out why is_legal_idx turns a move down. Only used while instrumentation is on, since it repeats the checks.
+
+    :parameter game: a ChessVar of any backend
+    :parameter start_square: the index of the square the piece moves from
+    :parameter end_square: the index of the square the piece moves to
+    :return: one of REJECT_REASONS
+    """
+    if game.get_game_state() != "UNFINISHED":
+        return 'game_over'
+    name = _piece_name(game, start_square)
+    if name is None:
+        return 'empty_start'
+    if start_square == end_square:
+        return 'same_square'
+    color = NAME_COLOR[name]
+    if color != game.get_turn():
+        return 'wrong_turn'
+    end_bit = 1 << end_square
+    squares, occupied, unmoved = game.get_position()
+    occupied = occupied["WHITE"] | occupied["BLACK"]
+    if name in 'Pp':
+        # a pawn only moves diagonally onto a piece, and only steps twice before it has moved, so those moves are
+        # against the pattern otherwise. Steps onto a piece or over one are blocked.
+        pattern = PAWN_STEPS[color][start_square] | PAWN_CAPTURES[color][start_square] & occupied
+        if unmoved >> start_square & 1:
+            pattern |= PAWN_DOUBLE_STEPS[color][start_square]
+    else:
+        pattern = piece_targets(name, start_square, 0, 0)
+    if not pattern & end_bit:
+        return 'illegal_pattern'
+    if not piece_targets(name, start_square, occupied, unmoved) & end_bit:
+        return 'blocked_path'
+    return 'own_piece'
+
+
+def _checked(label, function):
+    """
+    :return: a wrapper around an is_legal_idx method that also counts each piece type and every reject reason
+    """
+    perf_counter = time.perf_counter
+
+    def wrapper(game, start_square, end_square):
+        begin = perf_counter()
+        legal = function(game, start_square, end_square)
+        seconds = perf_counter() - begin
+        _seconds[label] += seconds
+        _calls[label] += 1
+        name = _piece_name(game, start_square)
+        if name is not None:
+            piece = PIECE_TYPES[name.upper()]
+            _piece_calls[piece] += 1
+            _piece_seconds[piece] += seconds
+        if not legal:
+            _rejects[reject_reason(game, start_square, end_square)] += 1
+        return legal
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _replace(owner, attribute, wrapper):
+    _originals.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, wrapper)
+
+
+def enable():
+    """
+    Starts measuring. Calling it again while enabled does nothing.
+    """
+    with _lock:
+        if _originals:
+            return
+        for cls in chess_module.BACKENDS.values():
+            for attribute in _GAME_METHODS:
+                if attribute in vars(cls):
+                    label = f'{cls.__name__}.{attribute}'
+                    method = vars(cls)[attribute]
+                    if attribute == 'is_legal_idx':
+                        _replace(cls, attribute, _checked(label, method))
+                    else:
+                        _replace(cls, attribute, _timed(label, method))
+        for cls in chess_module.PIECE_CLASSES.values():
+            _replace(cls, 'is_move_legal', _timed(f'{cls.__name__}.is_move_legal', vars(cls)['is_move_legal']))
+        for attribute in _MODULE_FUNCTIONS:
+            _replace(chess_module, attribute, _timed(attribute, getattr(chess_module, attribute)))
+
+
+def disable():
+    """
+    Stops measuring and puts every original method back. The numbers collected so far are kept.
+    """
+    with _lock:
+        while _originals:
+            owner, attribute, original = _originals.pop()
+            setattr(owner, attribute, original)
+
+
+def is_enabled():
+    """
+    :return: True while measuring
+    """
+    return bool(_originals)
+
+
+def reset():
+    """
+    Clears every number collected so far.
+    """
+    for counter in (_calls, _seconds, _piece_calls, _piece_seconds, _rejects):
+        counter.clear()
+
+
+class instrumented:
+    """
+    A context manager that measures only inside its block.
+    EX: with instrument.instrumented(): game.legal_moves()
+    """
+    def __enter__(self):
+        self._was_enabled = is_enabled()
+        enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self._was_enabled:
+            disable()
+
+
+def snapshot():
+    """
+    :return: a dictionary of everything measured so far: {'enabled': bool, 'methods': {label: {'calls', 'seconds'}},
+             'pieces': {type: {'calls', 'seconds'}}, 'rejects': {reason: count}}
+    """
+    methods = {label: {'calls': _calls[label], 'seconds': _seconds[label]} for label in sorted(_calls)}
+    pieces = {piece: {'calls': _piece_calls[piece], 'seconds': _piece_seconds[piece]} for piece in sorted(_piece_calls)}
+    return {'enabled': is_enabled(), 'methods': methods, 'pieces': pieces,
+            'rejects': {reason: _rejects[reason] for reason in REJECT_REASONS}}
+
+
+def to_json(data=None):
+    """
+    :parameter data: a snapshot to export, defaults to a new one
+    :return: the snapshot as a JSON string
+    """
+    return json.dumps(snapshot() if data is None else data, sort_keys=True)
+
+
+def to_prometheus(data=None):
+    """
+    :parameter data: a snapshot to export, defaults to a new one
+    :return: the snapshot in the Prometheus text exposition format
+    """
+    data = snapshot() if data is None else data
+    lines = []
+
+    def family(name, help_text, label, values):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for key, value in values:
+            lines.append(f'{name}{{{label}="{key}"}} {value}')
+
+    family('chessvar_method_calls_total', 'Calls of each measured ChessVar method.', 'method',
+           [(label, stats['calls']) for label, stats in data['methods'].items()])
+    family('chessvar_method_seconds_total', 'Seconds spent in each measured ChessVar method, including callees.',
+           'method', [(label, repr(stats['seconds'])) for label, stats in data['methods'].items()])
+    family('chessvar_piece_checks_total', 'Moves checked by is_legal_idx for each type of piece.', 'piece',
+           [(piece, stats['calls']) for piece, stats in data['pieces'].items()])
+    family('chessvar_piece_seconds_total', 'Seconds is_legal_idx spent checking moves of each type of piece.', 'piece',
+           [(piece, repr(stats['seconds'])) for piece, stats in data['pieces'].items()])
+    family('chessvar_rejects_total', 'Moves is_legal_idx turned down, by reason.', 'reason',
+           list(data['rejects'].items()))
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/metrics':
+            body, kind = to_prometheus().encode(), 'text/plain; version=0.0.4'
+        elif self.path == '/metrics.json':
+            body, kind = to_json().encode(), 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', kind)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_metrics(port, host='127.0.0.1'):
+    """
+    Serves /metrics (Prometheus text) and /metrics.json from a background thread.
+
+    :parameter port: the port to listen on
+    :parameter host: the address to listen on
+    :return: the http.server.ThreadingHTTPServer, call shutdown() on it to stop
+    """
+    server = http.server.ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
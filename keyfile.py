@@ -0,0 +1,135 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A read-only file of fixed size records sorted by a 64-bit key, used to store tables keyed by the Zobrist
+#               hash of a position (see tablebase.py and book.py). The file is memory-mapped and searched in place, so
+#               opening it is instant, only the pages that are probed get loaded, and every process reading the same
+#               file shares them.
+#
+#               Layout, all little endian:
+#                   8 bytes   the magic of the kind of table
+#                   4 bytes   the length of the extra header
+#                   8 bytes   the number of records
+#                   N bytes   the extra header, whatever the table wants to remember about how it was made
+#                   records   8 byte key followed by the value, sorted by key. Several records may share a key.
+
+import mmap
+import os
+import struct
+
+_PREFIX = struct.Struct('<8sIQ')
+
+
+def write_keyfile(path, magic, value_format, items, header=b''):
+    """
+    Sorts the items by key and writes them to a new file.
+
+    :parameter path: the file to write
+    :parameter magic: 8 bytes naming the kind of table
+    :parameter value_format: the struct format of a value without the byte order, EX: 'HH'
+    :parameter items: an iterable of (key, value tuple) pairs
+    :parameter header: extra bytes to store after the header
+    :return: the number of records written
+    """
+    record = struct.Struct('<Q' + value_format)
+    items = sorted(items, key=lambda item: item[0])
+    with open(path, 'wb') as file:
+        file.write(_PREFIX.pack(magic, len(header), len(items)))
+        file.write(header)
+        file.write(b''.join(record.pack(key, *value) for key, value in items))
+    return len(items)
+
+
+class KeyFile:
+    """
+    Looks up records by key with a binary search over the memory-mapped file, O(log n) per probe.
+    """
+    def __init__(self, path, magic, value_format):
+        """
+        :parameter path: the file to open
+        :parameter magic: the magic the file must start with
+        :parameter value_format: the struct format of a value, the same one it was written with
+        """
+        self._record = struct.Struct('<Q' + value_format)
+        self._key = struct.Struct('<Q')
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        if len(self._data) < _PREFIX.size:
+            self.close()
+            raise ValueError(f'{path} is too short to be a table')
+        file_magic, header_size, self._count = _PREFIX.unpack_from(self._data, 0)
+        if file_magic != magic:
+            self.close()
+            raise ValueError(f'{path} is not a {magic.decode(errors="replace")} table')
+        self.header = bytes(self._data[_PREFIX.size:_PREFIX.size + header_size])
+        self._start = _PREFIX.size + header_size
+        if len(self._data) != self._start + self._count * self._record.size:
+            self.close()
+            raise ValueError(f'{path} is truncated')
+
+    def __len__(self):
+        return self._count
+
+    def _lower_bound(self, key):
+        """
+        :return: the index of the first record whose key is not less than key
+        """
+        unpack_key = self._key.unpack_from
+        data = self._data
+        start = self._start
+        size = self._record.size
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            if unpack_key(data, start + middle * size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, key):
+        """
+        :parameter key: the 64-bit key to look up
+        :return: the value tuple of the first record with that key, or None
+        """
+        index = self._lower_bound(key)
+        if index == self._count:
+            return None
+        record = self._record.unpack_from(self._data, self._start + index * self._record.size)
+        return record[1:] if record[0] == key else None
+
+    def get_all(self, key):
+        """
+        :parameter key: the 64-bit key to look up
+        :return: a list of the value tuples of every record with that key, in file order
+        """
+        values = []
+        index = self._lower_bound(key)
+        while index < self._count:
+            record = self._record.unpack_from(self._data, self._start + index * self._record.size)
+            if record[0] != key:
+                break
+            values.append(record[1:])
+            index += 1
+        return values
+
+    def __iter__(self):
+        """
+        :return: a generator of (key, value tuple) for every record, in key order
+        """
+        for index in range(self._count):
+            record = self._record.unpack_from(self._data, self._start + index * self._record.size)
+            yield record[0], record[1:]
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
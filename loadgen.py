@@ -0,0 +1,243 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A load generator for server.py. It opens pairs of connections and keeps a number of games going
+#               between each pair, one connection playing white and the other black, both picking random legal moves.
+#               Spectator connections can be added to watch every game as well.
+#
+#               Every client keeps its own copy of each board using only the "moved" messages from the server and
+#               checks that its copy agrees with the server after every move, so a run also proves the deltas are
+#               enough to follow a game. When a game finishes (or reaches --max-plies) both players leave it and a new
+#               one is started in its place, until the time is up.
+#
+#               Run from the project folder with:
+#                   python loadgen.py [--games 2000] [--pairs 20] [--spectators 0] [--seconds 10] [--serve]
+#               --serve starts the server in a separate process first, otherwise a running server.py is used.
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+
+from ChessVar import ChessVar
+from bitboard import SQUARE_INDEX, SQUARE_NAMES
+from server import DEFAULT_PORT, encode, serve
+
+
+class LoadStats:
+    """
+    Counts collected across every client of a run.
+    """
+    def __init__(self):
+        self.moves = 0
+        self.games = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.mismatches = 0
+        self.latencies = []
+
+
+class LoadClient:
+    """
+    One connection to the server, playing or watching any number of games.
+
+    mirrors: the clients own copy of each game it is in, by game number
+    colors:  the color this client plays in each game, missing for games it watches
+    """
+    def __init__(self, reader, writer, stats, rng, max_plies, retry_delay):
+        self._reader = reader
+        self._writer = writer
+        self._stats = stats
+        self._rng = rng
+        self._max_plies = max_plies
+        self._retry_delay = retry_delay
+        self.mirrors = {}
+        self.colors = {}
+        self._sent = {}
+        self.partner = None
+        self.spectators = []
+        self.running = True
+
+    def send(self, message):
+        if not self._writer.is_closing():
+            self._writer.write(encode(message))
+
+    def start_game(self):
+        self.send({'type': 'create'})
+
+    def _play(self, game_id):
+        """
+        Sends a random legal move if it is this clients turn in the game.
+        """
+        game = self.mirrors.get(game_id)
+        if game is None or self.colors.get(game_id) != game.get_turn():
+            return
+        moves = game.legal_moves_idx()
+        if not moves:
+            return
+        start, end = self._rng.choice(moves)
+        self._sent[game_id] = time.perf_counter()
+        self.send({'type': 'move', 'game': game_id, 'move': SQUARE_NAMES[start] + SQUARE_NAMES[end]})
+
+    def _finish(self, game_id):
+        """
+        Leaves a finished game, and starts a new one if this client created it.
+        """
+        self.send({'type': 'leave', 'game': game_id})
+        self.mirrors.pop(game_id, None)
+        if self.colors.pop(game_id, None) == "WHITE":
+            self._stats.games += 1
+            if self.running:
+                self.start_game()
+
+    def handle(self, message):
+        """
+        Reacts to one message from the server.
+        """
+        kind = message['type']
+        game_id = message.get('game')
+        if kind == 'created':
+            self.colors[game_id] = "WHITE"
+            self.mirrors[game_id] = ChessVar(backend="bitboard")
+            self.partner.send({'type': 'join', 'game': game_id})
+            for spectator in self.spectators:
+                spectator.send({'type': 'watch', 'game': game_id})
+        elif kind == 'joined':
+            if game_id not in self.mirrors:
+                self.colors[game_id] = message['color']
+                self.mirrors[game_id] = ChessVar.from_fen(message['fen'], backend="bitboard")
+            self._play(game_id)
+        elif kind == 'watching':
+            self.mirrors[game_id] = ChessVar.from_fen(message['fen'], backend="bitboard")
+        elif kind == 'moved':
+            game = self.mirrors.get(game_id)
+            if game is None:
+                return
+            move = message['move']
+            if not game.make_move_idx(SQUARE_INDEX[move[:2]], SQUARE_INDEX[move[2:]]) or \
+                    game.get_game_state() != message['state'] or game.get_turn() != message['turn']:
+                self._stats.mismatches += 1
+            if game_id in self._sent:
+                self._stats.latencies.append(time.perf_counter() - self._sent.pop(game_id))
+                self._stats.moves += 1
+            if game_id not in self.colors:  # watching
+                if message['state'] != "UNFINISHED":
+                    self.send({'type': 'leave', 'game': game_id})
+                    del self.mirrors[game_id]
+            elif message['state'] != "UNFINISHED" or message['ply'] >= self._max_plies:
+                self._finish(game_id)
+            else:
+                self._play(game_id)
+        elif kind == 'error':
+            if message['error'] == 'rate limited' and game_id is not None:
+                self._stats.rate_limited += 1
+                self._sent.pop(game_id, None)
+                asyncio.get_running_loop().call_later(self._retry_delay, self._play, game_id)
+            else:
+                self._stats.errors += 1
+        elif kind == 'closed':
+            self.mirrors.pop(game_id, None)
+            self.colors.pop(game_id, None)
+
+    async def read(self):
+        """
+        Handles messages until the server closes the connection.
+        """
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return
+            self.handle(json.loads(line))
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def run_load(host='127.0.0.1', port=DEFAULT_PORT, games=2000, pairs=20, spectators=0, seconds=10.0,
+                   max_plies=200, move_rate=10.0, seed=0):
+    """
+    Keeps games going against a running server for a number of seconds.
+
+    :parameter games: how many games are played at once
+    :parameter pairs: how many pairs of player connections share the games
+    :parameter spectators: how many extra connections watch every game
+    :parameter seconds: how long to keep starting new games
+    :parameter max_plies: a game is left after this many plies even if it isn't finished
+    :parameter move_rate: the servers moves per second limit, used to wait before retrying a limited move
+    :parameter seed: the seed for picking moves
+    :return: (LoadStats, seconds taken)
+    """
+    stats = LoadStats()
+    rng = random.Random(seed)
+
+    async def connect():
+        reader, writer = await asyncio.open_connection(host, port)
+        return LoadClient(reader, writer, stats, rng, max_plies, 1.0 / move_rate)
+
+    watchers = [await connect() for _ in range(spectators)]
+    players = []
+    for _ in range(pairs):
+        white, black = await connect(), await connect()
+        white.partner = black
+        white.spectators = watchers
+        players.append(white)
+        players.append(black)
+    clients = watchers + players
+    readers = [asyncio.get_running_loop().create_task(client.read()) for client in clients]
+
+    begin = time.perf_counter()
+    for number in range(games):
+        players[2 * (number % pairs)].start_game()
+    await asyncio.sleep(seconds)
+    for client in clients:
+        client.running = False
+    elapsed = time.perf_counter() - begin
+    for client in clients:
+        await client.close()
+    await asyncio.gather(*readers, return_exceptions=True)
+    return stats, elapsed
+
+
+def _serve(host, port, move_rate):
+    asyncio.run(serve(host, port, move_rate=move_rate))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="play many games at once against server.py")
+    parser.add_argument('--host', default='127.0.0.1', help='server address')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='server port')
+    parser.add_argument('--games', type=int, default=2000, help='games played at once')
+    parser.add_argument('--pairs', type=int, default=20, help='pairs of player connections')
+    parser.add_argument('--spectators', type=int, default=0, help='connections that watch every game')
+    parser.add_argument('--seconds', type=float, default=10.0, help='how long to run')
+    parser.add_argument('--max-plies', type=int, default=200, help='plies before a game is left unfinished')
+    parser.add_argument('--move-rate', type=float, default=10.0, help='the servers per game move limit')
+    parser.add_argument('--seed', type=int, default=0, help='seed for picking moves')
+    parser.add_argument('--serve', action='store_true', help='start a server in a separate process first')
+    args = parser.parse_args()
+
+    server = None
+    if args.serve:
+        server = multiprocessing.Process(target=_serve, args=(args.host, args.port, args.move_rate), daemon=True)
+        server.start()
+        time.sleep(1.0)
+    try:
+        stats, seconds = asyncio.run(run_load(args.host, args.port, args.games, args.pairs, args.spectators,
+                                              args.seconds, args.max_plies, args.move_rate, args.seed))
+    finally:
+        if server is not None:
+            server.terminate()
+
+    latencies = sorted(stats.latencies) or [0.0]
+    print(f'{args.games} concurrent games over {args.pairs * 2 + args.spectators} connections for {seconds:.1f}s')
+    print(f'{stats.moves} moves ({stats.moves / seconds:,.0f} moves/s), {stats.games} games finished')
+    print(f'move round trip: median {latencies[len(latencies) // 2] * 1000:.1f}ms, '
+          f'99th percentile {latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms')
+    print(f'{stats.rate_limited} rate limited, {stats.errors} errors, {stats.mismatches} board mismatches')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,455 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A Monte Carlo tree search player (UCT). Games of this variant end as soon as one piece type is wiped out,
+#               so random games are short and almost always decisive, which makes playing positions out to the end a
+#               good way to judge them.
+#
+#               Each iteration walks down the tree picking the child with the best UCT value, adds one new child, plays
+#               a game out from there and counts the result in every node on the way back up. The playouts don't use
+#               ChessVar at all: they work on a plain list of piece names and two occupied bitboards, find moves with
+#               the tables in bitboard.py, and skip the hash, the undo stack and the algebraic squares. By default a
+#               playout takes a capture that wins the game whenever one is there and otherwise moves at random.
+#
+#               The tree is kept between moves: when the next search starts from a position two plies below the last
+#               root (after our move and the reply), that subtree becomes the new root. search_parallel runs separate
+#               trees in a pool of worker processes and adds up the visits of the root moves.
+#
+#               Run from the project folder with:
+#                   python mcts.py [--time SECONDS] [--workers W] [--exploration C]
+#               to report playouts per second for the playout path and for whole searches.
+
+import argparse
+import collections
+import concurrent.futures
+import math
+import os
+import random
+import time
+
+from ChessVar import ChessVar
+from bitboard import NAME_COLOR, SQUARE_NAMES, KNIGHT_MOVES, KING_MOVES, piece_targets, squares_of
+from search import quiet_positions
+
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+MCTSResult = collections.namedtuple('MCTSResult', ['best_move', 'visits', 'win_rate', 'playouts', 'seconds',
+                                                   'playouts_per_second'])
+MCTSResult.__doc__ = """
+The outcome of a Monte Carlo tree search.
+
+best_move:           the most visited move in algebraic notation, or None if there is no legal move
+visits:              how many times best_move was visited
+win_rate:            the share of those visits the player to move won, counting draws as half
+playouts:            the number of games played out during the search
+seconds:             how long the search took
+playouts_per_second: playouts divided by seconds
+"""
+
+
+def _winner_value(winner, turn):
+    """
+    :return: 1.0 if winner is turn, 0.0 if it is the other color and 0.5 if nobody won
+    """
+    if winner is None:
+        return 0.5
+    return 1.0 if winner == turn else 0.0
+
+
+# knights and kings jump, so their targets are just a table lookup
+_JUMP_TABLES = {'N': KNIGHT_MOVES, 'n': KNIGHT_MOVES, 'K': KING_MOVES, 'k': KING_MOVES}
+
+
+def playout(squares, turn, unmoved, counts, rng, max_plies=200, take_wins=True):
+    """
+    Plays random moves from a position to the end of the game. Every legal move is equally likely, the same as picking
+    from legal_moves_idx.
+
+    :parameter squares: a list of 64 piece names or None, it is copied before being changed
+    :parameter turn: the color to move, "WHITE" or "BLACK"
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :parameter counts: a dictionary of how many pieces of each name are left, like get_piece_dict, it is copied
+    :parameter rng: the random.Random to pick moves with
+    :parameter max_plies: the game is counted as a draw after this many plies
+    :parameter take_wins: play a capture of the last piece of a type whenever there is one, instead of a random move
+    :return: the color that won, or None if nobody did
+    """
+    squares = list(squares)
+    counts = dict(counts)
+    jump_tables = _JUMP_TABLES
+    randrange = rng.randrange
+    own = 0
+    enemy = 0
+    for square, name in enumerate(squares):
+        if name is not None:
+            if NAME_COLOR[name] == turn:
+                own |= 1 << square
+            else:
+                enemy |= 1 << square
+
+    for _ in range(max_plies):
+        occupied = own | enemy
+        movers = []
+        total = 0
+        pieces = own
+        while pieces:
+            low_bit = pieces & -pieces
+            pieces ^= low_bit
+            start = low_bit.bit_length() - 1
+            name = squares[start]
+            table = jump_tables.get(name)
+            if table is not None:
+                targets = table[start] & ~own
+            else:
+                targets = piece_targets(name, start, occupied, unmoved) & ~own
+            if targets:
+                count = bin(targets).count('1')
+                movers.append((start, targets, count))
+                total += count
+        if not total:
+            return None
+
+        if take_wins:
+            last = 0
+            for square in squares_of(enemy):
+                if counts[squares[square]] == 1:
+                    last |= 1 << square
+            if last:
+                for start, targets, count in movers:
+                    if targets & last:
+                        return turn
+
+        pick = randrange(total)
+        for start, targets, count in movers:
+            if pick < count:
+                break
+            pick -= count
+        for _ in range(pick):
+            targets &= targets - 1
+        end_bit = targets & -targets
+        end = end_bit.bit_length() - 1
+
+        start_bit = 1 << start
+        captured = squares[end]
+        if captured is not None:
+            counts[captured] -= 1
+            if not counts[captured]:
+                return turn
+            enemy ^= end_bit
+        own ^= start_bit | end_bit
+        unmoved &= ~(start_bit | end_bit)
+        squares[end] = squares[start]
+        squares[start] = None
+        own, enemy = enemy, own
+        turn = "BLACK" if turn == "WHITE" else "WHITE"
+    return None
+
+
+class Node:
+    """
+    One position in the search tree.
+
+    move:     the (start, end) square index move that leads here from the parent
+    key:      the Zobrist hash of the position
+    turn:     the color to move in the position
+    wins:     the results of the playouts through here for the player who made move, draws count as half
+    visits:   the number of playouts through here
+    children: the nodes of the moves tried so far
+    untried:  the legal moves not added as children yet, or None for a finished game
+    winner:   the color that won if the game is over here, else None
+    """
+    def __init__(self, game, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.key = game.get_hash()
+        self.turn = game.get_turn()
+        self.wins = 0.0
+        self.visits = 0
+        self.children = []
+        state = game.get_game_state()
+        if state == "UNFINISHED":
+            self.winner = None
+            self.untried = game.legal_moves_idx()
+        else:
+            self.winner = "WHITE" if state == "WHITE_WON" else "BLACK"
+            self.untried = None
+
+    def is_terminal(self):
+        """
+        :return: True if the game is over here or there are no legal moves
+        """
+        return self.winner is not None or (not self.untried and not self.children)
+
+    def best_child(self, exploration):
+        """
+        :parameter exploration: the UCT exploration constant
+        :return: the child with the highest UCT value
+        """
+        log_visits = math.log(self.visits)
+        best = None
+        best_value = -1.0
+        for child in self.children:
+            value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best = child
+                best_value = value
+        return best
+
+
+class MCTSPlayer:
+    """
+    Picks moves with Monte Carlo tree search, keeping the tree between moves.
+
+    exploration: the UCT exploration constant, higher values spread the playouts over more moves
+    max_plies:   playouts longer than this count as draws
+    take_wins:   playouts take a winning capture whenever there is one
+    root:        the root node of the tree kept from the last search, or None
+    """
+    def __init__(self, exploration=DEFAULT_EXPLORATION, max_plies=200, take_wins=True, seed=None):
+        self.exploration = exploration
+        self.max_plies = max_plies
+        self.take_wins = take_wins
+        self.root = None
+        self._rng = random.Random(seed)
+
+    def _reuse_root(self, key):
+        """
+        :parameter key: the Zobrist hash of the position to search
+        :return: the node of the old tree for that position up to two plies below its root, or None
+        """
+        if self.root is None:
+            return None
+        nodes = [self.root]
+        for _ in range(3):
+            for node in nodes:
+                if node.key == key:
+                    node.parent = None
+                    node.move = None
+                    return node
+            nodes = [child for node in nodes for child in node.children]
+        return None
+
+    def _iterate(self, game, root):
+        """
+        Runs one iteration of selection, expansion, playout and backpropagation. The game is left as it was.
+
+        :parameter game: a BitboardChessVar at the root position
+        :parameter root: the root Node
+        """
+        node = root
+        pushed = 0
+        while not node.untried and node.children and node.winner is None:
+            node = node.best_child(self.exploration)
+            game.push_move_idx(*node.move)
+            pushed += 1
+
+        if node.untried:
+            move = node.untried.pop(self._rng.randrange(len(node.untried)))
+            game.push_move_idx(*move)
+            pushed += 1
+            child = Node(game, move, node)
+            node.children.append(child)
+            node = child
+
+        if node.winner is not None:
+            winner = node.winner
+        elif not node.untried and not node.children:
+            winner = None
+        else:
+            squares, occupied, unmoved = game.get_position()
+            winner = playout(squares, node.turn, unmoved, game.get_piece_dict(), self._rng, self.max_plies,
+                             self.take_wins)
+
+        for _ in range(pushed):
+            game.pop_move()
+        while node is not None:
+            node.visits += 1
+            if node.parent is not None:
+                node.wins += _winner_value(winner, node.parent.turn)
+            node = node.parent
+
+    def search(self, game, iterations=None, time_limit=1.0):
+        """
+        Searches the position for the best move, reusing the part of the last tree below it if there is one.
+
+        :parameter game: the ChessVar to search, of any backend. It isn't changed.
+        :parameter iterations: the number of playouts to run, or None to run until time_limit
+        :parameter time_limit: seconds to search for when iterations is None
+        :return: an MCTSResult
+        """
+        begin = time.perf_counter()
+        board = ChessVar.from_fen(game.to_fen(), backend="bitboard")
+        root = self._reuse_root(board.get_hash())
+        if root is None:
+            root = Node(board)
+        self.root = root
+
+        playouts = 0
+        deadline = begin + time_limit
+        while not root.is_terminal():
+            self._iterate(board, root)
+            playouts += 1
+            if iterations is not None:
+                if playouts >= iterations:
+                    break
+            elif not playouts & 15 and time.perf_counter() >= deadline:
+                break
+
+        seconds = time.perf_counter() - begin
+        best = max(root.children, key=lambda child: child.visits, default=None)
+        if best is None:
+            return MCTSResult(None, 0, 0.0, playouts, seconds, playouts / seconds if seconds else 0.0)
+        return MCTSResult((SQUARE_NAMES[best.move[0]], SQUARE_NAMES[best.move[1]]), best.visits,
+                          best.wins / best.visits, playouts, seconds, playouts / seconds if seconds else 0.0)
+
+    def root_stats(self):
+        """
+        :return: a dictionary mapping each root move tried in the last search to (visits, wins)
+        """
+        if self.root is None:
+            return {}
+        return {child.move: (child.visits, child.wins) for child in self.root.children}
+
+
+_worker_player = None
+
+
+def _init_worker(exploration, max_plies, take_wins):
+    """
+    Gives each worker process its own MCTSPlayer, whose random numbers carry on from one task to the next.
+    """
+    global _worker_player
+    _worker_player = MCTSPlayer(exploration, max_plies, take_wins, seed=os.getpid())
+
+
+def _search_worker(fen, iterations, time_limit):
+    """
+    Searches the position with a new tree. search_parallel adds up the root moves of every task, so a tree kept from
+    an earlier task in the same process would count its visits twice.
+
+    :return: (root_stats of the workers player after searching the position, playouts)
+    """
+    _worker_player.root = None
+    result = _worker_player.search(ChessVar.from_fen(fen, backend="bitboard"), iterations, time_limit)
+    return _worker_player.root_stats(), result.playouts
+
+
+def search_parallel(executor, game, workers, iterations=None, time_limit=1.0):
+    """
+    Searches a position with one tree in each of several worker processes and adds up their root moves (root
+    parallelization).
+
+    :parameter executor: a ProcessPoolExecutor made by make_pool
+    :parameter game: the ChessVar to search, of any backend
+    :parameter workers: how many trees to search, normally the number of worker processes
+    :parameter iterations: playouts for each tree, or None to search until time_limit
+    :parameter time_limit: seconds each tree searches for when iterations is None
+    :return: an MCTSResult counting the playouts of every tree
+    """
+    begin = time.perf_counter()
+    fen = game.to_fen()
+    visits = collections.Counter()
+    wins = collections.Counter()
+    playouts = 0
+    futures = [executor.submit(_search_worker, fen, iterations, time_limit) for _ in range(workers)]
+    for future in futures:
+        stats, tree_playouts = future.result()
+        playouts += tree_playouts
+        for move, (move_visits, move_wins) in stats.items():
+            visits[move] += move_visits
+            wins[move] += move_wins
+    seconds = time.perf_counter() - begin
+    if not visits:
+        return MCTSResult(None, 0, 0.0, playouts, seconds, playouts / seconds if seconds else 0.0)
+    move, move_visits = visits.most_common(1)[0]
+    return MCTSResult((SQUARE_NAMES[move[0]], SQUARE_NAMES[move[1]]), move_visits, wins[move] / move_visits, playouts,
+                      seconds, playouts / seconds if seconds else 0.0)
+
+
+def make_pool(workers=None, exploration=DEFAULT_EXPLORATION, max_plies=200, take_wins=True):
+    """
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :return: a ProcessPoolExecutor whose workers each hold an MCTSPlayer, for search_parallel
+    """
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                                  initializer=_init_worker,
+                                                  initargs=(exploration, max_plies, take_wins))
+
+
+def playout_rate(positions, seconds=1.0, seed=0, take_wins=True):
+    """
+    Measures the playout path on its own, playing out each position in turn over and over.
+
+    :parameter positions: a list of ChessVar games to play out
+    :return: playouts per second
+    """
+    rng = random.Random(seed)
+    starts = []
+    for game in positions:
+        squares, occupied, unmoved = game.get_position()
+        starts.append((squares, game.get_turn(), unmoved, game.get_piece_dict()))
+    playouts = 0
+    begin = time.perf_counter()
+    while time.perf_counter() - begin < seconds:
+        squares, turn, unmoved, counts = starts[playouts % len(starts)]
+        playout(squares, turn, unmoved, counts, rng, take_wins=take_wins)
+        playouts += 1
+    return playouts / (time.perf_counter() - begin)
+
+
+def chessvar_playout_rate(positions, seconds=1.0, seed=0):
+    """
+    Measures random playouts made with legal_moves_idx and push_move_idx on a BitboardChessVar, to compare with
+    playout_rate.
+
+    :parameter positions: a list of ChessVar games to play out
+    :return: playouts per second
+    """
+    rng = random.Random(seed)
+    games = [ChessVar.from_fen(game.to_fen(), backend="bitboard") for game in positions]
+    playouts = 0
+    begin = time.perf_counter()
+    while time.perf_counter() - begin < seconds:
+        game = games[playouts % len(games)]
+        pushed = 0
+        while pushed < 200 and game.get_game_state() == "UNFINISHED":
+            moves = game.legal_moves_idx()
+            if not moves:
+                break
+            game.push_move_idx(*rng.choice(moves))
+            pushed += 1
+        for _ in range(pushed):
+            game.pop_move()
+        playouts += 1
+    return playouts / (time.perf_counter() - begin)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo tree search playouts per second")
+    parser.add_argument('--time', type=float, default=2.0, help='seconds for each measurement')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of CPUs)')
+    parser.add_argument('--exploration', type=float, default=DEFAULT_EXPLORATION, help='UCT exploration constant')
+    parser.add_argument('--random', action='store_true', help='play purely random playouts, without taking wins')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to pick the positions')
+    args = parser.parse_args()
+    take_wins = not args.random
+
+    # white can win on its first move from the start, so measure positions where nobody can win right away
+    positions = quiet_positions(8, args.seed)
+    print(f'random playouts:    {chessvar_playout_rate(positions, args.time):10,.0f} playouts/s with ChessVar, '
+          f'{playout_rate(positions, args.time, take_wins=False):,.0f} playouts/s with the playout path')
+    if take_wins:
+        print(f'taking wins:        {playout_rate(positions, args.time):10,.0f} playouts/s with the playout path')
+    game = positions[0]
+    result = MCTSPlayer(args.exploration, take_wins=take_wins, seed=0).search(game, time_limit=args.time)
+    print(f'one tree:           {result.playouts_per_second:10,.0f} playouts/s  best {"".join(result.best_move)} '
+          f'({result.visits} visits, {result.win_rate:.0%} wins)')
+    workers = args.workers or os.cpu_count() or 1
+    with make_pool(workers, args.exploration, take_wins=take_wins) as executor:
+        result = search_parallel(executor, game, workers, time_limit=args.time)
+    print(f'{workers:>2} trees:           {result.playouts_per_second:10,.0f} playouts/s  '
+          f'best {"".join(result.best_move)} ({result.visits} visits, {result.win_rate:.0%} wins)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Perft ("performance test") counts every sequence of legal moves of a given length from a position. The
+#               counts only depend on the rules, so they catch any change that makes a board backend or the move
+#               generator accept or reject a different set of moves, and timing them measures move generation speed.
+#               A finished game has no legal moves, so lines that win the game stop there and add nothing deeper.
+#
+#               Divide mode prints the count below each legal move of the position so a mismatch can be tracked down
+#               to a single move. Verify mode also compares the generated moves of every position in the tree with a
+#               brute force check of all 64 x 64 square pairs through ChessPiece.is_move_legal, and brute force mode
+#               counts with that check alone, which is where the stored reference counts come from.
+#
+#               Run from the project folder with:
+#                   python perft.py DEPTH [--divide] [--verify] [--brute-force] [--backend bitboard|compact|list]
+#                                 [--fen FEN] [--moves a2a4 b7b5 ...]
+#                   python perft.py --check [--max-depth N] [--backend bitboard|compact|list]
+
+import argparse
+import time
+
+from ChessVar import ChessVar, BACKENDS, algebra_indices
+from bitboard import SQUARE_NAMES
+
+# perft counts under this variant's rules, keyed by the moves played from the starting position and then by depth.
+# Every one of them comes from brute_force_perft, which doesn't use the move generator.
+REFERENCE_COUNTS = {
+    '': {1: 115, 2: 12748, 3: 1379887},
+    'd2d4 e7e5': {1: 123, 2: 14347, 3: 1645099},
+    'b1c3 g8f6 e2e3 d7d6': {1: 111, 2: 12028, 3: 1270028},
+}
+
+# counts too deep to walk with brute_force_moves, recorded from legal_moves_idx itself. They only show that the move
+# generator still does what it did when they were recorded, not that it follows the rules.
+REGRESSION_COUNTS = {
+    '': {4: 147117253},
+}
+
+
+def perft(game, depth):
+    """
+    Counts the move sequences of length depth from the current position. The game is walked with push_move_idx and
+    pop_move and is left as it was.
+
+    :parameter game: the ChessVar to count from
+    :parameter depth: how many plies deep to count
+    :return: the number of positions reached after exactly depth plies
+    """
+    if depth <= 0:
+        return 1
+    moves = game.legal_moves_idx()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.push_move_idx(*move)
+        nodes += perft(game, depth - 1)
+        game.pop_move()
+    return nodes
+
+
+def divide(game, depth):
+    """
+    :parameter game: the ChessVar to count from
+    :parameter depth: how many plies deep to count, must be at least 1
+    :return: a dictionary mapping each legal (start, end) move to the perft count below it
+    """
+    counts = {}
+    for move in game.legal_moves():
+        game.push_move(*move)
+        counts[move] = perft(game, depth - 1)
+        game.pop_move()
+    return counts
+
+
+def brute_force_moves(game):
+    """
+    Finds the legal moves the slow way: every pair of squares goes through the same checks as ChessVar.make_move,
+    using the ChessPiece.is_move_legal methods.
+
+    :parameter game: the ChessVar to check
+    :return: a set of (start, end) tuples in algebraic notation
+    """
+    if game.get_game_state() != "UNFINISHED":
+        return set()
+    board = game.get_board()
+    moves = set()
+    for start in SQUARE_NAMES:
+        start_indices = algebra_indices(start)
+        piece = board[start_indices[0]][start_indices[1]]
+        if piece is None or piece.get_color() != game.get_turn():
+            continue
+        for end in SQUARE_NAMES:
+            if start == end:
+                continue
+            end_indices = algebra_indices(end)
+            if not piece.is_move_legal(list(board), start_indices, end_indices):
+                continue
+            end_piece = board[end_indices[0]][end_indices[1]]
+            if end_piece is not None and end_piece.get_color() == game.get_turn():
+                continue
+            moves.add((start, end))
+    return moves
+
+
+def brute_force_perft(game, depth):
+    """
+    Same as perft, but every position's moves come from brute_force_moves, so the count doesn't depend on the move
+    generator at all. This is how REFERENCE_COUNTS were made (depth 3 takes under half a minute per position).
+
+    :parameter game: the ChessVar to count from, walked with push_move and pop_move and left as it was
+    :parameter depth: how many plies deep to count
+    :return: the number of positions reached after exactly depth plies
+    """
+    if depth <= 0:
+        return 1
+    moves = brute_force_moves(game)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.push_move(*move)
+        nodes += brute_force_perft(game, depth - 1)
+        game.pop_move()
+    return nodes
+
+
+def verify(game, depth, line=()):
+    """
+    Compares legal_moves with brute_force_moves in every position of the tree up to depth plies deep.
+
+    :parameter game: the ChessVar to check from
+    :parameter depth: how many plies deep to check
+    :parameter line: the moves leading to this position, used in the error messages
+    :return: a list of (line, missing moves, extra moves) for every position where the two disagree
+    """
+    generated = set(game.legal_moves())
+    expected = brute_force_moves(game)
+    mismatches = []
+    if generated != expected:
+        mismatches.append((list(line), sorted(expected - generated), sorted(generated - expected)))
+    if depth > 1:
+        for move in sorted(generated):
+            game.push_move(*move)
+            mismatches.extend(verify(game, depth - 1, line + (move,)))
+            game.pop_move()
+    return mismatches
+
+
+def parse_move(text):
+    """
+    :parameter text: a move written as 'a2a4' or 'a2-a4'
+    :return: the (start, end) tuple
+    """
+    text = text.replace('-', '')
+    return text[:2], text[2:]
+
+
+def play_line(backend, moves, fen=None):
+    """
+    :parameter backend: the board backend to create the game with
+    :parameter moves: a list of moves written as 'a2a4' or 'a2-a4' to play
+    :parameter fen: the position to play them from, defaults to the starting position
+    :return: the ChessVar after the moves, or raises SystemExit if one of them is illegal
+    """
+    game = ChessVar(backend=backend) if fen is None else ChessVar.from_fen(fen, backend=backend)
+    for text in moves:
+        if not game.make_move(*parse_move(text)):
+            raise SystemExit(f'illegal move: {text}')
+    return game
+
+
+def expected_count(line, depth):
+    """
+    :parameter line: the moves played from the starting position, separated by spaces
+    :parameter depth: the perft depth
+    :return: (count, kind) where kind is 'reference' or 'regression' (see REGRESSION_COUNTS), or (None, None)
+    """
+    if depth in REFERENCE_COUNTS.get(line, {}):
+        return REFERENCE_COUNTS[line][depth], 'reference'
+    if depth in REGRESSION_COUNTS.get(line, {}):
+        return REGRESSION_COUNTS[line][depth], 'regression'
+    return None, None
+
+
+def check_references(backend, max_depth):
+    """
+    Runs perft on every stored position up to max_depth and prints how each count compares. Shallow counts take too
+    little time to give a steady speed, so nodes per second is only printed for the deepest depth of each position.
+
+    :parameter backend: the board backend to check
+    :parameter max_depth: the deepest stored count to check
+    :return: True if every count matched
+    """
+    passed = True
+    for line in REFERENCE_COUNTS:
+        game = play_line(backend, line.split())
+        depths = sorted(set(REFERENCE_COUNTS[line]) | set(REGRESSION_COUNTS.get(line, {})))
+        depths = [depth for depth in depths if depth <= max_depth]
+        for depth in depths:
+            expected, kind = expected_count(line, depth)
+            begin = time.perf_counter()
+            nodes = perft(game, depth)
+            seconds = time.perf_counter() - begin
+            status = f'ok ({kind} count)' if nodes == expected else f'MISMATCH, expected {expected} ({kind} count)'
+            passed = passed and nodes == expected
+            speed = f'  {nodes / seconds if seconds else 0:,.0f} nodes/s' if depth == depths[-1] else ''
+            print(f'[{line or "start"}] perft({depth}) = {nodes}  {seconds:.3f}s{speed}  {status}')
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="count and time legal move sequences")
+    parser.add_argument('depth', type=int, nargs='?', help='how many plies deep to count')
+    parser.add_argument('--check', action='store_true', help='compare against every stored reference count')
+    parser.add_argument('--max-depth', type=int, default=3, help='deepest reference count --check runs')
+    parser.add_argument('--divide', action='store_true', help='print the count below each legal move')
+    parser.add_argument('--verify', action='store_true',
+                        help='check every generated move list against ChessPiece.is_move_legal (slow)')
+    parser.add_argument('--brute-force', action='store_true',
+                        help='count with brute_force_perft instead of the move generator (slow)')
+    parser.add_argument('--backend', default='bitboard', choices=sorted(BACKENDS), help='board backend to use')
+    parser.add_argument('--fen', default=None, help='position to count from instead of the starting position')
+    parser.add_argument('--moves', nargs='*', default=[], help='moves to play first, EX: a2a4 b7b5')
+    args = parser.parse_args()
+
+    if args.check:
+        if not check_references(args.backend, args.max_depth):
+            raise SystemExit(1)
+        return
+    if args.depth is None:
+        parser.error('a depth is needed unless --check is given')
+
+    try:
+        game = play_line(args.backend, args.moves, args.fen)
+    except ValueError as error:
+        parser.error(str(error))
+
+    begin = time.perf_counter()
+    if args.divide:
+        counts = divide(game, args.depth)
+        for (start, end), count in sorted(counts.items()):
+            print(f'{start}{end}: {count}')
+        nodes = sum(counts.values())
+    elif args.brute_force:
+        nodes = brute_force_perft(game, args.depth)
+    else:
+        nodes = perft(game, args.depth)
+    seconds = time.perf_counter() - begin
+
+    print(f'perft({args.depth}) = {nodes}  {seconds:.3f}s  {nodes / seconds if seconds else 0:,.0f} nodes/s')
+    expected, kind = (None, None) if args.fen else expected_count(' '.join(args.moves), args.depth)
+    if expected is not None:
+        print(f'matches {kind} count' if nodes == expected else f'MISMATCH, expected {expected} ({kind} count)')
+
+    if args.verify:
+        mismatches = verify(game, args.depth)
+        for line, missing, extra in mismatches:
+            print(f'after {line}: missing {missing}, extra {extra}')
+        print(f'verify: {len(mismatches)} mismatching positions')
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
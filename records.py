@@ -0,0 +1,344 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A compact binary format for ChessVar positions and finished games, with a streaming writer and reader
+#               for archives holding millions of games.
+#
+#               A position takes 35 bytes:
+#                   32 bytes  the 64 squares in board order (a8 first), two 4-bit piece codes per byte with the earlier
+#                             square in the high half, using ChessVar.CODE_NAMES: code 0 is empty, 1 to 6 are
+#                             k q r b n p and 7 to 12 are K Q R B N P.
+#                   1 byte    bit 0 is set if it is black's turn, bits 1 and 2 hold the game state (see GAME_STATES)
+#                   2 bytes   little endian, bit n (0 to 7) is set while the white pawn that started on file n hasn't
+#                             moved, bit 8 + n the same for the black pawn on file n
+#
+#               A game record is a 4 byte header followed by 2 bytes per move:
+#                   2 bytes   little endian number of moves
+#                   1 byte    the final game state (see GAME_STATES)
+#                   1 byte    the extinct piece code, 0 if the game didn't finish. Bit 7 is set if a 35 byte start
+#                             position follows the header, otherwise the game started from the normal starting position.
+#                   2 bytes   per move, little endian start * 64 + end with squares numbered 0 (a8) to 63 (h1)
+#
+#               An archive file starts with the 8 byte MAGIC and then holds game records back to back. The writer also
+#               writes FILE.idx, the 8 byte offset of every record, so GameArchive can jump straight to any game.
+#
+#               Run from the project folder with:
+#                   python records.py pack GAMES.jsonl ARCHIVE    (converts selfplay.py output)
+#                   python records.py info ARCHIVE
+
+import argparse
+import collections
+import json
+import mmap
+import os
+import struct
+
+from ChessVar import ChessVar, CODE_NAMES, NAME_CODES, CODE_TABLE, NAME_TABLE
+from bitboard import SQUARE_NAMES, SQUARE_INDEX
+
+MAGIC = b'CHESSVR1'
+GAME_STATES = ("UNFINISHED", "WHITE_WON", "BLACK_WON")
+POSITION_BYTES = 35
+
+_HEADER = struct.Struct('<HBB')
+_OFFSET = struct.Struct('<Q')
+_HAS_START = 0x80
+_PAWN_ROWS = {"WHITE": 6, "BLACK": 1}
+
+GameRecord = collections.namedtuple('GameRecord', ['moves', 'game_state', 'extinct', 'start'])
+GameRecord.__doc__ = """
+One game read from an archive.
+
+moves:      a list of (start, end) moves in algebraic notation
+game_state: the final get_game_state() of the game
+extinct:    the name of the piece type that was wiped out, or None
+start:      the 35 byte start position, or None if the game started from the normal starting position
+"""
+
+
+def encode_position(game):
+    """
+    :parameter game: a ChessVar of any backend
+    :return: the 35 byte encoding of its current position
+    """
+    squares, occupied, unmoved = game.get_position()
+    codes = ''.join(name or '.' for name in squares).encode().translate(CODE_TABLE)
+    board = bytes(codes[square] << 4 | codes[square + 1] for square in range(0, 64, 2))
+    flags = (game.get_turn() == "BLACK") | GAME_STATES.index(game.get_game_state()) << 1
+    pawns = 0
+    for file in range(8):
+        if unmoved >> (_PAWN_ROWS["WHITE"] * 8 + file) & 1:
+            pawns |= 1 << file
+        if unmoved >> (_PAWN_ROWS["BLACK"] * 8 + file) & 1:
+            pawns |= 1 << (8 + file)
+    return board + struct.pack('<BH', flags, pawns)
+
+
+def decode_position(data):
+    """
+    :parameter data: a 35 byte position made by encode_position
+    :return: (list of 64 piece names or None, turn, unmoved pawn bitboard, game state)
+    """
+    codes = bytearray()
+    for byte in data[:32]:
+        codes.append(byte >> 4)
+        codes.append(byte & 15)
+    squares = [None if name == '.' else name for name in bytes(codes).translate(NAME_TABLE).decode()]
+    flags, pawns = struct.unpack_from('<BH', data, 32)
+    unmoved = 0
+    for file in range(8):
+        if pawns >> file & 1:
+            unmoved |= 1 << (_PAWN_ROWS["WHITE"] * 8 + file)
+        if pawns >> (8 + file) & 1:
+            unmoved |= 1 << (_PAWN_ROWS["BLACK"] * 8 + file)
+    return squares, "BLACK" if flags & 1 else "WHITE", unmoved, GAME_STATES[flags >> 1 & 3]
+
+
+def encode_moves(moves):
+    """
+    :parameter moves: (start, end) tuples or 'a2a4' style strings
+    :return: the moves packed 2 bytes each
+    """
+    codes = [SQUARE_INDEX[move[:2] if isinstance(move, str) else move[0]] * 64 +
+             SQUARE_INDEX[move[2:] if isinstance(move, str) else move[1]] for move in moves]
+    return struct.pack(f'<{len(codes)}H', *codes)
+
+
+def decode_moves(data):
+    """
+    :parameter data: moves packed by encode_moves
+    :return: a list of (start, end) tuples in algebraic notation
+    """
+    codes = struct.unpack(f'<{len(data) // 2}H', data)
+    return [(SQUARE_NAMES[code >> 6], SQUARE_NAMES[code & 63]) for code in codes]
+
+
+def encode_game(moves, game_state, extinct=None, start=None):
+    """
+    :parameter moves: the games moves as (start, end) tuples or 'a2a4' style strings, at most 65535 of them
+    :parameter game_state: the final get_game_state() of the game
+    :parameter extinct: the name of the piece type that was wiped out, or None
+    :parameter start: the 35 byte start position, or None for the normal starting position
+    :return: the bytes of the game record
+    """
+    extinct_code = 0 if extinct is None else NAME_CODES[extinct]
+    if start is not None:
+        extinct_code |= _HAS_START
+    header = _HEADER.pack(len(moves), GAME_STATES.index(game_state), extinct_code)
+    return header + (start or b'') + encode_moves(moves)
+
+
+class GameWriter:
+    """
+    Appends game records to an archive file and its .idx offsets file. Use it as a context manager, or call close()
+    when done. Nothing is kept in memory between games.
+    """
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._index = open(path + '.idx', 'wb')
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._count = 0
+
+    def write_game(self, moves, game_state, extinct=None, start=None):
+        """
+        Writes one game, see encode_game for the parameters.
+        """
+        record = encode_game(moves, game_state, extinct, start)
+        self._file.write(record)
+        self._index.write(_OFFSET.pack(self._offset))
+        self._offset += len(record)
+        self._count += 1
+
+    def write_result(self, result):
+        """
+        Writes a game result dictionary from selfplay.play_game.
+        """
+        self.write_game(result['moves'], result['winner'], result['extinct'])
+
+    def __len__(self):
+        """
+        :return: the number of games written so far
+        """
+        return self._count
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_record(read, path):
+    """
+    :parameter read: a function returning the next n bytes, like file.read
+    :parameter path: the archive file, for the error message
+    :return: the next GameRecord, or None at the end of the archive
+    """
+    header = read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        raise ValueError(f'{path} is truncated: a game record header is cut off')
+    count, state, extinct_code = _HEADER.unpack(header)
+    start = read(POSITION_BYTES) if extinct_code & _HAS_START else None
+    if start is not None and len(start) < POSITION_BYTES:
+        raise ValueError(f'{path} is truncated: a game start position is cut off')
+    moves = read(count * 2)
+    if len(moves) < count * 2:
+        raise ValueError(f'{path} is truncated: a game record is missing {count - len(moves) // 2} of its moves')
+    extinct_code &= ~_HAS_START
+    return GameRecord(decode_moves(moves), GAME_STATES[state], CODE_NAMES[extinct_code], start)
+
+
+def read_games(path):
+    """
+    Reads an archive one game at a time, so memory use doesn't depend on the size of the file.
+
+    :parameter path: the archive file
+    :return: a generator of GameRecords in the order they were written
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a ChessVar game archive')
+        while True:
+            record = _read_record(file.read, path)
+            if record is None:
+                return
+            yield record
+
+
+def build_index(path):
+    """
+    Rewrites the .idx file of an archive by scanning it, for archives whose index is missing. No .idx file is left
+    behind if the archive turns out to be damaged.
+
+    :parameter path: the archive file
+    """
+    try:
+        with open(path, 'rb') as file, open(path + '.idx', 'wb') as index:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path} is not a ChessVar game archive')
+            size = os.fstat(file.fileno()).st_size
+            while True:
+                offset = file.tell()
+                header = file.read(_HEADER.size)
+                if not header:
+                    return
+                if len(header) < _HEADER.size:
+                    raise ValueError(f'{path} is truncated: a game record header is cut off')
+                count, state, extinct_code = _HEADER.unpack(header)
+                end = file.seek(count * 2 + (POSITION_BYTES if extinct_code & _HAS_START else 0), os.SEEK_CUR)
+                if end > size:
+                    raise ValueError(f'{path} is truncated: the last game record is cut off')
+                index.write(_OFFSET.pack(offset))
+    except ValueError:
+        os.remove(path + '.idx')
+        raise
+
+
+class GameArchive:
+    """
+    Random access to the games of an archive by their index. The archive and its .idx file are memory-mapped, so only
+    the pages holding the games that are read get loaded, and several processes reading the same archive share them.
+    """
+    def __init__(self, path):
+        if not os.path.exists(path + '.idx'):
+            build_index(path)
+        self._path = path
+        self._file = open(path, 'rb')
+        self._index_file = open(path + '.idx', 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a ChessVar game archive')
+        size = os.fstat(self._index_file.fileno()).st_size
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._count = size // _OFFSET.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, number):
+        """
+        :parameter number: the index of the game, negative numbers count from the end
+        :return: the GameRecord
+        """
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError('game index out of range')
+        offset = _OFFSET.unpack_from(self._index, number * _OFFSET.size)[0]
+
+        def read(size):
+            nonlocal offset
+            offset += size
+            return self._data[offset - size:offset]
+
+        return _read_record(read, self._path)
+
+    def close(self):
+        if self._index:
+            self._index.close()
+        self._data.close()
+        self._file.close()
+        self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def replay(record, backend="bitboard"):
+    """
+    Plays a game record from its start position.
+
+    :parameter record: a GameRecord
+    :parameter backend: the board backend to create the game with
+    :return: the ChessVar after every move, or None if one of the moves is illegal
+    """
+    if record.start is None:
+        game = ChessVar(backend=backend)
+    else:
+        game = ChessVar._from_position(*decode_position(record.start), backend=backend)
+    for move in record.moves:
+        if not game.make_move(*move):
+            return None
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pack and inspect ChessVar game archives")
+    commands = parser.add_subparsers(dest='command', required=True)
+    pack = commands.add_parser('pack', help='convert selfplay.py JSON lines into an archive')
+    pack.add_argument('source', help='file with one JSON game per line')
+    pack.add_argument('archive', help='archive file to write')
+    info = commands.add_parser('info', help='count the games and results in an archive')
+    info.add_argument('archive', help='archive file to read')
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        with open(args.source) as source, GameWriter(args.archive) as writer:
+            for line in source:
+                if line.strip():
+                    writer.write_result(json.loads(line))
+            count = len(writer)
+        print(f'wrote {count} games, {os.path.getsize(args.archive)} bytes')
+    else:
+        games = 0
+        moves = 0
+        states = collections.Counter()
+        for record in read_games(args.archive):
+            games += 1
+            moves += len(record.moves)
+            states[record.game_state] += 1
+        print(f'{games} games, {moves} moves, results {dict(states)}')
+
+
+if __name__ == '__main__':
+    main()
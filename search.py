@@ -0,0 +1,449 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A computer player for ChessVar. It searches the game tree with negamax alpha-beta and iterative deepening,
+#               tries the most promising moves first (the transposition table move, then captures, then killer moves
+#               and moves with a good history), and finishes every line with a quiescence search over captures so it
+#               doesn't stop in the middle of an exchange. The search stops cleanly at a time or node budget and keeps
+#               the result of the deepest search it finished.
+#
+#               The evaluation is built around the win condition of this variant: losing the last piece of any type
+#               loses the game, so what matters is how many of each type are left, not the usual material values. A
+#               side with two rooks and one knight is in much more danger than a side with one rook and two knights.
+#
+#               Run from the project folder with:  python search.py [--time SECONDS] [--depth N]
+
+import argparse
+import collections
+import random
+import time
+
+from ChessVar import ChessVar
+from bitboard import SQUARE_NAMES, WHITE_NAMES, BLACK_NAMES
+from tablebase import WIN as TB_WIN, LOSS as TB_LOSS, Tablebase
+from transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, NO_MOVE
+
+WIN_SCORE = 100000
+INFINITY = 1000000
+MAX_PLY = 128
+MAX_QUIESCENCE_PLY = 8
+
+# what it is worth to still have count pieces of one type, indexed by count. Going from 1 piece to 2 is worth far more
+# than going from 7 to 8, because a type with a single piece left is one capture away from losing the game.
+COUNT_VALUES = [0, 0, 400, 600, 700, 760, 800, 830, 850]
+
+# extra weight on the type a side has the fewest of (ignoring kings and queens, which there is always only one of)
+RAREST_VALUES = [0, 0, 120, 180, 200, 210, 215, 220, 225]
+
+SearchResult = collections.namedtuple('SearchResult', ['best_move', 'pv', 'score', 'depth', 'nodes', 'seconds', 'nps'])
+SearchResult.__doc__ = """
+The outcome of a search.
+
+best_move: the (start, end) move to play in algebraic notation, or None if there is no legal move
+pv:        the principal variation, the list of algebraic moves both sides are expected to play starting with best_move
+score:     the score for the player to move, positive is good. Scores near WIN_SCORE are forced wins.
+depth:     the deepest iteration that finished
+nodes:     the number of positions visited
+seconds:   how long the search took
+nps:       nodes per second
+"""
+
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search when the time or node budget runs out.
+    """
+
+
+def evaluate(game):
+    """
+    Scores the position for the player whose turn it is by how safe each of their piece types is from extinction,
+    compared to the opponents.
+
+    :parameter game: an unfinished ChessVar
+    :return: the score, positive if the player to move is better off
+    """
+    counts = game.get_piece_dict()
+    white = sum(COUNT_VALUES[min(counts[name], 8)] for name in WHITE_NAMES)
+    white += RAREST_VALUES[min(counts['r'], counts['b'], counts['n'], counts['p'])]
+    black = sum(COUNT_VALUES[min(counts[name], 8)] for name in BLACK_NAMES)
+    black += RAREST_VALUES[min(counts['R'], counts['B'], counts['N'], counts['P'])]
+    return white - black if game.get_turn() == "WHITE" else black - white
+
+
+def capture_value(name, counts):
+    """
+    :parameter name: the name of the piece being captured
+    :parameter counts: the games piece dictionary
+    :return: how much the capture hurts the opponent, the highest value going to a capture that wins the game
+    """
+    count = counts[name]
+    if count <= 1:
+        return WIN_SCORE
+    return COUNT_VALUES[min(count, 8)] - COUNT_VALUES[min(count, 8) - 1]
+
+
+def encode_move(move):
+    """
+    :parameter move: a (start, end) tuple of square indices
+    :return: the move packed as start * 64 + end, the way the transposition table stores it
+    """
+    return move[0] * 64 + move[1]
+
+
+def decode_move(code):
+    """
+    :parameter code: a move packed by encode_move
+    :return: the (start, end) tuple of square indices
+    """
+    return code >> 6, code & 63
+
+
+def move_names(move):
+    """
+    :parameter move: a (start, end) tuple of square indices
+    :return: the (start, end) tuple in algebraic notation
+    """
+    return SQUARE_NAMES[move[0]], SQUARE_NAMES[move[1]]
+
+
+class Searcher:
+    """
+    Searches ChessVar positions for the best move. Moves are handled as square indices inside the search (see
+    ChessVar.legal_moves_idx) and only converted to algebraic notation for the result. A Searcher keeps its
+    transposition table, killer moves and history scores between searches, so reusing one for every move of a game
+    makes later searches faster.
+
+    tt:        the TranspositionTable used to remember positions
+    tablebase: an optional Tablebase of solved positions, which are scored exactly without searching them
+    stop:      an optional event (EX: a multiprocessing.Event), the search aborts soon after it is set
+    _killers:  for each ply, the last two quiet moves that caused a beta cutoff
+    _history:  for each quiet move, a score that grows every time it causes a beta cutoff
+    """
+    def __init__(self, tt=None, tablebase=None):
+        self.tt = TranspositionTable() if tt is None else tt
+        self.tablebase = tablebase
+        self.stop = None
+        self._killers = [[None, None] for _ in range(MAX_PLY)]
+        self._history = {}
+        self._pv = [[] for _ in range(MAX_PLY + 1)]
+        self._game = None
+        self._nodes = 0
+        self._pushed = 0
+        self._deadline = None
+        self._node_limit = None
+
+    def clear(self):
+        """
+        Forgets everything learned from earlier searches, so the next search finds the same result a new Searcher
+        would.
+        """
+        self.tt.clear()
+        self._history.clear()
+
+    def search(self, game, max_depth=64, time_limit=None, node_limit=None, start_depth=1):
+        """
+        Finds the best move for the player to move. The game is searched in place with push_move_idx and pop_move, and
+        is left exactly as it was when the search returns.
+
+        :parameter game: the ChessVar to search, of any backend
+        :parameter max_depth: the deepest iteration to search
+        :parameter time_limit: seconds the search may take, or None for no limit
+        :parameter node_limit: positions the search may visit, or None for no limit
+        :parameter start_depth: the first iteration to search, helpers of a parallel search start deeper than the main
+                                search so they don't all do the same work
+        :return: a SearchResult
+        """
+        begin = time.perf_counter()
+        self._game = game
+        self._nodes = 0
+        self._pushed = 0
+        self._deadline = None if time_limit is None else begin + time_limit
+        self._node_limit = node_limit
+        for killers in self._killers:
+            killers[0] = killers[1] = None
+
+        moves = game.legal_moves_idx()
+        best_move = moves[0] if moves else None
+        pv = [best_move] if moves else []
+        score = 0
+        completed = 0
+
+        for depth in range(min(start_depth, max_depth), max_depth + 1):
+            if not moves:
+                break
+            try:
+                iteration_score = self._negamax(depth, -INFINITY, INFINITY, 0)
+            except SearchAborted:
+                while self._pushed:
+                    game.pop_move()
+                    self._pushed -= 1
+                break
+            score = iteration_score
+            pv = list(self._pv[0])
+            best_move = pv[0] if pv else best_move
+            completed = depth
+
+            if abs(score) >= WIN_SCORE - MAX_PLY:  # found a forced win or loss, searching deeper won't change it
+                break
+            if self._deadline is not None and time.perf_counter() - begin > (self._deadline - begin) / 2:
+                break  # the next iteration would most likely not finish in time
+
+        seconds = time.perf_counter() - begin
+        return SearchResult(None if best_move is None else move_names(best_move), [move_names(move) for move in pv],
+                            score, completed, self._nodes, seconds,
+                            self._nodes / seconds if seconds else 0.0)
+
+    def _count_node(self):
+        """
+        Counts a visited position and aborts the search if the node or time budget has run out or stop was set.
+        """
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchAborted
+        if not self._nodes & 1023:
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise SearchAborted
+            if self.stop is not None and self.stop.is_set():
+                raise SearchAborted
+
+    def _negamax(self, depth, alpha, beta, ply):
+        """
+        :parameter depth: how many more plies to search before the quiescence search takes over
+        :parameter alpha: the score the player to move is already guaranteed
+        :parameter beta: the score the opponent is already guaranteed (as a score for the player to move)
+        :parameter ply: how many plies from the root this position is
+        :return: the score of the position for the player to move
+        """
+        game = self._game
+        self._count_node()
+        self._pv[ply] = []
+
+        key = game.get_hash()
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_score, flag, code = entry
+            if code != NO_MOVE:
+                tt_move = decode_move(code)
+            if ply > 0 and entry_depth >= depth:
+                entry_score = _score_from_tt(entry_score, ply)
+                if flag == EXACT:
+                    return entry_score
+                if flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        if self.tablebase is not None and ply > 0:
+            solved = self.tablebase.probe_key(key)
+            if solved is not None:
+                result, distance = solved
+                if result == TB_WIN:
+                    return WIN_SCORE - ply - distance
+                if result == TB_LOSS:
+                    return -WIN_SCORE + ply + distance
+                return 0
+
+        if depth <= 0 or ply >= MAX_PLY:
+            return self._quiescence(alpha, beta, ply, 0)
+
+        moves = game.legal_moves_idx()
+        if not moves:  # the player to move is stuck, nobody can win from here
+            return 0
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+        squares = game.get_position()[0]
+        for move in self._order_moves(moves, tt_move, ply, squares):
+            captured = squares[move[1]]
+            game.push_move_idx(*move)
+            self._pushed += 1
+            if game.get_game_state() != "UNFINISHED":
+                score = WIN_SCORE - ply - 1
+                self._pv[ply + 1] = []
+            else:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            game.pop_move()
+            self._pushed -= 1
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                self._pv[ply] = [move] + self._pv[ply + 1]
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if captured is None:
+                    killers = self._killers[ply]
+                    if killers[0] != move:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                    self._history[move] = self._history.get(move, 0) + depth * depth
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.tt.store(key, min(depth, 255), _score_to_tt(best_score, ply), flag, encode_move(best_move))
+        return best_score
+
+    def _quiescence(self, alpha, beta, ply, quiescence_ply):
+        """
+        Only searches captures, so the evaluation is never taken in the middle of an exchange.
+
+        :parameter alpha: the score the player to move is already guaranteed
+        :parameter beta: the score the opponent is already guaranteed (as a score for the player to move)
+        :parameter ply: how many plies from the root this position is
+        :parameter quiescence_ply: how many plies into the quiescence search this position is
+        :return: the score of the position for the player to move
+        """
+        game = self._game
+        self._count_node()
+        self._pv[ply] = []
+
+        stand_pat = evaluate(game)
+        if stand_pat >= beta or quiescence_ply >= MAX_QUIESCENCE_PLY or ply >= MAX_PLY:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        counts = game.get_piece_dict()
+        squares = game.get_position()[0]
+        captures = []
+        for move in game.legal_moves_idx():
+            captured = squares[move[1]]
+            if captured is not None:
+                captures.append((capture_value(captured, counts), move))
+        captures.sort(reverse=True)
+
+        best_score = stand_pat
+        for _, move in captures:
+            game.push_move_idx(*move)
+            self._pushed += 1
+            if game.get_game_state() != "UNFINISHED":
+                score = WIN_SCORE - ply - 1
+                self._pv[ply + 1] = []
+            else:
+                score = -self._quiescence(-beta, -alpha, ply + 1, quiescence_ply + 1)
+            game.pop_move()
+            self._pushed -= 1
+
+            if score > best_score:
+                best_score = score
+                self._pv[ply] = [move] + self._pv[ply + 1]
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        return best_score
+
+    def _order_moves(self, moves, tt_move, ply, squares):
+        """
+        Sorts the moves so the ones most likely to be best are searched first: the transposition table move, then
+        captures (captures that win the game first), then the killer moves for this ply, then by history score.
+
+        :parameter moves: the legal moves as (start, end) tuples of square indices
+        :parameter tt_move: the best move stored for this position, or None
+        :parameter ply: how many plies from the root this position is
+        :parameter squares: the piece name or None on each square, from ChessVar.get_position
+        :return: the sorted list of moves
+        """
+        counts = self._game.get_piece_dict()
+        first_killer, second_killer = self._killers[ply]
+        scored = []
+        for move in moves:
+            if move == tt_move:
+                order = 4 * WIN_SCORE
+            else:
+                captured = squares[move[1]]
+                if captured is not None:
+                    order = 2 * WIN_SCORE + capture_value(captured, counts)
+                elif move == first_killer:
+                    order = WIN_SCORE + 2
+                elif move == second_killer:
+                    order = WIN_SCORE + 1
+                else:
+                    order = min(self._history.get(move, 0), WIN_SCORE)
+            scored.append((order, move))
+        scored.sort(reverse=True)
+        return [move for _, move in scored]
+
+
+def _score_to_tt(score, ply):
+    """
+    Win scores count plies from the root, but the transposition table needs them counted from the stored position.
+    """
+    if score >= WIN_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -WIN_SCORE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score, ply):
+    """
+    Converts a win score stored by _score_to_tt back to counting plies from the root.
+    """
+    if score >= WIN_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -WIN_SCORE + MAX_PLY:
+        return score + ply
+    return score
+
+
+def best_move(game, max_depth=64, time_limit=None, node_limit=None, tablebase=None):
+    """
+    Searches the game with a new Searcher. Use a Searcher directly to keep its tables between moves.
+
+    :parameter tablebase: an optional Tablebase to probe during the search
+    :return: a SearchResult, see Searcher.search for the other parameters
+    """
+    return Searcher(tablebase=tablebase).search(game, max_depth, time_limit, node_limit)
+
+
+def quiet_positions(count, seed, max_plies=30):
+    """
+    Collects positions from random games where neither side can force a win within three plies, so searching
+    them takes real work.
+
+    :parameter count: how many positions to collect
+    :parameter seed: the seed for the random number generator so runs can be repeated
+    :parameter max_plies: positions are taken at most this many plies into a game
+    :return: a list of ChessVar games
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = ChessVar(backend="bitboard")
+        for _ in range(rng.randrange(4, max_plies)):
+            moves = game.legal_moves_idx()
+            if not moves or game.get_game_state() != "UNFINISHED":
+                break
+            game.push_move_idx(*rng.choice(moves))
+        if game.get_game_state() == "UNFINISHED" and game.legal_moves_idx() and \
+                abs(Searcher().search(game, 3).score) < WIN_SCORE - MAX_PLY:
+            positions.append(game)
+    return positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="search the starting position for the best move")
+    parser.add_argument('--time', type=float, default=5.0, help='seconds to search')
+    parser.add_argument('--depth', type=int, default=64, help='deepest iteration to search')
+    parser.add_argument('--tablebase', default=None, help='a tablebase file made by tablebase.py to probe')
+    args = parser.parse_args()
+
+    tablebase = None if args.tablebase is None else Tablebase(args.tablebase)
+    result = best_move(ChessVar(backend="bitboard"), args.depth, args.time, tablebase=tablebase)
+    print(f'best move {result.best_move}  score {result.score}  depth {result.depth}')
+    print(f'pv {" ".join(start + end for start, end in result.pv)}')
+    print(f'{result.nodes} nodes in {result.seconds:.2f}s ({result.nps:,.0f} nodes/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Plays large numbers of complete ChessVar games against itself across a pool of worker processes, for
+#               building datasets to tune openings and balance. Finished games are streamed back to the parent as soon
+#               as their batch completes instead of being collected at the end, so the parent can write them out while
+#               the workers keep playing.
+#
+#               Every game gets its own seed worked out from the run seed and the game number, so a run can be repeated
+#               exactly no matter how many workers play it or in which order the games finish.
+#
+#               Run from the project folder with:
+#                   python selfplay.py --games N [--workers W] [--seed S] [--player random|capture|search]
+#                                      [--opening-plies N] [--out FILE]
+
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import sys
+import time
+
+from ChessVar import ChessVar
+from search import Searcher
+
+PLAYERS = ('random', 'capture', 'search')
+
+
+def game_seed(run_seed, index):
+    """
+    :parameter run_seed: the seed of the whole run
+    :parameter index: the number of the game within the run
+    :return: the seed for that game
+    """
+    return run_seed * 1000003 + index
+
+
+def extinct_type(game):
+    """
+    :parameter game: a finished ChessVar
+    :return: the name of the piece type that was wiped out (EX: 'Q' if black lost its queen), or None
+    """
+    for name, count in game.get_piece_dict().items():
+        if count == 0:
+            return name
+    return None
+
+
+def choose_move(game, player, rng, searcher=None, node_limit=2000):
+    """
+    :parameter game: the ChessVar to pick a move for
+    :parameter player: "random" picks any legal move, "capture" picks a capture when there is one (otherwise any
+                       move), "search" uses the alpha-beta search with a node budget
+    :parameter rng: the random.Random to pick moves with
+    :parameter searcher: the Searcher to reuse when player is "search"
+    :parameter node_limit: the node budget for each search
+    :return: the chosen (start, end) move, or None if there are no legal moves
+    """
+    moves = game.legal_moves()
+    if not moves:
+        return None
+    if player == 'capture':
+        captures = [move for move in moves if game.get_piece_name(move[1]) is not None]
+        return rng.choice(captures or moves)
+    if player == 'search':
+        return searcher.search(game, node_limit=node_limit).best_move
+    return rng.choice(moves)
+
+
+def play_game(index, run_seed, player='random', max_plies=300, node_limit=2000, opening_plies=0):
+    """
+    Plays one complete game.
+
+    :parameter index: the number of the game within the run
+    :parameter run_seed: the seed of the whole run
+    :parameter player: which player plays both sides, see choose_move
+    :parameter max_plies: the game is stopped (and counted as unfinished) after this many plies
+    :parameter node_limit: the node budget for each search when player is "search"
+    :parameter opening_plies: how many plies at the start are played at random, so that deterministic players still
+                              produce different games
+    :return: a dictionary with the games index, seed, moves, winner (the final get_game_state), extinct piece name
+             (see extinct_type) and ply count
+    """
+    seed = game_seed(run_seed, index)
+    rng = random.Random(seed)
+    game = ChessVar(backend="bitboard")
+    searcher = Searcher() if player == 'search' else None
+    moves = []
+    while game.get_game_state() == "UNFINISHED" and len(moves) < max_plies:
+        move = choose_move(game, 'random' if len(moves) < opening_plies else player, rng, searcher, node_limit)
+        if move is None:
+            break
+        game.make_move(*move)
+        moves.append(move[0] + move[1])
+    return {'index': index, 'seed': seed, 'moves': moves, 'winner': game.get_game_state(),
+            'extinct': extinct_type(game), 'plies': len(moves)}
+
+
+def play_batch(indices, run_seed, player, max_plies, node_limit, opening_plies):
+    """
+    Plays a batch of games inside a worker process. Games are handed out in batches so sending work to the workers
+    doesn't cost more than playing it.
+
+    :return: a list of the results of play_game
+    """
+    return [play_game(index, run_seed, player, max_plies, node_limit, opening_plies) for index in indices]
+
+
+def run_selfplay(games, workers=None, run_seed=0, player='random', max_plies=300, node_limit=2000, opening_plies=0,
+                 batch_size=16):
+    """
+    Plays games across a pool of worker processes and yields each one as soon as its batch is finished. Only a few
+    batches per worker are handed out at a time, so memory stays flat no matter how many games are played.
+
+    :parameter games: how many games to play
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :parameter run_seed: the seed of the whole run
+    :parameter player: which player plays both sides, see choose_move
+    :parameter max_plies: the game is stopped after this many plies
+    :parameter node_limit: the node budget for each search when player is "search"
+    :parameter opening_plies: how many plies at the start of each game are played at random
+    :parameter batch_size: how many games each task plays
+    :return: a generator of game result dictionaries, in the order they finish
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = (range(start, min(start + batch_size, games)) for start in range(0, games, batch_size))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for batch in batches:
+            pending.add(executor.submit(play_batch, batch, run_seed, player, max_plies, node_limit, opening_plies))
+            if len(pending) >= workers * 2:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in concurrent.futures.as_completed(pending):
+            yield from future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="play ChessVar games against itself across worker processes")
+    parser.add_argument('--games', type=int, default=1000, help='number of games to play')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of CPUs)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the run')
+    parser.add_argument('--player', default='random', choices=PLAYERS, help='player used for both sides')
+    parser.add_argument('--max-plies', type=int, default=300, help='longest a game may go')
+    parser.add_argument('--nodes', type=int, default=2000, help='node budget per move for the search player')
+    parser.add_argument('--opening-plies', type=int, default=0, help='plies played at random at the start of a game')
+    parser.add_argument('--batch-size', type=int, default=16, help='games per task sent to a worker')
+    parser.add_argument('--out', default=None, help='file to write one JSON game per line to (default: stdout)')
+    args = parser.parse_args()
+
+    out = open(args.out, 'w') if args.out else sys.stdout
+    begin = time.perf_counter()
+    finished = 0
+    plies = 0
+    winners = {}
+    try:
+        for result in run_selfplay(args.games, args.workers, args.seed, args.player, args.max_plies, args.nodes,
+                                   args.opening_plies, args.batch_size):
+            out.write(json.dumps(result) + '\n')
+            finished += 1
+            plies += result['plies']
+            winners[result['winner']] = winners.get(result['winner'], 0) + 1
+    finally:
+        if args.out:
+            out.close()
+    seconds = time.perf_counter() - begin
+    print(f'{finished} games, {plies} plies in {seconds:.2f}s ({finished / seconds:,.1f} games/s, '
+          f'{plies / seconds:,.0f} plies/s)  results {winners}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  An asyncio game server that hosts many ChessVar games at once in a single event loop. Clients connect
+#               over TCP and talk in JSON lines: every message is one JSON object on its own line with a "type". One
+#               connection can play or watch any number of games.
+#
+#               Messages a client can send (any message may carry a "ref", which is copied into the reply):
+#                   {"type": "create"}                               start a game and play it as white
+#                   {"type": "join", "game": ID}                     play black in a game
+#                   {"type": "watch", "game": ID}                    follow a game as a spectator
+#                   {"type": "move", "game": ID, "move": "e2e4"}     make a move in a game you are playing
+#                   {"type": "leave", "game": ID}                    stop playing or watching a game
+#                   {"type": "ping"}
+#
+#               Messages the server sends:
+#                   {"type": "created", "game": ID, "color": "WHITE"}
+#                   {"type": "joined", "game": ID, "color": C, "fen": ...}   to everyone in the game when a player joins,
+#                                                                          the fen lets the new player set up the board
+#                   {"type": "watching", "game": ID, "fen": ...}
+#                   {"type": "moved", "game": ID, "ply": N, "move": "e2e4", "captured": "Q" or null, "turn": ...,
+#                    "state": ...}                                          to the players and spectators after a move
+#                   {"type": "left", "game": ID, "color": C}                a player left or disconnected
+#                   {"type": "closed", "game": ID, "reason": "idle"}        the game was removed
+#                   {"type": "error", "error": ...}                         the message was refused
+#                   {"type": "pong"}
+#
+#               Only what changed is sent after each move, so clients keep their own copy of the board up to date
+#               with the "moved" messages. Games nobody has moved in for a while are removed, and each game only
+#               accepts a limited number of moves per second.
+#
+#               Run from the project folder with:
+#                   python server.py [--host HOST] [--port PORT] [--idle SECONDS] [--move-rate N] [--move-burst N]
+#               and see loadgen.py for a client that plays thousands of games against it.
+
+import argparse
+import asyncio
+import itertools
+import json
+
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_INDEX, SQUARE_NAMES
+
+DEFAULT_PORT = 8765
+
+
+class RateLimiter:
+    """
+    A token bucket: rate tokens are added every second, up to burst, and each allowed action takes one.
+    """
+    def __init__(self, rate, burst, now):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = now
+
+    def allow(self, now):
+        """
+        :parameter now: the current time in seconds
+        :return: True if the action is allowed, False if the bucket is empty
+        """
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class Session:
+    """
+    One hosted game.
+
+    game_id:     the number clients use to refer to the game
+    game:        the ChessVar being played
+    players:     a dictionary of the Connection playing each color
+    spectators:  the set of Connections watching
+    last_active: the loop time of the last move or join, used to remove idle games
+    plies:       how many moves have been made
+    limiter:     the RateLimiter for moves in this game
+    """
+    def __init__(self, game_id, game, limiter, now):
+        self.game_id = game_id
+        self.game = game
+        self.players = {}
+        self.spectators = set()
+        self.last_active = now
+        self.plies = 0
+        self.limiter = limiter
+
+
+class Connection:
+    """
+    One connected client and the games it is in. A client that falls more than max_buffer bytes behind on reading its
+    messages is disconnected, so one slow spectator can't make the server hold on to messages without end.
+    """
+    def __init__(self, writer, max_buffer):
+        self.writer = writer
+        self.games = set()
+        self._max_buffer = max_buffer
+
+    def send(self, data):
+        """
+        :parameter data: an already encoded JSON line
+        """
+        transport = self.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > self._max_buffer:
+            transport.abort()
+            return
+        self.writer.write(data)
+
+
+def encode(message):
+    """
+    :parameter message: a dictionary
+    :return: the message as a JSON line in bytes
+    """
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+class GameServer:
+    """
+    Hosts the games and answers the clients. All the work happens on one event loop, so nothing needs a lock.
+    """
+    def __init__(self, idle_timeout=300.0, move_rate=10.0, move_burst=20, max_buffer=1 << 20, backend="bitboard"):
+        """
+        :parameter idle_timeout: seconds without a move or join before a game is removed
+        :parameter move_rate: moves per second each game accepts on average
+        :parameter move_burst: moves a game accepts in a row before move_rate applies
+        :parameter max_buffer: bytes of unsent messages a client may fall behind by before it is disconnected
+        :parameter backend: the board backend of the hosted games
+        """
+        self.idle_timeout = idle_timeout
+        self.move_rate = move_rate
+        self.move_burst = move_burst
+        self.max_buffer = max_buffer
+        self.backend = backend
+        self.sessions = {}
+        self.connections = set()
+        self.moves = 0
+        self._ids = itertools.count(1)
+        self._evictor = None
+        self._handlers = {'create': self._create, 'join': self._join, 'watch': self._watch, 'move': self._move,
+                          'leave': self._leave, 'ping': self._ping}
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        """
+        Starts listening and removing idle games in the background.
+
+        :return: the asyncio Server
+        """
+        server = await asyncio.start_server(self.handle_client, host, port)
+        self._evictor = asyncio.get_running_loop().create_task(self._evict_idle())
+        return server
+
+    async def handle_client(self, reader, writer):
+        """
+        Reads and answers one clients messages until it disconnects.
+        """
+        connection = Connection(writer, self.max_buffer)
+        self.connections.add(connection)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    self.dispatch(connection, line)
+                    if writer.transport.get_write_buffer_size():
+                        await writer.drain()
+                except (ConnectionError, ValueError):  # ValueError is a line longer than the reader allows
+                    break
+        finally:
+            self._disconnect(connection)
+            writer.close()
+
+    def dispatch(self, connection, line):
+        """
+        Answers one message from a client.
+
+        :parameter connection: the Connection the message came from
+        :parameter line: the raw JSON line
+        """
+        try:
+            message = json.loads(line)
+            handler = self._handlers[message['type']]
+        except (ValueError, KeyError, TypeError):
+            connection.send(encode({'type': 'error', 'error': 'unreadable message'}))
+            return
+        reply = handler(connection, message)
+        if reply is not None:
+            if 'ref' in message:
+                reply['ref'] = message['ref']
+            connection.send(encode(reply))
+
+    def _session(self, message):
+        """
+        :return: the Session named by the messages "game", or None
+        """
+        try:
+            return self.sessions.get(int(message['game']))
+        except (KeyError, TypeError, ValueError, OverflowError):  # OverflowError is an infinite number
+            return None
+
+    def _create(self, connection, message):
+        now = asyncio.get_running_loop().time()
+        session = Session(next(self._ids), ChessVar(backend=self.backend),
+                          RateLimiter(self.move_rate, self.move_burst, now), now)
+        session.players["WHITE"] = connection
+        self.sessions[session.game_id] = session
+        connection.games.add(session.game_id)
+        return {'type': 'created', 'game': session.game_id, 'color': "WHITE"}
+
+    def _join(self, connection, message):
+        session = self._session(message)
+        if session is None:
+            return {'type': 'error', 'error': 'no such game'}
+        color = "BLACK" if "BLACK" not in session.players else "WHITE" if "WHITE" not in session.players else None
+        if color is None:
+            return {'type': 'error', 'game': session.game_id, 'error': 'game is full'}
+        session.players[color] = connection
+        session.last_active = asyncio.get_running_loop().time()
+        connection.games.add(session.game_id)
+        self._broadcast(session, {'type': 'joined', 'game': session.game_id, 'color': color,
+                                  'fen': session.game.to_fen()})
+        return None
+
+    def _watch(self, connection, message):
+        session = self._session(message)
+        if session is None:
+            return {'type': 'error', 'error': 'no such game'}
+        session.spectators.add(connection)
+        connection.games.add(session.game_id)
+        return {'type': 'watching', 'game': session.game_id, 'fen': session.game.to_fen()}
+
+    def _move(self, connection, message):
+        session = self._session(message)
+        if session is None:
+            return {'type': 'error', 'error': 'no such game'}
+        game = session.game
+        if game.get_game_state() != "UNFINISHED":
+            return {'type': 'error', 'game': session.game_id, 'error': 'game is over'}
+        if session.players.get(game.get_turn()) is not connection:
+            return {'type': 'error', 'game': session.game_id, 'error': 'not your turn'}
+        move = message.get('move')
+        start = SQUARE_INDEX.get(move[:2]) if isinstance(move, str) else None
+        end = SQUARE_INDEX.get(move[2:]) if isinstance(move, str) else None
+        if start is None or end is None:
+            return {'type': 'error', 'game': session.game_id, 'error': 'unreadable move'}
+        now = asyncio.get_running_loop().time()
+        if not session.limiter.allow(now):
+            return {'type': 'error', 'game': session.game_id, 'error': 'rate limited'}
+        captured = game.get_position()[0][end]
+        if not game.make_move_idx(start, end):
+            return {'type': 'error', 'game': session.game_id, 'error': 'illegal move'}
+        session.plies += 1
+        session.last_active = now
+        self.moves += 1
+        self._broadcast(session, {'type': 'moved', 'game': session.game_id, 'ply': session.plies,
+                                  'move': SQUARE_NAMES[start] + SQUARE_NAMES[end], 'captured': captured,
+                                  'turn': game.get_turn(), 'state': game.get_game_state()})
+        return None
+
+    def _leave(self, connection, message):
+        session = self._session(message)
+        if session is None:
+            return {'type': 'error', 'error': 'no such game'}
+        self._remove_from(session, connection)
+        connection.games.discard(session.game_id)
+        return None
+
+    def _ping(self, connection, message):
+        return {'type': 'pong'}
+
+    def _broadcast(self, session, message):
+        """
+        Sends a message to the players and spectators of a game, encoding it only once.
+        """
+        data = encode(message)
+        for connection in set(session.players.values()) | session.spectators:
+            connection.send(data)
+
+    def _remove_from(self, session, connection):
+        """
+        Takes a connection out of a game, telling the others if it was a player.
+        """
+        session.spectators.discard(connection)
+        for color, player in list(session.players.items()):
+            if player is connection:
+                del session.players[color]
+                self._broadcast(session, {'type': 'left', 'game': session.game_id, 'color': color})
+
+    def _disconnect(self, connection):
+        self.connections.discard(connection)
+        for game_id in connection.games:
+            session = self.sessions.get(game_id)
+            if session is not None:
+                self._remove_from(session, connection)
+        connection.games.clear()
+
+    def _close(self, session, reason):
+        """
+        Removes a game and tells everyone in it.
+        """
+        self._broadcast(session, {'type': 'closed', 'game': session.game_id, 'reason': reason})
+        for connection in set(session.players.values()) | session.spectators:
+            connection.games.discard(session.game_id)
+        del self.sessions[session.game_id]
+
+    async def _evict_idle(self):
+        """
+        Removes games nobody has moved in for idle_timeout seconds, checking a few times per timeout.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 4, 0.05))
+            cutoff = loop.time() - self.idle_timeout
+            for session in [session for session in self.sessions.values() if session.last_active < cutoff]:
+                self._close(session, 'idle')
+
+    def stats(self):
+        """
+        :return: a dictionary with the number of games, connections and moves made so far
+        """
+        return {'games': len(self.sessions), 'connections': len(self.connections), 'moves': self.moves}
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, **options):
+    """
+    Runs a GameServer until cancelled.
+
+    :parameter options: passed on to GameServer
+    """
+    game_server = GameServer(**options)
+    server = await game_server.start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="host ChessVar games over TCP with a JSON line protocol")
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+    parser.add_argument('--idle', type=float, default=300.0, help='seconds before a game without moves is removed')
+    parser.add_argument('--move-rate', type=float, default=10.0, help='moves per second each game accepts')
+    parser.add_argument('--move-burst', type=int, default=20, help='moves a game accepts in a row')
+    parser.add_argument('--backend', default='bitboard', choices=sorted(BACKENDS), help='board backend to use')
+    args = parser.parse_args()
+    print(f'serving on {args.host}:{args.port}')
+    try:
+        asyncio.run(serve(args.host, args.port, idle_timeout=args.idle, move_rate=args.move_rate,
+                          move_burst=args.move_burst, backend=args.backend))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Searches one position with several worker processes at once ("lazy SMP"). Every worker runs the normal
+#               Searcher on the same root, and they all share one transposition table kept in shared memory, so each
+#               worker finds the results the others have already stored and they spread out over different parts of the
+#               tree without any other coordination. Half the workers start one iteration deeper than the others so
+#               they don't all search the same depth at the same moment. The table entries are lockless (see
+#               transposition.py): a probe that catches an entry half written by another process just counts it as a
+#               miss.
+#
+#               The first worker to finish stops the rest, and the result of whichever worker got the deepest is
+#               returned. The workers are started once and kept for every search, like the tables of a Searcher.
+#
+#               Run from the project folder with:
+#                   python smp.py [--depth N] [--workers 1 2 4 8] [--positions N]
+#               to report how the time to reach a depth scales with the number of worker processes.
+
+import argparse
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+
+from ChessVar import ChessVar
+from search import Searcher, SearchResult, quiet_positions
+from transposition import TranspositionTable, BUCKET_BYTES
+
+
+def _worker(number, memory_name, tasks, results, stop):
+    """
+    Runs searches sent by a ParallelSearcher until it sends None.
+
+    :parameter number: the number of this worker, worker 0 is the main one
+    :parameter memory_name: the name of the shared memory holding the transposition table
+    :parameter tasks: the queue of (fen, max_depth, time_limit, node_limit) searches for this worker
+    :parameter results: the queue to put (number, SearchResult) on
+    :parameter stop: the event that aborts the current search
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    searcher = Searcher(tt=TranspositionTable(buffer=memory.buf))
+    searcher.stop = stop
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        fen, max_depth, time_limit, node_limit = task
+        game = ChessVar.from_fen(fen, backend="bitboard")
+        results.put((number, searcher.search(game, max_depth, time_limit, node_limit, start_depth=1 + number % 2)))
+    del searcher  # the table's views of the shared memory have to go before it can be closed
+    memory.close()
+
+
+class ParallelSearcher:
+    """
+    Searches positions with a group of worker processes sharing a transposition table. Close it (or use it as a context
+    manager) to stop the workers and free the shared memory.
+
+    workers: the number of worker processes
+    """
+    def __init__(self, workers=None, megabytes=64):
+        """
+        :parameter workers: the number of worker processes, defaults to the number of CPUs
+        :parameter megabytes: the size of the shared transposition table
+        """
+        self.workers = workers or os.cpu_count() or 1
+        size = max(BUCKET_BYTES, int(megabytes * 1024 * 1024))
+        self._memory = shared_memory.SharedMemory(create=True, size=size)
+        self._stop = multiprocessing.Event()
+        self._results = multiprocessing.Queue()
+        self._tasks = [multiprocessing.Queue() for _ in range(self.workers)]
+        self._processes = [multiprocessing.Process(target=_worker, daemon=True,
+                                                   args=(number, self._memory.name, tasks, self._results, self._stop))
+                           for number, tasks in enumerate(self._tasks)]
+        for process in self._processes:
+            process.start()
+
+    def clear(self):
+        """
+        Empties the shared transposition table, so the next search starts from nothing.
+        """
+        TranspositionTable(buffer=self._memory.buf).clear()
+
+    def _next_result(self):
+        """
+        :return: the next (number, SearchResult) a worker finished
+        """
+        while True:
+            try:
+                return self._results.get(timeout=1.0)
+            except queue.Empty:
+                if not all(process.is_alive() for process in self._processes):
+                    raise RuntimeError('a search worker process died')
+
+    def search(self, game, max_depth=64, time_limit=None, node_limit=None):
+        """
+        Finds the best move for the player to move. The game itself isn't touched, the workers search their own copy.
+
+        :parameter game: the ChessVar to search, of any backend
+        :parameter max_depth: the deepest iteration to search
+        :parameter time_limit: seconds the search may take, or None for no limit
+        :parameter node_limit: positions each worker may visit, or None for no limit
+        :return: a SearchResult from the worker that got the deepest, with the nodes of every worker added together
+        """
+        begin = time.perf_counter()
+        fen = game.to_fen()
+        self._stop.clear()
+        for tasks in self._tasks:
+            tasks.put((fen, max_depth, time_limit, node_limit))
+        finished = [self._next_result()]
+        self._stop.set()
+        while len(finished) < self.workers:
+            finished.append(self._next_result())
+
+        best = finished[0][1]
+        for number, result in finished:
+            if result.depth > best.depth:
+                best = result
+        nodes = sum(result.nodes for number, result in finished)
+        seconds = time.perf_counter() - begin
+        return SearchResult(best.best_move, best.pv, best.score, best.depth, nodes, seconds,
+                            nodes / seconds if seconds else 0.0)
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+        self._stop.set()
+        for tasks in self._tasks:
+            tasks.put(None)
+        for process in self._processes:
+            process.join()
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def time_to_depth(positions, depth, worker_counts, megabytes=64):
+    """
+    Times searching every position to a fixed depth, starting from an empty table each time.
+
+    :parameter positions: the games to search
+    :parameter depth: the depth to search them to
+    :parameter worker_counts: the numbers of worker processes to try
+    :parameter megabytes: the size of the shared transposition table
+    :return: a dictionary mapping each number of workers to (seconds, nodes) over all the positions
+    """
+    timings = {}
+    for workers in worker_counts:
+        seconds = 0.0
+        nodes = 0
+        with ParallelSearcher(workers, megabytes) as searcher:
+            for game in positions:
+                searcher.clear()
+                result = searcher.search(game, depth)
+                seconds += result.seconds
+                nodes += result.nodes
+        timings[workers] = (seconds, nodes)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="time to depth of the parallel search against the number of workers")
+    parser.add_argument('--depth', type=int, default=4, help='depth to search each position to')
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='numbers of worker processes to try (default: 1, 2, 4, ... up to the number of CPUs)')
+    parser.add_argument('--positions', type=int, default=10, help='number of positions to search')
+    parser.add_argument('--seed', type=int, default=2023, help='seed used to pick the positions')
+    parser.add_argument('--hash', type=int, default=64, help='megabytes of shared transposition table')
+    args = parser.parse_args()
+
+    worker_counts = args.workers
+    if worker_counts is None:
+        cpus = os.cpu_count() or 1
+        worker_counts = [1 << power for power in range(cpus.bit_length()) if 1 << power <= cpus]
+        if worker_counts[-1] != cpus:
+            worker_counts.append(cpus)
+    positions = quiet_positions(args.positions, args.seed)
+    timings = time_to_depth(positions, args.depth, worker_counts, args.hash)
+
+    base = timings[worker_counts[0]][0]
+    print(f'{args.positions} positions to depth {args.depth} on {os.cpu_count()} CPUs')
+    for workers, (seconds, nodes) in timings.items():
+        print(f'{workers:>3} workers: {seconds:8.2f}s  {nodes:>10} nodes  {nodes / seconds:>10,.0f} nodes/s  '
+              f'{base / seconds:.2f}x the speed of {worker_counts[0]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Solves positions exactly by retrograde analysis and stores the results in a memory-mapped file the
+#               search and other tools can probe in a few microseconds.
+#
+#               A classic endgame tablebase lists every position with up to N pieces, but in this variant a side loses
+#               the moment any of its piece types runs out, so every position still being played has at least 12
+#               pieces (one of each type for both sides) and there are far too many of them to list. Instead the
+#               positions are worked out from a set of root positions: every position reachable from a root within a
+#               number of plies is generated, and the results are then propagated backwards from the positions where
+#               the game is over:
+#                   - a finished position is lost for the player to move (their opponent just wiped out a type)
+#                   - a position is won if some move leads to a lost position, in one more ply than the fastest one
+#                   - a position is lost if every move leads to a won position, in one more ply than the slowest one
+#                   - a position where the player to move has no legal moves is a draw, and so is any position that
+#                     is neither won nor lost and can't reach the horizon, since then the whole game from there is known
+#               Positions at the horizon aren't searched further, so a position can also stay unsolved, and only the
+#               solved ones are stored. The Zobrist hash used as the key includes which pawns can still move two
+#               squares, so positions that only differ in that are kept apart.
+#
+#               Generating the positions is split across worker processes by the moves from each root.
+#
+#               The roots have to be picked with care. From the starting position white wins at once with g1d8, and
+#               almost every position of a real game has such a capture of a last piece, so its table holds nothing
+#               but the root. Roots where every piece type has at least two pieces can't be won in one move and give
+#               real tables, EX: RNBQKBNR/PPPKQPPP/8/8/8/8/pppkqppp/rnbqkbnr w abcfghABCFGH - (about 13,000 positions
+#               at 2 plies and 700,000 at 3).
+#
+#               Run from the project folder with:
+#                   python tablebase.py build FILE --fen FEN [FEN ...] [--plies N] [--workers W]
+#                   python tablebase.py probe FILE [--fen FEN] [--moves e2e4 ...]
+
+import argparse
+import array
+import collections
+import concurrent.futures
+import os
+import struct
+import time
+
+from ChessVar import ChessVar, START_FEN
+from keyfile import KeyFile, write_keyfile
+
+MAGIC = b'CVTBASE1'
+WIN = 1
+LOSS = 2
+DRAW = 3
+RESULT_NAMES = {WIN: 'win', LOSS: 'loss', DRAW: 'draw'}
+
+# what was found out about a position while generating
+TERMINAL = 0   # the game is over
+STUCK = 1      # no legal moves
+IMMEDIATE = 2  # a move wins the game right away, so the other moves don't matter
+FRONTIER = 3   # at the horizon, not searched further
+EXPANDED = 4   # every move was followed
+
+_VALUE_FORMAT = 'BB'  # result, distance in plies
+MAX_DISTANCE = 255  # the largest distance a 'B' can hold
+_HEADER = struct.Struct('<HI')  # plies, number of roots
+
+TablebaseStats = collections.namedtuple('TablebaseStats', ['positions', 'wins', 'losses', 'draws', 'unsolved',
+                                                           'seconds'])
+TablebaseStats.__doc__ = """
+What build_tablebase generated: how many positions were reached, how many of them were solved as each result and how
+many were left unsolved, and how long it took.
+"""
+
+
+def _winning_capture(game, moves):
+    """
+    :return: True if one of the moves captures the last piece of a type
+    """
+    squares = game.get_position()[0]
+    counts = game.get_piece_dict()
+    for start, end in moves:
+        captured = squares[end]
+        if captured is not None and counts[captured] == 1:
+            return True
+    return False
+
+
+def explore(fen, plies):
+    """
+    Generates every position reachable from a position within plies plies.
+
+    :parameter fen: the position to start from (see ChessVar.parse_fen)
+    :parameter plies: how many plies deep to go
+    :return: a dictionary mapping the hash of each position to (kind, array of the hashes after each move or None)
+    """
+    game = ChessVar.from_fen(fen, backend="bitboard")
+    nodes = {}
+    reached = {}
+
+    def visit(remaining):
+        key = game.get_hash()
+        if reached.get(key, -1) >= remaining:
+            return key
+        reached[key] = remaining
+        if game.get_game_state() != "UNFINISHED":
+            nodes[key] = (TERMINAL, None)
+            return key
+        moves = game.legal_moves_idx()
+        if not moves:
+            nodes[key] = (STUCK, None)
+        elif _winning_capture(game, moves):
+            nodes[key] = (IMMEDIATE, None)
+        elif remaining == 0:
+            nodes[key] = (FRONTIER, None)
+        else:
+            children = array.array('Q')
+            for move in moves:
+                game.push_move_idx(*move)
+                children.append(visit(remaining - 1))
+                game.pop_move()
+            nodes[key] = (EXPANDED, children)
+        return key
+
+    visit(plies)
+    return nodes
+
+
+def _merge(nodes, found):
+    """
+    Adds positions generated by explore to nodes, keeping the expanded version of a position reached at the horizon by
+    one worker and expanded by another.
+    """
+    for key, node in found.items():
+        existing = nodes.get(key)
+        if existing is None or existing[0] == FRONTIER and node[0] != FRONTIER:
+            nodes[key] = node
+
+
+def generate(roots, plies, workers=None):
+    """
+    Generates every position reachable from the roots within plies plies, with the subtree below each move of each
+    root generated by a separate task.
+
+    :parameter roots: a list of positions (see ChessVar.parse_fen)
+    :parameter plies: how many plies deep to go
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :return: the dictionary of positions, see explore
+    """
+    nodes = {}
+    tasks = []
+    for fen in roots:
+        if plies <= 1:
+            _merge(nodes, explore(fen, plies))
+            continue
+        game = ChessVar.from_fen(fen, backend="bitboard")
+        top = explore(fen, 1)
+        _merge(nodes, top)
+        if top[game.get_hash()][0] != EXPANDED:
+            continue
+        for move in game.legal_moves_idx():
+            game.push_move_idx(*move)
+            tasks.append(game.to_fen())
+            game.pop_move()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        for found in executor.map(explore, tasks, [plies - 1] * len(tasks), chunksize=4):
+            _merge(nodes, found)
+    return nodes
+
+
+def solve(nodes):
+    """
+    Runs the retrograde analysis over the generated positions.
+
+    :parameter nodes: the dictionary of positions made by generate or explore
+    :return: a dictionary mapping the hash of each solved position to (result, distance in plies)
+    """
+    keys = list(nodes)
+    index = {key: number for number, key in enumerate(keys)}
+    count = len(keys)
+    results = bytearray(count)
+    distances = array.array('H', bytes(2 * count))
+    remaining = array.array('I', bytes(4 * count))
+    longest = array.array('H', bytes(2 * count))
+    parents = [[] for _ in range(count)]
+    frontier = []
+    terminal = []
+    immediate = []
+
+    for number, key in enumerate(keys):
+        kind, children = nodes[key]
+        if kind == TERMINAL:
+            results[number] = LOSS
+            terminal.append(number)
+        elif kind == STUCK:
+            results[number] = DRAW
+        elif kind == IMMEDIATE:
+            results[number] = WIN
+            distances[number] = 1
+            immediate.append(number)
+        elif kind == FRONTIER:
+            frontier.append(number)
+        else:
+            unique = set(children)
+            remaining[number] = len(unique)
+            for child in unique:
+                parents[index[child]].append(number)
+
+    # every position is taken off the queue in order of distance, so wins get the shortest distance and losses the
+    # longest
+    queue = collections.deque(terminal + immediate)
+    while queue:
+        number = queue.popleft()
+        result = results[number]
+        distance = distances[number]
+        for parent in parents[number]:
+            if results[parent]:
+                continue
+            if result == LOSS:
+                results[parent] = WIN
+                distances[parent] = distance + 1
+                queue.append(parent)
+            elif result == WIN:
+                remaining[parent] -= 1
+                longest[parent] = max(longest[parent], distance)
+                if not remaining[parent]:
+                    results[parent] = LOSS
+                    distances[parent] = longest[parent] + 1
+                    queue.append(parent)
+
+    # an unsolved position that can't reach the horizon through other unsolved positions is a draw
+    can_reach = bytearray(count)
+    stack = list(frontier)
+    for number in stack:
+        can_reach[number] = 1
+    while stack:
+        number = stack.pop()
+        for parent in parents[number]:
+            if not results[parent] and not can_reach[parent]:
+                can_reach[parent] = 1
+                stack.append(parent)
+    for number in range(count):
+        if not results[number] and not can_reach[number]:
+            results[number] = DRAW
+
+    return {keys[number]: (results[number], distances[number]) for number in range(count) if results[number]}
+
+
+def build_tablebase(path, roots, plies=4, workers=None):
+    """
+    Generates, solves and writes a tablebase. Raises ValueError if a distance doesn't fit in the file, and nothing is
+    written then.
+
+    :parameter path: the file to write
+    :parameter roots: the positions to start from, see the description at the top of the file
+    :parameter plies: how many plies from the roots to generate
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :return: TablebaseStats
+    """
+    if plies > 255:
+        raise ValueError('plies must be at most 255')
+    begin = time.perf_counter()
+    nodes = generate(list(roots), plies, workers)
+    solved = solve(nodes)
+    longest = max((distance for result, distance in solved.values()), default=0)
+    if longest > MAX_DISTANCE:
+        raise ValueError(f'a distance of {longest} plies does not fit in the file, the most is {MAX_DISTANCE}')
+    write_keyfile(path, MAGIC, _VALUE_FORMAT, solved.items(), _HEADER.pack(plies, len(roots)))
+    tally = collections.Counter(result for result, distance in solved.values())
+    return TablebaseStats(len(nodes), tally[WIN], tally[LOSS], tally[DRAW], len(nodes) - len(solved),
+                          time.perf_counter() - begin)
+
+
+class Tablebase:
+    """
+    A tablebase file opened for probing. It is memory-mapped, so several processes can share one copy.
+
+    plies: how many plies from the roots it was generated to
+    roots: how many root positions it was generated from
+    """
+    def __init__(self, path):
+        self._file = KeyFile(path, MAGIC, _VALUE_FORMAT)
+        self.plies, self.roots = _HEADER.unpack(self._file.header)
+
+    def __len__(self):
+        return len(self._file)
+
+    def probe_key(self, key):
+        """
+        :parameter key: the Zobrist hash of a position, from ChessVar.get_hash
+        :return: (result, distance in plies) for the player to move, with result WIN, LOSS or DRAW, or None if the
+                 position isn't solved in this tablebase
+        """
+        return self._file.get(key)
+
+    def probe(self, game):
+        """
+        :parameter game: a ChessVar of any backend
+        :return: the same as probe_key for its current position
+        """
+        return self._file.get(game.get_hash())
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="build and probe retrograde analysis tablebases")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='generate and solve positions from root positions')
+    build.add_argument('path', help='tablebase file to write')
+    build.add_argument('--plies', type=int, default=4, help='how many plies from the roots to generate')
+    build.add_argument('--fen', nargs='+', required=True,
+                       help='root positions, see the description at the top of tablebase.py for picking them')
+    build.add_argument('--workers', type=int, default=None, help='worker processes (default: number of CPUs)')
+    probe = commands.add_parser('probe', help='look up a position')
+    probe.add_argument('path', help='tablebase file to read')
+    probe.add_argument('--fen', default=START_FEN, help='position to look up')
+    probe.add_argument('--moves', nargs='*', default=[], help='moves to play from the position first, EX: e2e4')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        stats = build_tablebase(args.path, args.fen, args.plies, args.workers)
+        print(f'{stats.positions} positions in {stats.seconds:.1f}s: {stats.wins} wins, {stats.losses} losses, '
+              f'{stats.draws} draws, {stats.unsolved} unsolved')
+        return
+
+    game = ChessVar.from_fen(args.fen, backend="bitboard")
+    for move in args.moves:
+        if not game.make_move(move[:2], move[-2:]):
+            raise SystemExit(f'illegal move: {move}')
+    with Tablebase(args.path) as tablebase:
+        begin = time.perf_counter()
+        entry = tablebase.probe(game)
+        seconds = time.perf_counter() - begin
+    if entry is None:
+        print(f'not solved ({seconds * 1e6:.1f} us)')
+    else:
+        print(f'{RESULT_NAMES[entry[0]]} in {entry[1]} plies for {game.get_turn().lower()} ({seconds * 1e6:.1f} us)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that analyze.py hands back one result per position in file order, reuses duplicates and cached
+#               results, and reports failed searches instead of stopping.
+
+import os
+
+import analyze
+from analyze import AnalysisCache, AnalysisSettings, analyze_lines, settings_key
+from ChessVar import ChessVar, START_FEN
+
+SETTINGS = AnalysisSettings(max_depth=2, time_limit=None, node_limit=2000, tablebase=None)
+
+OTHER_FEN = ChessVar.from_fen(START_FEN).to_fen().replace(' w ', ' b ')
+LINES = ['# a comment', START_FEN, 'not a position', '', OTHER_FEN, START_FEN]
+
+
+def failing_search(position):
+    """
+    Stands in for analyze.analyze_position in the worker processes: the position with black to move fails.
+    """
+    if ' b ' in position:
+        raise RuntimeError('no search today')
+    return analyze.search_position(position)
+
+
+def crashing_search(position):
+    """
+    Stands in for analyze.analyze_position in the worker processes: the position with black to move kills the worker.
+    """
+    if ' b ' in position:
+        os._exit(1)
+    return analyze.search_position(position)
+
+
+def test_results_come_back_in_order():
+    results = list(analyze_lines(LINES, SETTINGS, workers=1))
+    assert [result.line for result in results] == [2, 3, 5, 6]
+    assert [result.source for result in results] == ["search", None, "search", "duplicate"]
+    assert results[1].error is not None
+    assert results[3].best_move == results[0].best_move == 'g1d8'
+    assert results[3].pv == results[0].pv
+
+
+def test_cache_is_reused(tmp_path):
+    path = str(tmp_path / 'cache.jsonl')
+    with AnalysisCache(path, SETTINGS) as cache:
+        first = list(analyze_lines(LINES, SETTINGS, workers=1, cache=cache))
+    with AnalysisCache(path, SETTINGS) as cache:
+        assert len(cache) == 2
+        second = list(analyze_lines(LINES, SETTINGS, workers=1, cache=cache))
+    assert [result.source for result in second] == ["cache", None, "cache", "cache"]
+    assert [result.best_move for result in second] == [result.best_move for result in first]
+    with AnalysisCache(path, SETTINGS._replace(node_limit=1000)) as cache:
+        assert len(cache) == 0
+
+
+def test_settings_key_follows_the_tablebase_file(tmp_path):
+    path = tmp_path / 'table.tb'
+    path.write_bytes(b'one')
+    settings = SETTINGS._replace(tablebase=str(path))
+    before = settings_key(settings)
+    assert str(path) in before
+    path.write_bytes(b'rebuilt')
+    assert settings_key(settings) != before
+
+
+def test_failed_search_is_reported(monkeypatch):
+    monkeypatch.setattr(analyze, 'search_position', analyze.analyze_position, raising=False)
+    monkeypatch.setattr(analyze, 'analyze_position', failing_search)
+    results = list(analyze_lines(LINES, SETTINGS, workers=1))
+    assert [result.line for result in results] == [2, 3, 5, 6]
+    assert 'no search today' in results[2].error and results[2].best_move is None
+    assert results[3].best_move == 'g1d8'
+
+
+def test_dead_worker_is_reported(monkeypatch):
+    monkeypatch.setattr(analyze, 'search_position', analyze.analyze_position, raising=False)
+    monkeypatch.setattr(analyze, 'analyze_position', crashing_search)
+    results = list(analyze_lines(LINES + [START_FEN.replace('abcdefgh', 'abcdefg')], SETTINGS, workers=1))
+    assert [result.line for result in results] == [2, 3, 5, 6, 7]
+    assert results[2].error.startswith('search failed')
+    assert results[4].error.startswith('search failed')
@@ -0,0 +1,70 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that attack maps kept up to date a move at a time always match a map built from scratch, both
+#               on their own and inside the games of every backend, with moves made and taken back at random.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+from attacks import AttackMap, attack_set
+
+
+def fields(attack_map):
+    """
+    :return: everything an AttackMap holds, so an updated map can be compared with a new one
+    """
+    return (attack_map.squares, attack_map.occupied, attack_map.pieces, attack_map.attacks, attack_map.attackers,
+            attack_map.attacked)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_updated_maps_match_new_maps(seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend="bitboard")
+    attack_map = AttackMap(game.get_position()[0])
+    taken = []
+    for _ in range(120):
+        if taken and rng.random() < 0.25:
+            start, end, captured = taken.pop()
+            game.pop_move()
+            attack_map.unmove(start, end, captured)
+        else:
+            moves = game.legal_moves_idx()
+            if not moves:
+                break
+            start, end = rng.choice(moves)
+            taken.append((start, end, game.get_position()[0][end]))
+            game.push_move_idx(start, end)
+            attack_map.move(start, end)
+        squares = game.get_position()[0]
+        assert fields(attack_map) == fields(AttackMap(squares))
+        for square, name in enumerate(squares):
+            assert attack_map.attacks[square] == (0 if name is None else
+                                                  attack_set(name, square, attack_map.occupied))
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(5))
+def test_game_maps_match_new_maps(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    pushed = 0
+    for _ in range(80):
+        game.attacked_squares("WHITE")  # builds the map, after which every move updates it
+        if pushed and rng.random() < 0.25:
+            game.pop_move()
+            pushed -= 1
+        else:
+            moves = game.legal_moves_idx()
+            if not moves:
+                break
+            game.push_move_idx(*rng.choice(moves))
+            pushed += 1
+        fresh = ChessVar.from_fen(game.to_fen(), backend=backend)
+        for color in ("WHITE", "BLACK"):
+            assert game.attacked_squares(color) == fresh.attacked_squares(color)
+            assert game.attacked_pieces(color) == fresh.attacked_pieces(color)
+            assert game.extinction_threats(color) == fresh.extinction_threats(color)
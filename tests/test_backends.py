@@ -0,0 +1,139 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that every board backend plays exactly like the list of lists board: the same moves accepted and
+#               rejected, the same position, hash, counts, winner and attacks after each one, and the same results from
+#               pop_move, fork, copy and pickle. Also checks what get_piece_dict and ChessPiece.set_has_moved promise.
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS, Pawn, piece_for
+from bitboard import SQUARE_NAMES
+
+
+def state(game):
+    """
+    :return: everything a game shows through its public methods, so games of different backends can be compared
+    """
+    squares, occupied, unmoved = game.get_position()
+    board = [[None if piece is None else (piece.get_name(), piece.get_has_moved()) for piece in row]
+             for row in game.get_board()]
+    return (game.to_fen(), game.get_hash(), game.get_game_state(), game.get_turn(), dict(game.get_piece_dict()),
+            board, sorted(game.legal_moves_idx()), game.attacked_squares("WHITE"), game.attacked_pieces("BLACK"),
+            game.extinction_threats("WHITE"), game.extinction_threats("BLACK"), list(squares), dict(occupied), unmoved)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_backends_play_the_same(seed):
+    rng = random.Random(seed)
+    games = [ChessVar(backend=backend) for backend in sorted(BACKENDS)]
+    pushed = 0
+    for _ in range(80):
+        if pushed and rng.random() < 0.15:
+            assert len({game.pop_move() for game in games}) == 1
+            pushed -= 1
+        else:
+            moves = games[0].legal_moves_idx()
+            if not moves or rng.random() < 0.3:
+                move = rng.randrange(64), rng.randrange(64)
+            else:
+                move = rng.choice(moves)
+            results = {game.push_move_idx(*move) for game in games}
+            assert len(results) == 1
+            pushed += results.pop()
+        states = [state(game) for game in games]
+        assert all(other == states[0] for other in states[1:])
+        if games[0].get_game_state() != "UNFINISHED":
+            break
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_string_squares_match_the_list_board(backend):
+    for start, end in [('a2', 'a4'), ('g1', 'd8'), ('e7', 'e5'), ('z9', 'a1'), ('a2', 'a2'), ('', 'b3')]:
+        expected, game = ChessVar(), ChessVar(backend=backend)
+        try:
+            result = expected.make_move(start, end)
+        except (IndexError, ValueError, KeyError) as error:
+            with pytest.raises(type(error)):
+                game.make_move(start, end)
+        else:
+            assert game.make_move(start, end) == result
+            assert state(game) == state(expected)
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_undo_restores_the_position_and_hash(backend):
+    game = ChessVar(backend=backend)
+    before = state(game)
+    for move in [('b1', 'c3'), ('g8', 'f6'), ('c3', 'd5'), ('f6', 'd5')]:
+        assert game.push_move(*move)
+    for _ in range(4):
+        game.pop_move()
+    assert state(game) == before
+    assert game.get_hash() == ChessVar.from_fen(game.to_fen(), backend=backend).get_hash()
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_copies_are_independent(backend):
+    game = ChessVar(backend=backend)
+    game.make_move('e2', 'e4')
+    for other in (game.fork(), copy.deepcopy(game), pickle.loads(pickle.dumps(game))):
+        assert state(other) == state(game)
+        assert other.make_move('e7', 'e5')
+        assert state(other) != state(game)
+    assert game.get_turn() == "BLACK"
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_piece_dict_copies(backend):
+    game = ChessVar(backend=backend)
+    live = game.get_piece_dict()
+    kept = dict(live)
+    assert game.make_move('g1', 'd8')
+    assert kept['Q'] == 1 and game.get_piece_dict()['Q'] == 0
+    if backend == "compact":
+        assert live['Q'] == 1 and game.get_piece_dict() is not game.get_piece_dict()
+    else:
+        assert live['Q'] == 0 and game.get_piece_dict() is live
+
+
+def test_set_has_moved_leaves_shared_pieces_alone():
+    game = ChessVar()
+    pawn = game.get_board()[6][0]
+    assert pawn is piece_for('p') and not pawn.get_has_moved()
+    pawn.set_has_moved()
+    assert not pawn.get_has_moved() and not ChessVar().get_board()[6][1].get_has_moved()
+    assert game.make_move('a2', 'a3')
+    assert game.get_board()[5][0] is piece_for('p', True)
+    own = Pawn("WHITE")
+    own.set_has_moved()
+    assert own.get_has_moved()
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_first_move_win(backend):
+    game = ChessVar(backend=backend)
+    assert game.make_move('g1', 'd8')
+    assert game.get_game_state() == "WHITE_WON"
+    assert not game.make_move('e7', 'e5')
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(10))
+def test_trusted_replay_matches_checked_replay(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    moves = []
+    while game.get_game_state() == "UNFINISHED" and len(moves) < 200:
+        moves.append(rng.choice(game.legal_moves_idx()))
+        game.make_move_idx(*moves[-1])
+    checked, trusted = ChessVar(backend=backend), ChessVar(backend=backend)
+    assert checked.apply_moves(moves) is None
+    assert trusted.apply_moves(moves, validate=False) is None
+    assert state(trusted) == state(checked) == state(game)
+    if game.get_game_state() != "UNFINISHED":
+        assert trusted.apply_moves([moves[0]], validate=False) == 0
@@ -0,0 +1,74 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the move counts of opening books built from a handful of known games, read from either kind of
+#               game file, and the moves the book hands out.
+
+import json
+import random
+
+import pytest
+
+from ChessVar import ChessVar
+from book import BookMove, OpeningBook, build_book
+from records import GameWriter
+
+GAMES = [('g1d8', "WHITE_WON"),
+         ('g1d8', "WHITE_WON"),
+         ('a2a3 g8d1', "BLACK_WON"),
+         ('a2a3 h7h6', "UNFINISHED"),
+         ('b1c3 h7h6 a2a3 g8f6', "UNFINISHED"),
+         ('a2a3 h7h6 b1c3 g8f6', "UNFINISHED")]
+
+
+def played(moves):
+    """
+    :return: a new game with the space separated moves played from the starting position
+    """
+    game = ChessVar()
+    for move in moves.split():
+        assert game.make_move(move[:2], move[2:])
+    return game
+
+
+@pytest.fixture(params=['jsonl', 'archive'])
+def games_file(request, tmp_path):
+    path = str(tmp_path / 'games')
+    if request.param == 'jsonl':
+        with open(path, 'w') as file:
+            for moves, winner in GAMES:
+                file.write(json.dumps({'moves': moves.split(), 'winner': winner}) + '\n')
+    else:
+        with GameWriter(path) as writer:
+            for moves, winner in GAMES:
+                writer.write_game(moves.split(), winner)
+    return path
+
+
+def test_book_counts(games_file, tmp_path):
+    path = str(tmp_path / 'book')
+    assert build_book(path, [games_file])[0] == len(GAMES)
+    with OpeningBook(path) as book:
+        assert (book.games, book.plies) == (len(GAMES), 16)
+        start = book.moves(ChessVar())
+        assert sorted(start) == [BookMove(('a2', 'a3'), 3, 0, 2, 1), BookMove(('b1', 'c3'), 1, 0, 1, 0),
+                                 BookMove(('g1', 'd8'), 2, 2, 0, 0)]
+        assert start[0].games == 3 and start[-1].games == 1
+        assert sorted(book.moves(played('a2a3'))) == [BookMove(('g8', 'd1'), 1, 1, 0, 0),
+                                                      BookMove(('h7', 'h6'), 2, 0, 2, 0)]
+        # both move orders reach the same position, so its entry counts both games
+        assert book.moves(played('a2a3 h7h6 b1c3')) == [BookMove(('g8', 'f6'), 2, 0, 2, 0)]
+        assert book.moves(played('b1c3 h7h6 a2a3')) == [BookMove(('g8', 'f6'), 2, 0, 2, 0)]
+        assert book.moves(played('h2h3')) == [] and book.choose(played('h2h3')) is None
+        rng = random.Random(1)
+        assert {book.choose(ChessVar(), rng) for _ in range(100)} == {('a2', 'a3'), ('b1', 'c3'), ('g1', 'd8')}
+
+
+def test_plies_and_min_games(games_file, tmp_path):
+    path = str(tmp_path / 'book')
+    build_book(path, [games_file, games_file], plies=1, min_games=3)
+    with OpeningBook(path) as book:
+        assert (book.games, book.plies) == (2 * len(GAMES), 1)
+        assert book.moves(ChessVar()) == [BookMove(('a2', 'a3'), 6, 0, 4, 2), BookMove(('g1', 'd8'), 4, 4, 0, 0)]
+        assert book.moves(played('a2a3')) == []
+        assert len(book) == 2
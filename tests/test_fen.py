@@ -0,0 +1,66 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that positions written with to_fen read back to the same game on every backend, and that
+#               parse_fen rejects text that doesn't describe a position.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS, format_fen, parse_fen
+
+START = 'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w abcdefghABCDEFGH -'
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(10))
+def test_fen_round_trip(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    while True:
+        fen = game.to_fen()
+        assert format_fen(*parse_fen(fen)) == fen
+        copy = ChessVar.from_fen(fen, backend=backend)
+        assert copy.to_fen() == fen
+        assert copy.get_game_state() == game.get_game_state()
+        assert copy.get_turn() == game.get_turn()
+        assert copy.get_piece_dict() == game.get_piece_dict()
+        assert sorted(copy.legal_moves_idx()) == sorted(game.legal_moves_idx())
+        moves = game.legal_moves_idx()
+        if not moves:
+            break
+        game.make_move_idx(*rng.choice(moves))
+
+
+def test_start_position():
+    assert ChessVar().to_fen() == START
+    assert ChessVar.from_fen(START).get_board() == ChessVar().get_board()
+    assert ChessVar.from_fen(START[:-2]).get_game_state() == "UNFINISHED"
+
+
+def test_game_state_is_worked_out_when_left_off():
+    assert parse_fen('RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbkqbnr w -')[3] == "UNFINISHED"
+    assert parse_fen('RNB1KBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr b -')[3] == "WHITE_WON"
+    assert parse_fen('RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnb1kbnr w -')[3] == "BLACK_WON"
+
+
+@pytest.mark.parametrize('fen', [
+    '',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w - - -',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp w -',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr/8 w -',
+    'RNBQKBNR/PPPPPPPP/9/8/8/8/pppppppp/rnbqkbnr w -',
+    'RNBQKBNR/PPPPPPP/8/8/8/8/pppppppp/rnbqkbnrp w -',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnx w -',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr x -',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w z',
+    'RNBQKBNR/PPPPPPPP/8/8/8/p7/1ppppppp/rnbqkbnr b a',
+    'RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w aA x',
+])
+def test_rejected_fens(fen):
+    with pytest.raises(ValueError):
+        parse_fen(fen)
+    with pytest.raises(ValueError):
+        ChessVar.from_fen(fen)
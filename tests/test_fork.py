@@ -0,0 +1,71 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that forks share nothing a move can change: a family of forks is played and taken back at
+#               random with push_move and pop_move, and every game must match a fresh game that replayed its own moves.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+
+
+def position(game):
+    """
+    :return: the position of the game, including the has_moved flag of every piece
+    """
+    board = [[None if piece is None else (piece.get_name(), piece.get_has_moved()) for piece in row]
+             for row in game.get_board()]
+    return game.to_fen(), game.get_hash(), dict(game.get_piece_dict()), board, game.attacked_squares("WHITE")
+
+
+def replayed(moves, backend):
+    """
+    :return: a new game with moves played from the starting position
+    """
+    game = ChessVar(backend=backend)
+    for move in moves:
+        assert game.make_move_idx(*move)
+    return game
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(5))
+def test_forks_are_isolated(backend, seed):
+    rng = random.Random(seed)
+    family = [(ChessVar(backend=backend), [])]
+    for _ in range(100):
+        number = rng.randrange(len(family))
+        game, moves = family[number]
+        roll = rng.random()
+        if roll < 0.2 and len(family) < 8:
+            family.append((game.fork(), list(moves)))
+        elif roll < 0.35 and moves:
+            game.pop_move()
+            moves.pop()
+        else:
+            legal = game.legal_moves_idx()
+            if not legal:
+                continue
+            move = rng.choice(legal)
+            game.push_move_idx(*move)
+            moves.append(move)
+        for game, moves in family:
+            assert position(game) == position(replayed(moves, backend))
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_boards_from_before_the_fork_are_kept(backend):
+    game = ChessVar(backend=backend)
+    assert game.push_move('b1', 'c3')
+    board = [list(row) for row in game.get_board()]
+    fen = game.to_fen()
+    branch = game.fork()
+    assert branch.push_move('a7', 'a6') and branch.push_move('c3', 'b5')
+    assert [branch.pop_move() for _ in range(3)] == [('c3', 'b5'), ('a7', 'a6'), ('b1', 'c3')]
+    assert branch.to_fen() == ChessVar(backend=backend).to_fen()
+    assert game.to_fen() == fen
+    assert [list(row) for row in game.get_board()] == board
+    assert game.pop_move() == ('b1', 'c3')
+    assert game.to_fen() == branch.to_fen()
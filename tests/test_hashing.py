@@ -0,0 +1,91 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the incremental Zobrist hash against hashing each position from scratch, and the replacement
+#               rules and counters of the transposition table.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+from transposition import (BUCKET_BYTES, EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionTable, pack_entry,
+                           unpack_entry)
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(10))
+def test_hash_after_moves_equals_a_fresh_hash(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    for _ in range(60):
+        fresh = ChessVar.from_fen(game.to_fen(), backend=backend)
+        assert game.get_hash() == fresh.get_hash()
+        moves = game.legal_moves_idx()
+        if not moves:
+            break
+        game.make_move_idx(*rng.choice(moves))
+
+
+def test_transpositions_share_a_hash():
+    first, second = ChessVar(), ChessVar()
+    for move in [('b1', 'c3'), ('g8', 'f6'), ('a2', 'a3'), ('h7', 'h6')]:
+        assert first.make_move(*move)
+    for move in [('a2', 'a3'), ('h7', 'h6'), ('b1', 'c3'), ('g8', 'f6')]:
+        assert second.make_move(*move)
+    assert first.get_hash() == second.get_hash()
+    assert ChessVar().get_hash() != ChessVar.from_fen(ChessVar().to_fen().replace(' w ', ' b ')).get_hash()
+
+
+def test_moved_pawns_change_the_hash():
+    unmoved = ChessVar.from_fen('RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w abcdefghABCDEFGH -')
+    moved = ChessVar.from_fen('RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr w bcdefghABCDEFGH -')
+    assert moved.get_hash() != unmoved.get_hash()
+
+
+def test_pack_and_unpack():
+    for entry in [(0, 0, EXACT, NO_MOVE), (255, -(2 ** 31), LOWER_BOUND, 0), (7, 2 ** 31 - 1, UPPER_BOUND, 4095)]:
+        assert unpack_entry(pack_entry(*entry)) == entry
+
+
+def one_bucket():
+    return TranspositionTable(buffer=bytearray(BUCKET_BYTES))
+
+
+def test_probe_and_counters():
+    table = TranspositionTable(megabytes=0.01)
+    assert len(table) & (len(table) - 1) == 0
+    assert table.probe(12345) is None
+    table.store(12345, 3, -20, EXACT, 100)
+    assert table.probe(12345) == (3, -20, EXACT, 100)
+    stats = table.stats()
+    assert (stats['hits'], stats['misses'], stats['stores'], stats['hit_rate']) == (1, 1, 1, 0.5)
+    table.clear()
+    assert table.probe(12345) is None
+    assert table.stats()['stores'] == 0
+
+
+def test_depth_preferred_and_always_replace_entries():
+    table = one_bucket()
+    table.store(1, 5, 10, EXACT)
+    table.store(2, 3, 20, EXACT)  # shallower, goes to the always-replace entry
+    assert table.probe(1) == (5, 10, EXACT, NO_MOVE)
+    assert table.probe(2) == (3, 20, EXACT, NO_MOVE)
+    table.store(3, 2, 30, EXACT)  # pushes 2 out of the always-replace entry
+    assert table.probe(2) is None
+    assert table.probe(3) is not None
+    assert table.overwrites == 1
+    table.store(4, 9, 40, EXACT)  # deeper, takes the first entry and moves 1 down over 3
+    assert table.probe(4) == (9, 40, EXACT, NO_MOVE)
+    assert table.probe(1) == (5, 10, EXACT, NO_MOVE)
+    assert table.probe(3) is None
+    assert table.overwrites == 2
+    assert table.collisions == 2
+
+
+def test_torn_entry_is_a_miss():
+    buffer = bytearray(BUCKET_BYTES)
+    table = TranspositionTable(buffer=buffer)
+    table.store(77, 4, 1, EXACT)
+    buffer[8] ^= 1  # the key word no longer matches the data word
+    assert table.probe(77) is None
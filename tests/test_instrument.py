@@ -0,0 +1,85 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the reasons instrument.reject_reason gives for refused moves, and that turning instrumentation on
+#               and off leaves the games working as before.
+
+import random
+
+import pytest
+
+import instrument
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_INDEX, NAME_COLOR
+
+
+def play(backend, moves):
+    game = ChessVar(backend=backend)
+    for move in moves:
+        assert game.make_move(move[:2], move[2:]), move
+    return game
+
+
+# (moves played first, refused move, expected reason)
+CASES = [
+    (['g1d8'], 'e7e5', 'game_over'),
+    ([], 'e4e5', 'empty_start'),
+    ([], 'e2e2', 'same_square'),
+    ([], 'e7e5', 'wrong_turn'),
+    ([], 'b1b3', 'illegal_pattern'),
+    ([], 'e2d3', 'illegal_pattern'),             # a pawn only moves diagonally onto a piece
+    (['e2e3', 'a7a6'], 'e3e5', 'illegal_pattern'),  # and only steps twice before it has moved
+    ([], 'a1a3', 'blocked_path'),
+    ([], 'e2d2', 'blocked_path'),                # a pawn step onto a piece
+    (['b1c3', 'a7a6'], 'b2c3', 'own_piece'),
+    ([], 'a1a2', 'own_piece'),
+]
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('moves, move, reason', CASES)
+def test_reject_reason(backend, moves, move, reason):
+    game = play(backend, moves)
+    start, end = SQUARE_INDEX[move[:2]], SQUARE_INDEX[move[2:]]
+    assert not game.is_legal_idx(start, end)
+    assert instrument.reject_reason(game, start, end) == reason
+
+
+def test_pawn_blocked_double_step():
+    game = play("list", ['b1c3', 'a7a6', 'c3e4', 'a6a5'])
+    start, end = SQUARE_INDEX['e2'], SQUARE_INDEX['e4']
+    assert instrument.reject_reason(game, start, end) == 'blocked_path'
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_reasons_agree_with_the_board(backend):
+    rng = random.Random(3)
+    for _ in range(20):
+        game = ChessVar(backend=backend)
+        for _ in range(30):
+            for _ in range(20):
+                start, end = rng.randrange(64), rng.randrange(64)
+                if game.is_legal_idx(start, end):
+                    continue
+                reason = instrument.reject_reason(game, start, end)
+                assert reason in instrument.REJECT_REASONS
+                if reason == 'own_piece':
+                    squares = game.get_position()[0]
+                    assert NAME_COLOR[squares[end]] == game.get_turn()
+            moves = game.legal_moves_idx()
+            if not moves:
+                break
+            game.make_move_idx(*rng.choice(moves))
+
+
+def test_instrumented_block_counts_rejects():
+    instrument.reset()
+    with instrument.instrumented():
+        game = ChessVar(backend="bitboard")
+        assert not game.make_move('e2', 'd3')
+        assert game.make_move('e2', 'e4')
+        data = instrument.snapshot()
+    assert not instrument.is_enabled()
+    assert data['rejects']['illegal_pattern'] == 1
+    assert sum(data['rejects'].values()) == 1
+    instrument.reset()
@@ -0,0 +1,59 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that is_legal and are_legal answer exactly what make_move would do while leaving the game
+#               untouched, including the has_moved flag of pawns asked about, on every backend.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_NAMES
+
+
+def snapshot(game):
+    """
+    :return: everything about the game that a move could change, to compare before and after the queries
+    """
+    board = [[None if piece is None else (piece.get_name(), piece.get_has_moved()) for piece in row]
+             for row in game.get_board()]
+    return (game.to_fen(), game.get_hash(), game.get_game_state(), game.get_turn(), dict(game.get_piece_dict()),
+            board)
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(4))
+def test_queries_match_make_move_and_change_nothing(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    pairs = [(start, end) for start in SQUARE_NAMES for end in SQUARE_NAMES]
+    while True:
+        before = snapshot(game)
+        asked = rng.sample(pairs, 300) + [(square, square) for square in SQUARE_NAMES]
+        answers = game.are_legal(asked)
+        assert answers == [game.is_legal(start, end) for start, end in asked]
+        assert snapshot(game) == before
+        for (start, end), legal in zip(asked, answers):
+            assert game.fork().make_move(start, end) is legal
+        assert snapshot(game) == before
+        moves = game.legal_moves()
+        assert all(game.are_legal(moves))
+        if not moves:
+            break
+        game.make_move(*rng.choice(moves))
+    assert not any(game.are_legal(pairs[:200]))
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_rejected_pawn_moves_leave_the_pawn_unmoved(backend):
+    game = ChessVar(backend=backend)
+    before = snapshot(game)
+    # a2 may step to a3 or a4, but b2 holds white's own pawn and a5 is too far
+    assert game.is_legal('a2', 'a3') and game.is_legal('a2', 'a4')
+    assert not game.is_legal('a2', 'b2') and not game.is_legal('a2', 'a5')
+    assert snapshot(game) == before
+    assert not game.make_move('a2', 'b2')
+    assert snapshot(game) == before
+    assert game.make_move('a2', 'a3')
+    assert not game.is_legal('a3', 'a5')
@@ -0,0 +1,31 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that Monte Carlo tree search counts its playouts correctly, on its own and across processes.
+
+import mcts
+from ChessVar import ChessVar, START_FEN
+
+
+def test_search_counts_every_playout():
+    player = mcts.MCTSPlayer(seed=1)
+    result = player.search(ChessVar(), iterations=200)
+    assert result.playouts == 200
+    assert sum(visits for visits, wins in player.root_stats().values()) == 200
+    assert result.best_move == ('g1', 'd8')
+
+
+def test_worker_tasks_start_new_trees():
+    mcts._init_worker(mcts.DEFAULT_EXPLORATION, 200, True)
+    for _ in range(3):
+        stats, playouts = mcts._search_worker(START_FEN, 100, 1.0)
+        assert playouts == 100
+        assert sum(visits for visits, wins in stats.values()) == 100
+
+
+def test_search_parallel_adds_up_the_trees():
+    with mcts.make_pool(1) as executor:
+        for _ in range(2):
+            result = mcts.search_parallel(executor, ChessVar(), 4, iterations=50)
+            assert result.playouts == 200
+            assert result.visits <= 200
@@ -0,0 +1,39 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the legal move generator of every backend against trying every pair of squares with the original
+#               ChessPiece.is_move_legal rules, over seeded random games.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_NAMES, SQUARE_INDEX
+from perft import brute_force_moves
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(8))
+def test_generated_moves_match_the_piece_rules(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    for _ in range(40):
+        moves = game.legal_moves()
+        assert set(moves) == brute_force_moves(game)
+        assert len(set(moves)) == len(moves)
+        assert game.legal_moves_idx() == [(SQUARE_INDEX[start], SQUARE_INDEX[end]) for start, end in moves]
+        square = rng.choice(SQUARE_NAMES)
+        assert game.legal_moves_from(square) == [move for move in moves if move[0] == square]
+        if not moves:
+            break
+        assert game.make_move(*rng.choice(moves))
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_finished_game_has_no_moves(backend):
+    game = ChessVar(backend=backend)
+    assert game.make_move('g1', 'd8')
+    assert game.legal_moves() == []
+    assert game.legal_moves_idx() == []
+    assert game.legal_moves_from('e7') == []
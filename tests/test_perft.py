@@ -0,0 +1,24 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the move generator of every backend against the perft reference counts, and the reference counts
+#               against the brute force count that doesn't use the move generator.
+
+import pytest
+
+from ChessVar import BACKENDS
+from perft import REFERENCE_COUNTS, brute_force_perft, perft, play_line, verify
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('line', sorted(REFERENCE_COUNTS))
+def test_perft_matches_reference(backend, line):
+    game = play_line(backend, line.split())
+    assert perft(game, 2) == REFERENCE_COUNTS[line][2]
+
+
+@pytest.mark.parametrize('line', sorted(REFERENCE_COUNTS))
+def test_reference_matches_brute_force(line):
+    game = play_line("list", line.split())
+    assert brute_force_perft(game, 2) == REFERENCE_COUNTS[line][2]
+    assert verify(game, 1) == []
@@ -0,0 +1,108 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that positions and games written by records.py read back exactly as they were written.
+
+import os
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+from records import (GameArchive, GameWriter, POSITION_BYTES, decode_moves, decode_position, encode_moves,
+                     encode_position, read_games, replay)
+
+
+def random_game(seed, plies, backend="bitboard"):
+    """
+    :return: (the game after up to plies random legal moves, the (start, end) moves that were played)
+    """
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    moves = []
+    for _ in range(plies):
+        legal = game.legal_moves()
+        if not legal:
+            break
+        move = rng.choice(legal)
+        game.make_move(*move)
+        moves.append(move)
+    return game, moves
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(10))
+def test_position_round_trip(backend, seed):
+    game, _ = random_game(seed, 30, backend)
+    data = encode_position(game)
+    assert len(data) == POSITION_BYTES
+    copy = ChessVar._from_position(*decode_position(data), backend=backend)
+    assert copy.to_fen() == game.to_fen()
+    assert copy.get_game_state() == game.get_game_state()
+    assert copy.get_hash() == game.get_hash()
+    assert encode_position(copy) == data
+
+
+def test_moves_round_trip():
+    moves = [('a8', 'h1'), ('h1', 'a8'), ('e2', 'e4'), ('g1', 'd8')]
+    assert decode_moves(encode_moves(moves)) == moves
+    assert decode_moves(encode_moves(['e2e4', 'e7e5'])) == [('e2', 'e4'), ('e7', 'e5')]
+
+
+def test_archive_round_trip(tmp_path):
+    path = str(tmp_path / 'games.bin')
+    games = [random_game(seed, 200) for seed in range(8)]
+    start_game, _ = random_game(99, 6)
+    start = encode_position(start_game)
+    with GameWriter(path) as writer:
+        for game, moves in games:
+            extinct = next((name for name, count in game.get_piece_dict().items() if count == 0), None)
+            writer.write_game(moves, game.get_game_state(), extinct)
+        writer.write_game([], "UNFINISHED", start=start)
+
+    records = list(read_games(path))
+    assert len(records) == len(games) + 1
+    with GameArchive(path) as archive:
+        assert len(archive) == len(records)
+        assert [archive[number] for number in range(len(archive))] == records
+        assert archive[-1].start == start
+    for record, (game, moves) in zip(records, games):
+        assert record.moves == moves
+        assert record.game_state == game.get_game_state()
+        assert replay(record).to_fen() == game.to_fen()
+    assert replay(records[-1]).to_fen() == start_game.to_fen()
+
+
+def test_cut_off_archives_are_rejected(tmp_path):
+    path = str(tmp_path / 'games.bin')
+    game, moves = random_game(3, 30)
+    with GameWriter(path) as writer:
+        writer.write_game(moves[:10], "UNFINISHED")
+        writer.write_game([], "UNFINISHED", start=encode_position(game))
+        writer.write_game(moves, game.get_game_state())
+    with open(path, 'rb') as file:
+        data = file.read()
+    last_header = len(data) - len(moves) * 2 - 4
+    start_position = last_header - POSITION_BYTES
+    # half of the last move, all of it, part of the start position of the second game and half of the last header
+    for size in [len(data) - 1, len(data) - 2, start_position + 10, last_header + 2]:
+        cut = str(tmp_path / f'cut{size}.bin')
+        with open(cut, 'wb') as file:
+            file.write(data[:size])
+        with pytest.raises(ValueError, match='truncated'):
+            list(read_games(cut))
+        with pytest.raises(ValueError, match=cut):
+            GameArchive(cut)
+        assert not os.path.exists(cut + '.idx')
+    os.truncate(path, len(data) - 2)
+    with GameArchive(path) as archive:
+        assert archive[0].moves == moves[:10]
+        with pytest.raises(ValueError, match='truncated'):
+            archive[2]
+
+
+def test_records_use_the_compact_board_codes():
+    game, _ = random_game(5, 20, "compact")
+    data = encode_position(game)
+    codes = bytes(code for byte in data[:32] for code in (byte >> 4, byte & 15))
+    assert codes == bytes(game._board)
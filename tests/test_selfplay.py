@@ -0,0 +1,59 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that self-play games replay under the rules to the recorded result and that a run gives the same
+#               games however many workers play it.
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from ChessVar import ChessVar
+from selfplay import PLAYERS, play_game, run_selfplay
+
+PROJECT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def replay(result):
+    """
+    :parameter result: a game result dictionary from play_game
+    :return: the ChessVar after playing the games moves, each of which must be legal
+    """
+    game = ChessVar()
+    for move in result['moves']:
+        assert game.make_move(move[:2], move[2:])
+    return game
+
+
+@pytest.mark.parametrize('player', PLAYERS)
+def test_games_replay_to_their_result(player):
+    for index in range(4):
+        result = play_game(index, 7, player, max_plies=40, node_limit=200, opening_plies=2)
+        game = replay(result)
+        assert result['winner'] == game.get_game_state()
+        assert result['plies'] == len(result['moves']) <= 40
+        if result['winner'] == "UNFINISHED":
+            assert result['extinct'] is None
+        else:
+            assert game.get_piece_dict()[result['extinct']] == 0
+        assert result == play_game(index, 7, player, max_plies=40, node_limit=200, opening_plies=2)
+
+
+def test_runs_do_not_depend_on_the_workers():
+    serial = [play_game(index, 3, 'capture') for index in range(10)]
+    parallel = sorted(run_selfplay(10, workers=2, run_seed=3, player='capture', batch_size=3),
+                      key=lambda result: result['index'])
+    assert parallel == serial
+
+
+def test_command_line_writes_one_game_per_line(tmp_path):
+    out = tmp_path / 'games.jsonl'
+    finished = subprocess.run([sys.executable, 'selfplay.py', '--games', '5', '--workers', '1', '--seed', '2',
+                               '--out', str(out)], cwd=PROJECT, capture_output=True, text=True, check=True)
+    results = sorted((json.loads(line) for line in out.read_text().splitlines()), key=lambda result: result['index'])
+    assert [result['index'] for result in results] == list(range(5))
+    assert results == [play_game(index, 2) for index in range(5)]
+    assert finished.stderr.startswith('5 games, ')
@@ -0,0 +1,113 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks how server.py answers bad and refused messages, over a real connection to a server on a free port.
+
+import asyncio
+import json
+
+from server import GameServer
+
+
+class Client:
+    """
+    A connection to the test server that sends and reads JSON lines.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, message):
+        data = message if isinstance(message, bytes) else json.dumps(message).encode() + b'\n'
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def receive(self):
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+
+    async def ask(self, message):
+        await self.send(message)
+        return await self.receive()
+
+
+def run_with_server(test, **options):
+    """
+    Starts a GameServer on a free port, runs test(server, connect) and shuts the server down afterwards.
+    """
+    async def main():
+        game_server = GameServer(**options)
+        server = await game_server.start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        clients = []
+
+        async def connect():
+            clients.append(Client(*await asyncio.open_connection('127.0.0.1', port)))
+            return clients[-1]
+
+        try:
+            await test(game_server, connect)
+        finally:
+            for client in clients:
+                client.writer.close()
+            game_server._evictor.cancel()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_unreadable_messages():
+    async def test(game_server, connect):
+        client = await connect()
+        for line in [b'not json\n', b'[1, 2]\n', b'"text"\n', b'{"type": "dance"}\n', b'{"type": [1]}\n', b'{}\n']:
+            assert await client.ask(line) == {'type': 'error', 'error': 'unreadable message'}
+        assert await client.ask({'type': 'ping', 'ref': 7}) == {'type': 'pong', 'ref': 7}
+
+    run_with_server(test)
+
+
+def test_bad_game_ids():
+    async def test(game_server, connect):
+        client = await connect()
+        for game_id in ['Infinity', '-Infinity', 'NaN', '"x"', '[1]', 'null', '99', '1e400']:
+            reply = await client.ask(f'{{"type": "join", "game": {game_id}}}\n'.encode())
+            assert reply == {'type': 'error', 'error': 'no such game'}
+        assert (await client.ask({'type': 'watch'}))['error'] == 'no such game'
+
+    run_with_server(test)
+
+
+def test_refused_moves():
+    async def test(game_server, connect):
+        white, black, third = await connect(), await connect(), await connect()
+        game_id = (await white.ask({'type': 'create'}))['game']
+        assert (await black.ask({'type': 'join', 'game': game_id}))['color'] == "BLACK"
+        assert (await white.receive())['type'] == 'joined'
+        assert (await third.ask({'type': 'join', 'game': game_id}))['error'] == 'game is full'
+
+        assert (await black.ask({'type': 'move', 'game': game_id, 'move': 'e7e5'}))['error'] == 'not your turn'
+        for move in ['e2', 'z9z8', 12, None]:
+            reply = await white.ask({'type': 'move', 'game': game_id, 'move': move})
+            assert reply['error'] == 'unreadable move'
+        assert (await white.ask({'type': 'move', 'game': game_id, 'move': 'e2e6'}))['error'] == 'illegal move'
+
+        moved = await white.ask({'type': 'move', 'game': game_id, 'move': 'g1d8'})
+        assert moved['type'] == 'moved' and moved['captured'] == 'Q' and moved['state'] == "WHITE_WON"
+        assert await black.receive() == moved
+        assert (await black.ask({'type': 'move', 'game': game_id, 'move': 'e7e5'}))['error'] == 'game is over'
+        assert game_server.stats()['moves'] == 1
+
+    run_with_server(test)
+
+
+def test_rate_limit():
+    async def test(game_server, connect):
+        white, black = await connect(), await connect()
+        game_id = (await white.ask({'type': 'create'}))['game']
+        await black.ask({'type': 'join', 'game': game_id})
+        await white.receive()
+        assert (await white.ask({'type': 'move', 'game': game_id, 'move': 'a2a3'}))['type'] == 'moved'
+        await black.receive()
+        assert (await black.ask({'type': 'move', 'game': game_id, 'move': 'a7a6'}))['error'] == 'rate limited'
+
+    run_with_server(test, move_rate=0.001, move_burst=1)
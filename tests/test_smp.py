@@ -0,0 +1,29 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that the parallel search returns a legal move and adds up the nodes of all its workers.
+
+from search import quiet_positions
+from smp import ParallelSearcher
+
+
+def test_two_workers_search_one_position():
+    with ParallelSearcher(2, megabytes=1) as searcher:
+        finished = []
+        next_result = searcher._next_result
+
+        def recording_next_result():
+            finished.append(next_result())
+            return finished[-1]
+
+        searcher._next_result = recording_next_result
+        for game in quiet_positions(1, 7) * 2:  # the second search starts from the table the first one filled
+            fen = game.to_fen()
+            finished.clear()
+            result = searcher.search(game, 3)
+            assert game.to_fen() == fen
+            assert game.is_legal(*result.best_move)
+            assert result.pv[0] == result.best_move
+            assert sorted(number for number, worker_result in finished) == [0, 1]
+            assert result.nodes == sum(worker_result.nodes for number, worker_result in finished)
+            assert result.depth == max(worker_result.depth for number, worker_result in finished) >= 1
@@ -0,0 +1,37 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the statistics benchmarks/suite.py uses to decide whether a benchmark got slower.
+
+from benchmarks.suite import compare, mann_whitney_p, min_samples, smallest_p
+
+
+def samples(value, count):
+    return {"samples": [value * (1 + 0.001 * number) for number in range(count)]}
+
+
+def test_mann_whitney_p():
+    assert mann_whitney_p([1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]) < 0.01
+    assert mann_whitney_p([7, 8, 9, 10, 11, 12], [1, 2, 3, 4, 5, 6]) > 0.99
+    assert 0.3 < mann_whitney_p([1, 3, 5, 7, 9], [2, 4, 6, 8, 10]) < 0.7
+
+
+def test_min_samples():
+    assert min_samples(0.01) == 5
+    assert smallest_p(min_samples(0.01), min_samples(0.01)) < 0.01
+    assert smallest_p(4, 4) >= 0.01
+
+
+def test_compare_verdicts():
+    baseline = {"steady": samples(1.0, 30), "slower": samples(1.0, 30), "faster": samples(1.0, 30)}
+    results = {"steady": samples(1.01, 30), "slower": samples(2.0, 30), "faster": samples(0.5, 30),
+               "added": samples(1.0, 30)}
+    verdicts = {comparison.name: comparison.verdict for comparison in compare(baseline, results)}
+    assert verdicts == {"steady": "same", "slower": "regression", "faster": "improvement", "added": "new"}
+
+
+def test_too_few_samples_fall_back_to_the_threshold():
+    baseline = {"slower": samples(1.0, 3), "steady": samples(1.0, 3)}
+    results = {"slower": samples(2.0, 3), "steady": samples(1.05, 3)}
+    verdicts = {comparison.name: comparison.verdict for comparison in compare(baseline, results)}
+    assert verdicts == {"slower": "regression", "steady": "same"}
@@ -0,0 +1,41 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that tablebase.py solves a small set of positions the same way a full search of them does, and
+#               refuses to write distances that don't fit in the file.
+
+import pytest
+
+import tablebase
+from ChessVar import ChessVar
+from tablebase import LOSS, WIN, Tablebase, build_tablebase
+
+DOUBLED = "RNBQKBNR/PPPKQPPP/8/8/8/8/pppkqppp/rnbqkbnr w abcfghABCFGH -"
+
+
+def test_build_and_probe(tmp_path):
+    path = str(tmp_path / 'doubled.tb')
+    stats = build_tablebase(path, [DOUBLED], plies=2, workers=1)
+    assert stats.positions > 1000
+    with Tablebase(path) as table:
+        assert len(table) == stats.wins + stats.losses + stats.draws
+        game = ChessVar.from_fen(DOUBLED, backend="bitboard")
+        result, distance = table.probe(game)
+        assert result == WIN
+        # every move the tablebase knows about from a won position leads to a position that isn't won for the mover
+        best = None
+        for move in game.legal_moves_idx():
+            game.push_move_idx(*move)
+            entry = table.probe(game)
+            if entry is not None and entry[0] == LOSS:
+                best = entry[1] if best is None else min(best, entry[1])
+            game.pop_move()
+        assert best == distance - 1
+
+
+def test_distance_must_fit(tmp_path, monkeypatch):
+    monkeypatch.setattr(tablebase, 'solve', lambda nodes: {key: (WIN, 256) for key in nodes})
+    path = tmp_path / 'too_far.tb'
+    with pytest.raises(ValueError):
+        build_tablebase(str(path), [DOUBLED], plies=1, workers=1)
+    assert not path.exists()
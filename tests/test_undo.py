@@ -0,0 +1,64 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks that pop_move takes back push_move exactly, over seeded random games on every backend.
+
+import random
+
+import pytest
+
+from ChessVar import ChessVar, BACKENDS
+
+
+def snapshot(game):
+    """
+    :return: everything pop_move has to put back
+    """
+    board = [[None if piece is None else (piece.get_name(), piece.get_has_moved()) for piece in row]
+             for row in game.get_board()]
+    return (board, game.get_turn(), game.get_game_state(), dict(game.get_piece_dict()), game.get_hash(),
+            game.to_fen())
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('seed', range(10))
+def test_push_and_pop_round_trip(backend, seed):
+    rng = random.Random(seed)
+    game = ChessVar(backend=backend)
+    before = [snapshot(game)]
+    pushed = []
+    for _ in range(60):
+        moves = game.legal_moves()
+        if not moves:
+            break
+        move = rng.choice(moves)
+        assert game.push_move(*move)
+        pushed.append(move)
+        before.append(snapshot(game))
+    while pushed:
+        before.pop()
+        assert game.pop_move() == pushed.pop()
+        assert snapshot(game) == before[-1]
+    with pytest.raises(IndexError):
+        game.pop_move()
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_refused_push_is_not_remembered(backend):
+    game = ChessVar(backend=backend)
+    before = snapshot(game)
+    assert not game.push_move('e2', 'e6')
+    assert snapshot(game) == before
+    with pytest.raises(IndexError):
+        game.pop_move()
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_pop_undoes_a_win(backend):
+    game = ChessVar(backend=backend)
+    before = snapshot(game)
+    assert game.push_move('g1', 'd8')
+    assert game.get_game_state() == "WHITE_WON"
+    game.pop_move()
+    assert snapshot(game) == before
+    assert game.make_move('e2', 'e4')
@@ -0,0 +1,63 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks the verdicts validate.py gives for files of recorded games, in order and whatever the number of
+#               workers, and the JSON lines it writes.
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from ChessVar import BACKENDS
+from selfplay import play_game
+from validate import Verdict, parse_moves, validate_game, validate_lines
+
+PROJECT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def test_move_formats():
+    expected = [(52, 36), (12, 28)]
+    for text in ['e2e4 e7e5', 'e2-e4 e7-e5', 'e2 e4 e7 e5', '1. e2e4 e7e5', '1. e2 e4 1... e7-e5']:
+        assert parse_moves(text) == (expected, ['e2e4', 'e7e5']), text
+    assert parse_moves('e2e4 e9e5 e7') == ([(52, 36), None, None], ['e2e4', 'e9e5', 'e7'])
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_verdicts(backend):
+    assert validate_game(1, 'g1d8', backend) == Verdict(1, 1, None, None, "WHITE_WON", 'Q')
+    assert validate_game(2, 'a2a3 h7h6', backend) == Verdict(2, 2, None, None, "UNFINISHED", None)
+    assert validate_game(3, 'a2a3 a3a5 h7h6', backend) == Verdict(3, 3, 2, 'illegal move a3a5', "UNFINISHED", None)
+    assert validate_game(4, 'a2a3 h7', backend) == Verdict(4, 2, 2, 'unreadable move h7', "UNFINISHED", None)
+    assert validate_game(5, 'g1d8 h7h6', backend) == Verdict(5, 2, 2, 'illegal move h7h6', "WHITE_WON", 'Q')
+
+
+def test_lines_keep_their_order():
+    games = [play_game(index, 4, 'capture') for index in range(30)]
+    lines = ['# recorded games', '']
+    for result in games:
+        moves = result['moves'][:]
+        if result['index'] % 7 == 3:
+            moves.append('a1a1')
+        lines.append(' '.join(moves))
+    verdicts = list(validate_lines(lines, workers=2, chunk_size=4))
+    assert [verdict.line for verdict in verdicts] == list(range(3, 33))
+    for verdict, result in zip(verdicts, games):
+        assert verdict.plies == result['plies'] + (result['index'] % 7 == 3)
+        assert verdict.game_state == result['winner']
+        assert verdict.extinct == result['extinct']
+        assert verdict.first_illegal == (verdict.plies if result['index'] % 7 == 3 else None)
+
+
+def test_command_line_writes_one_verdict_per_line(tmp_path):
+    games = tmp_path / 'games.txt'
+    games.write_text('g1d8\n# a comment\n\na2a3 a3a5\n')
+    out = tmp_path / 'verdicts.jsonl'
+    finished = subprocess.run([sys.executable, 'validate.py', str(games), '--workers', '1', '--out', str(out)],
+                              cwd=PROJECT, capture_output=True, text=True, check=True)
+    verdicts = [json.loads(line) for line in out.read_text().splitlines()]
+    assert verdicts == [Verdict(1, 1, None, None, "WHITE_WON", 'Q')._asdict(),
+                        Verdict(4, 2, 2, 'illegal move a3a5', "UNFINISHED", None)._asdict()]
+    assert finished.stderr.startswith('2 games in ')
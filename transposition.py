@@ -0,0 +1,168 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  A fixed size transposition table for remembering results about positions, keyed by the 64-bit Zobrist
+#               hash from ChessVar.get_hash(). The whole table is allocated up front from a memory budget and never
+#               grows. It is split into buckets of two entries: the first entry keeps whichever result was searched to
+#               the greater depth, the second entry is always overwritten by the newest result that didn't make it into
+#               the first one.
+#
+#               Every entry is two 64-bit words, the packed data and the key XOR-ed with the data. A probe only trusts an
+#               entry if XOR-ing the two words gives back the key, so a half written entry is treated as a miss. This
+#               lets several processes share one table without locks.
+
+# flag values describing how a stored score relates to the real score of the position
+EXACT = 0
+LOWER_BOUND = 1  # the real score is at least the stored score
+UPPER_BOUND = 2  # the real score is at most the stored score
+
+NO_MOVE = 0xFFFF
+
+ENTRY_BYTES = 16  # two 64-bit words
+BUCKET_ENTRIES = 2
+BUCKET_BYTES = ENTRY_BYTES * BUCKET_ENTRIES
+
+_VALID = 1 << 26
+_SCORE_OFFSET = 1 << 31
+
+
+def pack_entry(depth, score, flag, move):
+    """
+    Packs the parts of an entry into one 64-bit word.
+
+    :parameter depth: the depth the score was searched to, from 0 to 255
+    :parameter score: the score, must fit in a signed 32-bit number
+    :parameter flag: EXACT, LOWER_BOUND or UPPER_BOUND
+    :parameter move: the best move as start * 64 + end, or NO_MOVE
+    :return: the packed word
+    """
+    return (score + _SCORE_OFFSET) << 32 | _VALID | flag << 24 | depth << 16 | move
+
+
+def unpack_entry(data):
+    """
+    :parameter data: a word made by pack_entry
+    :return: a (depth, score, flag, move) tuple
+    """
+    return data >> 16 & 0xFF, (data >> 32) - _SCORE_OFFSET, data >> 24 & 0x3, data & 0xFFFF
+
+
+class TranspositionTable:
+    """
+    A bounded hash table from Zobrist keys to (depth, score, flag, move) results.
+
+    hits:       probes that found the key
+    misses:     probes that didn't find the key
+    collisions: misses where the bucket was holding a different position with the same index
+    stores:     results written into the table
+    overwrites: stores that pushed out a different position
+    """
+    def __init__(self, megabytes=16, buffer=None):
+        """
+        :parameter megabytes: the memory budget for the table. The number of buckets is rounded down to a power of two.
+        :parameter buffer: optional writable buffer (EX: a bytearray or shared memory) to hold the table instead of a
+                           newly allocated one. Its size is used in place of megabytes.
+        """
+        if buffer is None:
+            buckets = max(1, int(megabytes * 1024 * 1024) // BUCKET_BYTES)
+        else:
+            buckets = max(1, len(buffer) // BUCKET_BYTES)
+        buckets = 1 << (buckets.bit_length() - 1)
+        if buffer is None:
+            buffer = bytearray(buckets * BUCKET_BYTES)
+        self._words = memoryview(buffer)[:buckets * BUCKET_BYTES].cast('Q')
+        self._mask = buckets - 1
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def __len__(self):
+        """
+        :return: the number of entries the table can hold
+        """
+        return (self._mask + 1) * BUCKET_ENTRIES
+
+    def _read(self, word):
+        """
+        :parameter word: the index of the entry's first word
+        :return: (key, data) for the entry, key is 0 and data is 0 for an empty entry
+        """
+        data = self._words[word]
+        return self._words[word + 1] ^ data, data
+
+    def probe(self, key):
+        """
+        Looks up a position.
+
+        :parameter key: the 64-bit Zobrist hash of the position
+        :return: a (depth, score, flag, move) tuple, or None if the position isn't stored
+        """
+        word = (key & self._mask) * 4
+        occupied = False
+        for slot in (word, word + 2):
+            stored_key, data = self._read(slot)
+            if data & _VALID:
+                if stored_key == key:
+                    self.hits += 1
+                    return unpack_entry(data)
+                occupied = True
+        self.misses += 1
+        if occupied:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, score, flag, move=NO_MOVE):
+        """
+        Saves a result. It goes into the depth-preferred entry of the bucket if that entry is empty, holds the same
+        position, or was searched less deeply; the result it replaces moves down to the always-replace entry. Otherwise
+        the result goes straight into the always-replace entry.
+
+        :parameter key: the 64-bit Zobrist hash of the position
+        :parameter depth: the depth the score was searched to, from 0 to 255
+        :parameter score: the score, must fit in a signed 32-bit number
+        :parameter flag: EXACT, LOWER_BOUND or UPPER_BOUND
+        :parameter move: the best move as start * 64 + end, or NO_MOVE
+        """
+        words = self._words
+        word = (key & self._mask) * 4
+        data = pack_entry(depth, score, flag, move)
+        first_key, first_data = self._read(word)
+        self.stores += 1
+
+        if not first_data & _VALID or first_key == key or depth >= first_data >> 16 & 0xFF:
+            if first_data & _VALID and first_key != key:
+                second_key, second_data = self._read(word + 2)
+                if second_data & _VALID and second_key != key:
+                    self.overwrites += 1
+                words[word + 2] = first_data
+                words[word + 3] = first_key ^ first_data
+            words[word] = data
+            words[word + 1] = key ^ data
+            return
+
+        second_key, second_data = self._read(word + 2)
+        if second_data & _VALID and second_key != key:
+            self.overwrites += 1
+        words[word + 2] = data
+        words[word + 3] = key ^ data
+
+    def clear(self):
+        """
+        Empties every entry and resets the counters.
+        """
+        self._words.cast('B')[:] = bytes(len(self._words) * 8)
+        self.hits = self.misses = self.collisions = self.stores = self.overwrites = 0
+
+    def stats(self):
+        """
+        :return: a dictionary of the counters plus the hit rate and "hashfull", the share of the first (up to) 1000
+                 entries that are in use, which estimates how full the whole table is without scanning all of it
+        """
+        probes = self.hits + self.misses
+        sample = min(len(self), 1000)
+        used = sum(1 for word in range(0, sample * 2, 2) if self._words[word] & _VALID)
+        return {'entries': len(self), 'hashfull': used / sample, 'hits': self.hits, 'misses': self.misses,
+                'collisions': self.collisions, 'stores': self.stores, 'overwrites': self.overwrites,
+                'hit_rate': self.hits / probes if probes else 0.0}
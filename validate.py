@@ -0,0 +1,186 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Checks files of recorded games against the ChessVar rules and works out each games result. Every line of
+#               the file is one game, written as moves like "e2e4 e7e5", "e2-e4 e7-e5" or "e2 e4 e7 e5". Move numbers
+#               like "1." are skipped, as are empty lines and lines starting with '#'.
+#
+#               The file is read a chunk of lines at a time and the chunks are checked across a pool of worker
+#               processes. Only a few chunks per worker are in flight at once and the verdicts are handed back in the
+#               order of the file as soon as they are ready, so memory use doesn't depend on the size of the file.
+#
+#               Run from the project folder with:
+#                   python validate.py GAMES.txt [--workers W] [--chunk-size N] [--out FILE]
+#                                      [--backend bitboard|compact|list]
+#               Use - instead of a file name to read from standard input.
+
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import json
+import os
+import sys
+import time
+
+from ChessVar import ChessVar, BACKENDS
+from bitboard import SQUARE_INDEX
+from selfplay import extinct_type
+
+Verdict = collections.namedtuple('Verdict', ['line', 'plies', 'first_illegal', 'reason', 'game_state', 'extinct'])
+Verdict.__doc__ = """
+The result of checking one game.
+
+line:          the line number of the game in the file, counting from 1
+plies:         how many moves the line holds
+first_illegal: the number of the first move that is unreadable or against the rules, counting from 1, or None if
+               every move is legal. The game is checked no further than that move.
+reason:        why that move was rejected, or None
+game_state:    get_game_state() after the last legal move
+extinct:       the name of the piece type that was wiped out (EX: 'Q'), or None
+"""
+
+
+def parse_moves(text):
+    """
+    :parameter text: one line of a game file
+    :return: (list of (start, end) square index moves, list of the text of each move). A move that can't be read is
+             None in the first list.
+    """
+    tokens = [token for token in text.replace('-', ' ').split() if not token.rstrip('.').isdigit()]
+    moves = []
+    names = []
+    pending = None
+    for token in tokens:
+        if token in SQUARE_INDEX:  # the move is split into its two squares
+            if pending is None:
+                pending = token
+                continue
+            token = pending + token
+        elif pending is not None:  # a lone square followed by something else
+            names.append(pending)
+            moves.append(None)
+        pending = None
+        names.append(token)
+        start = SQUARE_INDEX.get(token[:2])
+        end = SQUARE_INDEX.get(token[2:])
+        moves.append(None if start is None or end is None else (start, end))
+    if pending is not None:
+        names.append(pending)
+        moves.append(None)
+    return moves, names
+
+
+def validate_game(number, text, backend="bitboard"):
+    """
+    Replays one game from the starting position.
+
+    :parameter number: the line number of the game
+    :parameter text: the moves of the game, see parse_moves
+    :parameter backend: the board backend to replay with
+    :return: a Verdict
+    """
+    moves, names = parse_moves(text)
+    readable = moves.index(None) if None in moves else len(moves)
+    game = ChessVar(backend=backend)
+    stopped = game.apply_moves(moves[:readable])
+    if stopped is not None:
+        first_illegal, reason = stopped + 1, f'illegal move {names[stopped]}'
+    elif readable < len(moves):
+        first_illegal, reason = readable + 1, f'unreadable move {names[readable]}'
+    else:
+        first_illegal, reason = None, None
+    return Verdict(number, len(moves), first_illegal, reason, game.get_game_state(), extinct_type(game))
+
+
+def validate_chunk(lines, backend):
+    """
+    Checks a chunk of games inside a worker process.
+
+    :parameter lines: a list of (line number, text) pairs
+    :parameter backend: the board backend to replay with
+    :return: a list of Verdicts in the same order
+    """
+    return [validate_game(number, text, backend) for number, text in lines]
+
+
+def read_games(lines):
+    """
+    :parameter lines: an iterable of the lines of a game file
+    :return: a generator of (line number, text) for every line holding a game
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield number, line
+
+
+def validate_lines(lines, workers=None, chunk_size=256, backend="bitboard"):
+    """
+    Checks every game in lines across a pool of worker processes. lines is read lazily and at most two chunks per
+    worker are waiting at any time.
+
+    :parameter lines: an iterable of the lines of a game file, EX: an open file
+    :parameter workers: the number of worker processes, defaults to the number of CPUs
+    :parameter chunk_size: how many games each task checks
+    :parameter backend: the board backend to replay with
+    :return: a generator of Verdicts in the order of the games in lines
+    """
+    workers = workers or os.cpu_count() or 1
+    games = read_games(lines)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        while True:
+            chunk = list(itertools.islice(games, chunk_size))
+            if chunk:
+                pending.append(executor.submit(validate_chunk, chunk, backend))
+            if pending and (len(pending) >= workers * 2 or not chunk):
+                yield from pending.popleft().result()
+            elif not chunk:
+                return
+
+
+def validate_file(path, workers=None, chunk_size=256, backend="bitboard"):
+    """
+    Checks every game in a file, see validate_lines.
+
+    :parameter path: the game file
+    :return: a generator of Verdicts in the order of the file
+    """
+    with open(path) as file:
+        yield from validate_lines(file, workers, chunk_size, backend)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="check files of recorded games against the ChessVar rules")
+    parser.add_argument('games', help='file with one game per line, or - for standard input')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=256, help='games per task sent to a worker')
+    parser.add_argument('--backend', default='bitboard', choices=sorted(BACKENDS), help='board backend to use')
+    parser.add_argument('--out', default=None, help='file to write one JSON verdict per line to (default: stdout)')
+    args = parser.parse_args()
+
+    source = sys.stdin if args.games == '-' else open(args.games)
+    out = open(args.out, 'w') if args.out else sys.stdout
+    begin = time.perf_counter()
+    games = 0
+    illegal = 0
+    results = collections.Counter()
+    try:
+        for verdict in validate_lines(source, args.workers, args.chunk_size, args.backend):
+            out.write(json.dumps(verdict._asdict()) + '\n')
+            games += 1
+            illegal += verdict.first_illegal is not None
+            results[verdict.game_state] += 1
+    finally:
+        if args.out:
+            out.close()
+        if source is not sys.stdin:
+            source.close()
+    seconds = time.perf_counter() - begin
+    print(f'{games} games in {seconds:.2f}s ({games / seconds if seconds else 0:,.0f} games/s), {illegal} with an '
+          f'illegal move, results {dict(results)}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# Author: Hunter Shipman
+# GitHub username: HunterShipman
+# Date: 10/18/2026
+# Description:  Zobrist keys used to give every ChessVar position a 64-bit hash. A position is hashed by XOR-ing together
+#               one random key for each (piece name, square) pair on the board, one key for each square holding a pawn
+#               that hasn't moved yet, and one more key if it is black's turn. Because XOR undoes itself, a move only
+#               has to XOR in and out the keys of the squares it changes instead of rehashing the whole board.
+#
+#               The keys come from a fixed seed so the same position hashes the same way in every process and every
+#               run, which lets hashes be stored in files and shared between workers.
+
+import random
+
+ZOBRIST_SEED = 20231210
+
+_random = random.Random(ZOBRIST_SEED)
+
+# PIECE_KEYS[name][square], EX: PIECE_KEYS['p'][52] is XOR-ed in while a white pawn sits on e2
+PIECE_KEYS = {name: [_random.getrandbits(64) for _ in range(64)] for name in 'KQRBNPkqrbnp'}
+
+# UNMOVED_KEYS[square] is XOR-ed in while the pawn on that square hasn't moved yet
+UNMOVED_KEYS = [_random.getrandbits(64) for _ in range(64)]
+
+# XOR-ed in while it is black's turn
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+
+
+def position_hash(squares, turn, unmoved):
+    """
+    Hashes a position from scratch. ChessVar only uses this when a game is created, after that the hash is updated a
+    move at a time.
+
+    :parameter squares: a list of 64 piece names (or None)
+    :parameter turn: whose turn it is, "WHITE" or "BLACK"
+    :parameter unmoved: the bitboard of squares holding pawns that haven't moved yet
+    :return: the 64-bit Zobrist hash of the position
+    """
+    key = BLACK_TO_MOVE_KEY if turn == "BLACK" else 0
+    for square, name in enumerate(squares):
+        if name is not None:
+            key ^= PIECE_KEYS[name][square]
+        if unmoved >> square & 1:
+            key ^= UNMOVED_KEYS[square]
+    return key